@@ -1,73 +1,253 @@
-import json
+import collections
+import heapq
+import os
+import sys
 import time
 import threading
 from datetime import datetime
-import pygame
 
-CONFIG_PATH = "config/scheduler.json"
-SOUND_PATH = "sounds/alarm.mp3"
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from alarms import scheduler
+from alarms.alarm_sound import AlarmSound
+from alarms.fired_log import FiredLog
+from alarms.recurrence import describe
+from alarms.store import next_fire_epoch
+from telemetry.stats import percentile_sorted
+
+# Longest sleep between refresh() checks for edits made by another process
+# (an mtime stat / PRAGMA, no read) when no alarm is due sooner. In-process
+# edits through the store wake the runner at once.
+FILE_CHECK_INTERVAL = 5.0
+
+# Alarms loaded into the heap at a time; the rest are fetched once the
+# heap runs past the last loaded deadline.
+HEAP_WINDOW = 256
+
+# While ringing, how often to check whether a safety message cut the alarm
+# sound off (it is re-queued once the message is done).
+RINGING_CHECK_INTERVAL = 1.0
+
 
 class AlarmRunner(threading.Thread):
-    def __init__(self):
+    """
+    Fires alarms from a min-heap of (next fire time, alarm id).
+
+    The heap is rebuilt only when the store reports a change; between
+    alarms the thread sleeps until the earliest deadline (or notify()), so
+    idle cost does not depend on how many alarms exist.
+
+    Deadlines are wall-clock times (alarms are), but the sleep runs on the
+    monotonic clock and every wake-up compares wall - monotonic with the
+    previous offset, so an NTP step is seen as a clock change:
+    - late alarms (stall, suspend, clock stepped forward) still ring if
+      at most ALARM_CATCHUP_WINDOW late, otherwise they count as missed;
+    - the FiredLog stops an occurrence ringing twice (clock stepped back,
+      restart in the same minute);
+    - everything between the last check and now is handled exactly once.
+    """
+
+    def __init__(self, store=None, speech=None, fired_log=None):
         super().__init__(daemon=True)
         self.running = True
-        self.last_triggered = {}
+        self.store = store if store is not None else scheduler.get_store()
+        self.fired_log = fired_log if fired_log is not None else FiredLog()
         self.alarm_playing = False
-        
-        # Initialize pygame mixer for sound
-        pygame.mixer.init()
-        try:
-            pygame.mixer.music.load(SOUND_PATH)
-        except pygame.error:
-            print(f"⚠️ Audio file '{SOUND_PATH}' not found. Sound will not play.")
+        self.ringing = None     # id of the alarm that is ringing
+        self._ringing_since = None
+
+        self._alarms = {}
+        self._heap = []
+        self._horizon = None   # last deadline loaded when the heap was truncated
+        self._dirty = True
+        self._wake = threading.Event()
+        self.store.subscribe(self._on_store_change)
+
+        # Alarms up to `_checked` (wall) are handled; after a restart, catch
+        # up on what fell due while we were down, within the window (on the
+        # very first run there is nothing to catch up on)
+        now = time.time()
+        checked_at = self.fired_log.checked_at
+        self._checked = now if checked_at is None else \
+            max(now - settings.ALARM_CATCHUP_WINDOW, min(checked_at, now))
+        self._offset = now - time.monotonic()
+
+        # Firing accuracy: ms between the scheduled time and the ring
+        self.jitter = collections.deque(maxlen=500)
+        self.counts = {"on_time": 0, "late": 0, "missed": 0, "clock_jumps": 0}
+
+        # Decode the sound now so ringing only has to queue PCM
+        self.sound = AlarmSound(speech=speech)
+        self.sound.load()
 
     def run(self):
         print("⏰ Alarm monitoring thread started")
         while self.running:
-            self.check_alarms()
-            time.sleep(1)
+            # One bad alarm must not stop the thread (and every other alarm)
+            try:
+                self.check_alarms()
+                timeout = self._sleep_time()
+            except Exception as e:
+                print(f"❌ Alarm check failed: {e}")
+                self._dirty = True
+                timeout = FILE_CHECK_INTERVAL
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def notify(self):
+        """Wake the runner now and reschedule."""
+        self._dirty = True
+        self._wake.set()
 
     def check_alarms(self):
-        try:
-            with open(CONFIG_PATH, "r") as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            return
+        """Rebuild the heap if the alarms changed, then fire everything due."""
+        self._check_clock()
+        self.store.refresh()
+        if self._dirty or (self._horizon is not None
+                           and (not self._heap or self._heap[0][0] > self._horizon)):
+            self._rebuild()
+        self._fire_due()
+        if self.alarm_playing:
+            if time.monotonic() - self._ringing_since >= settings.ALARM_MAX_RING:
+                print(f"⏱️ Alarm {self.ringing} unanswered for {settings.ALARM_MAX_RING:.0f} s")
+                self.stop_alarm()
+            elif self.sound.interrupted:
+                self.sound.play()
+
+    def next_deadline(self):
+        """Epoch seconds of the next alarm, or None."""
+        return self._heap[0][0] if self._heap else None
+
+    # =========================
+    # SCHEDULE
+    # =========================
+    def _on_store_change(self, store, changed):
+        self.notify()
 
-        now = datetime.now().strftime("%H:%M")
+    def _check_clock(self):
+        """Notice wall-clock steps (NTP sync, manual change) and reschedule."""
+        offset = time.time() - time.monotonic()
+        jump = offset - self._offset
+        self._offset = offset
+        if abs(jump) > settings.ALARM_CLOCK_JUMP:
+            self.counts["clock_jumps"] += 1
+            print(f"🕰️ Wall clock stepped {jump:+.1f} s - rescheduling alarms")
+            self._dirty = True
 
-        for alarm_id, alarm in data["alarms"].items():
-            if not alarm["enabled"]:
-                continue
+    def _rebuild(self):
+        self._dirty = False
+        upcoming = self.store.upcoming(self._checked, limit=HEAP_WINDOW)
+        self._alarms = {alarm_id: alarm for _, alarm_id, alarm in upcoming}
+        heap = []
+        for when, alarm_id, alarm in upcoming:
+            if self.fired_log.already_fired(alarm_id, when):
+                when = next_fire_epoch(alarm, datetime.fromtimestamp(self.fired_log.last(alarm_id)))
+                if when is None:
+                    continue
+            heap.append((when, alarm_id))
+        heapq.heapify(heap)
+        self._heap = heap
+        self._horizon = upcoming[-1][0] if len(upcoming) == HEAP_WINDOW else None
+        if self._horizon is None:
+            self.fired_log.prune(self.store.all())
 
-            if alarm["time"] == now:
-                # Prevent multiple triggers per minute
-                if self.last_triggered.get(alarm_id) != now:
-                    print(f"🚨 ALARM TRIGGERED: {alarm_id} at {now}")
-                    self.play_alarm()
-                    self.last_triggered[alarm_id] = now
+    def _fire_due(self):
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            triggered = time.monotonic()
+            when, alarm_id = heapq.heappop(self._heap)
+            alarm = self._alarms[alarm_id]
+            if not self.fired_log.already_fired(alarm_id, when):
+                self._fire(alarm_id, alarm, when, now, triggered)
+            # From now, not from `when`: a stalled every-N reminder rings once, not in a burst
+            following = next_fire_epoch(alarm, datetime.fromtimestamp(max(when, now)))
+            if following is not None:
+                heapq.heappush(self._heap, (following, alarm_id))
+        # Never move back: after the clock is set back, the hour replayed
+        # was already handled
+        self._checked = max(self._checked, now)
 
-    def play_alarm(self):
+    def _fire(self, alarm_id, alarm, when, now, triggered):
+        late = now - when
+        if late > settings.ALARM_CATCHUP_WINDOW:
+            self.counts["missed"] += 1
+            print(f"⏭️ Missed alarm {alarm_id} ({describe(alarm)}), {late / 60:.0f} min late")
+        else:
+            self.counts["on_time" if late < 1.0 else "late"] += 1
+            self.jitter.append(late * 1000.0)
+            suffix = f" ({late:.0f} s late)" if late >= 1.0 else ""
+            print(f"🚨 ALARM TRIGGERED: {alarm_id} ({describe(alarm)}){suffix}")
+            self.play_alarm(triggered)
+            self.ringing = alarm_id
+        self.fired_log.record(alarm_id, when, checked_at=now)
+
+    def _sleep_time(self):
+        timeout = RINGING_CHECK_INTERVAL if self.alarm_playing else FILE_CHECK_INTERVAL
+        if self._heap:
+            # Event.wait() sleeps on the monotonic clock; the deadline is
+            # re-derived from the wall clock on every wake-up
+            timeout = min(timeout, max(0.0, self._heap[0][0] - time.time()))
+        return timeout
+
+    def jitter_stats(self):
+        """Firing accuracy in ms (scheduled -> rung) plus on-time/late/missed counts."""
+        stats = dict(self.counts)
+        if self.jitter:
+            ordered = sorted(self.jitter)
+            stats.update({
+                "n": len(ordered),
+                "p50_ms": round(percentile_sorted(ordered, 50), 1),
+                "p99_ms": round(percentile_sorted(ordered, 99), 1),
+                "max_ms": round(ordered[-1], 1)
+            })
+        return stats
+
+    # =========================
+    # SOUND
+    # =========================
+    def play_alarm(self, triggered=None):
         """Play the alarm sound in infinite loop"""
         try:
-            if not self.alarm_playing:
-                pygame.mixer.music.play(loops=-1)  # Infinite loop
+            if not self.alarm_playing and self.sound.play(triggered):
                 self.alarm_playing = True
-                print("🔊 Alarm sound playing (infinite loop)...")
-                print("   Type 'stop alarm' to stop the sound")
+                self._ringing_since = time.monotonic()
+                print(f"🔊 Alarm sound playing (up to {settings.ALARM_MAX_RING:.0f} s)...")
+                print("   Say 'stop alarm' or 'snooze' to stop the sound")
         except Exception as e:
             print(f"❌ Error playing sound: {e}")
 
     def stop_alarm(self):
-        """Stop the alarm sound"""
+        """Stop the alarm sound. Returns False if no alarm was playing."""
         if self.alarm_playing:
-            pygame.mixer.music.stop()
+            self.sound.stop()
             self.alarm_playing = False
-            print("🔇 Alarm stopped")
-        else:
-            print("ℹ️ No alarm is currently playing")
+            self.ringing = None
+            stats = self.sound.latency_stats()
+            if stats:
+                detail = f" (trigger-to-sound: {stats['last']} ms)"
+            elif self.sound.estimated_latency is not None:
+                detail = f" (trigger-to-sound: ~{self.sound.estimated_latency:.1f} ms, estimated)"
+            else:
+                detail = ""
+            print("🔇 Alarm stopped" + detail)
+            return True
+        print("ℹ️ No alarm is currently playing")
+        return False
+
+    def snooze_alarm(self, minutes=None):
+        """Stop the ringing alarm and ring it again in `minutes`. False if none rings."""
+        alarm_id = self.ringing
+        if not self.stop_alarm() or alarm_id is None:
+            return False
+        return scheduler.snooze_alarm(alarm_id, minutes)
 
     def stop(self):
         self.running = False
-        pygame.mixer.music.stop()
-        print("⏹️ Alarm monitoring thread stopped")
+        self.store.unsubscribe(self._on_store_change)
+        self._wake.set()
+        self.sound.stop()
+        self.fired_log.save(checked_at=self._checked)
+        print(f"⏹️ Alarm monitoring thread stopped ({self.jitter_stats()})")
@@ -0,0 +1,121 @@
+"""
+alarm_sound.py - The alarm sound, decoded once and ready to play.
+
+load() decodes sounds/alarm.mp3 to PCM a single time at startup, with the
+pygame mixer pre-initialized to a small buffer (ALARM_MIXER_BUFFER frames)
+instead of the default, so nothing is decoded or buffered at trigger time.
+
+With a SpeechOutput the PCM is queued as an "alarm" clip: the speaker
+thread stays the only user of the sound card, and the mixer is shut down
+again right after decoding. Without one (the runner on its own) the
+decoded pygame Sound is played directly.
+
+Trigger-to-sound latency (the alarm deciding to ring -> first audio chunk
+handed to the sound card) is kept in `latencies` (ms). It is only
+measured through the speech output, whose speaker reports the first
+chunk it writes. pygame does not say when the mixer starts output, so
+direct playback only records `estimated_latency` (time to play() plus one
+mixer buffer), and that estimate never goes into latency_stats().
+"""
+
+import collections
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from audio.speaker import Clip
+from telemetry.stats import percentile_sorted
+
+SOUND_PATH = os.path.join(project_root, "sounds", "alarm.mp3")
+
+
+class AlarmSound:
+    """Pre-decoded alarm sound, played through `speech` when given."""
+
+    def __init__(self, path=SOUND_PATH, speech=None):
+        self.path = path
+        self.speech = speech
+        self.clip = None
+        self.latencies = collections.deque(maxlen=100)
+        self.estimated_latency = None  # ms, direct playback only (not measured)
+        self._sound = None      # pygame Sound (direct playback only)
+        self._handle = None     # SpeechHandle of the ringing alarm
+        self._pygame = None
+
+    def load(self):
+        """Decode the sound file. False (and silent alarms) if it cannot be."""
+        started = time.monotonic()
+        try:
+            import pygame
+            pygame.mixer.pre_init(frequency=settings.ALARM_MIXER_RATE, size=-16,
+                                  channels=2, buffer=settings.ALARM_MIXER_BUFFER)
+            pygame.mixer.init()
+            sound = pygame.mixer.Sound(self.path)
+            rate, size, channels = pygame.mixer.get_init()
+            self.clip = Clip("alarm", sound.get_raw(), rate, channels, abs(size) // 8)
+        except Exception as e:
+            print(f"⚠️ Alarm sound '{self.path}' unavailable ({e}). Sound will not play.")
+            return False
+
+        if self.speech is not None:
+            pygame.mixer.quit()  # the speaker owns the sound card
+        else:
+            self._pygame = pygame
+            self._sound = sound
+        print(f"🔔 Alarm sound decoded ({self.clip.duration:.1f}s, "
+              f"{len(self.clip.pcm) // 1024} KB) in {(time.monotonic() - started) * 1000:.0f} ms")
+        return True
+
+    @property
+    def playing(self):
+        if self._handle is not None:
+            return not self._handle.done
+        return self._sound is not None and self._pygame.mixer.get_busy()
+
+    @property
+    def interrupted(self):
+        """True if a safety message cut the ringing alarm off."""
+        return self._handle is not None and self._handle.state == "preempted"
+
+    def play(self, triggered=None):
+        """Start looping the sound; `triggered` is the monotonic trigger time."""
+        if self.clip is None:
+            return False
+        triggered = time.monotonic() if triggered is None else triggered
+
+        def on_audio(at):
+            self.latencies.append((at - triggered) * 1000.0)
+
+        if self.speech is not None:
+            self._handle = self.speech.play(self.clip, priority="alarm", key="alarm",
+                                            on_audio=on_audio, loop=True)
+        else:
+            self._sound.play(loops=-1)
+            # The mixer starts output within one buffer of play(); an estimate
+            buffered = settings.ALARM_MIXER_BUFFER / float(self.clip.rate)
+            self.estimated_latency = (time.monotonic() + buffered - triggered) * 1000.0
+        return True
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._sound is not None:
+            self._sound.stop()
+
+    def latency_stats(self):
+        """{"n", "last", "p50", "max"} of measured trigger-to-sound latency in ms, or None."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return {
+            "n": len(ordered),
+            "last": round(self.latencies[-1], 1),
+            "p50": round(percentile_sorted(ordered, 50), 1),
+            "max": round(ordered[-1], 1)
+        }
@@ -0,0 +1,80 @@
+"""
+fired_log.py - Which alarm occurrences already rang, kept across restarts.
+
+    {"checked_at": 1792400000.0,            # alarms up to here were handled
+     "fired": {"wake_up": 1792393200.0}}    # last occurrence rung per alarm
+
+The runner consults it before ringing, so an occurrence never rings twice:
+not after the wall clock is set back (NTP), and not after a restart in
+the same minute. `checked_at` lets a restart catch up on alarms that fell
+due while the process was down (within ALARM_CATCHUP_WINDOW).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+
+class FiredLog:
+    def __init__(self, path=None):
+        path = path or settings.ALARM_FIRED_LOG_PATH
+        if not os.path.isabs(path):
+            path = os.path.join(project_root, path)
+        self.path = path
+        self.fired = {}
+        self.checked_at = None
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        self.fired = {k: float(v) for k, v in saved.get("fired", {}).items()}
+        self.checked_at = saved.get("checked_at")
+        return True
+
+    def already_fired(self, alarm_id, when):
+        """Was the occurrence at `when` (epoch), or a later one, already rung?"""
+        last = self.fired.get(alarm_id)
+        return last is not None and when <= last
+
+    def last(self, alarm_id):
+        return self.fired.get(alarm_id)
+
+    def record(self, alarm_id, when, checked_at=None):
+        """Remember that the occurrence at `when` rang, and persist at once."""
+        self.fired[alarm_id] = max(when, self.fired.get(alarm_id, when))
+        self.save(checked_at)
+
+    def prune(self, alarm_ids):
+        """Forget alarms that no longer exist."""
+        for alarm_id in [k for k in self.fired if k not in alarm_ids]:
+            del self.fired[alarm_id]
+
+    def save(self, checked_at=None):
+        """Write-then-rename, like the alarm store."""
+        if checked_at is not None:
+            self.checked_at = checked_at
+        data = {"checked_at": self.checked_at, "fired": self.fired, "saved_at": time.time()}
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except OSError as e:
+                print(f"❌ Could not save alarm fired-log: {e}")
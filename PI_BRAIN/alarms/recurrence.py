@@ -0,0 +1,291 @@
+"""
+recurrence.py - When an alarm rings next.
+
+An alarm is a dict in the store. Which key is present picks the rule:
+
+    {"time": "07:30"}                                 daily (the original format)
+    {"time": "07:30", "days": ["mon", "fri"]}         on some weekdays only
+    {"at": "2026-11-02T09:00"}                        once
+    {"every": 25, "start": "2026-10-19T09:00"}        every N minutes from start
+    {"cron": "*/15 9-17 * * 1-5"}                     minute hour dom month dow
+    {"rrule": "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;BYHOUR=8;BYMINUTE=0",
+     "start": "2026-10-19T08:00"}                     RRULE subset (see RRule)
+
+plus, on any of them:
+
+    "snooze_until": "2026-10-19T07:39"                ring (also) at that time
+    "enabled": false                                  never ring
+
+Every rule answers next_after(dt) -> the first datetime strictly after dt
+(or None) by arithmetic on the rule, not by stepping minute by minute, so
+rescheduling thousands of reminders stays cheap. Times are local and naive,
+like the rest of the alarm code.
+"""
+
+import bisect
+import functools
+from datetime import date, datetime, time, timedelta
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+RRULE_DAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
+def parse_time(text):
+    """"HH:MM" -> datetime.time (ValueError if malformed)."""
+    hour, minute = (int(part) for part in text.split(":"))
+    return time(hour, minute)
+
+
+def parse_datetime(value):
+    """ISO string or epoch seconds -> naive local datetime."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        # e.g. RFC 5545 UNTIL=20261231T235959Z; everything here is naive local
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _next_minute(after):
+    """First whole minute strictly after `after`."""
+    return after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+
+class Daily:
+    """At `at` every day, or only on `weekdays` (0 = Monday)."""
+
+    def __init__(self, at, weekdays=None):
+        self.at = at
+        self.weekdays = frozenset(weekdays) if weekdays else None
+
+    def next_after(self, after):
+        day = after.date()
+        for offset in range(8):
+            candidate = datetime.combine(day + timedelta(days=offset), self.at)
+            if candidate > after and (self.weekdays is None
+                                      or candidate.weekday() in self.weekdays):
+                return candidate
+        return None
+
+
+class OneShot:
+    def __init__(self, when):
+        self.when = when
+
+    def next_after(self, after):
+        return self.when if self.when > after else None
+
+
+class Every:
+    """Every `minutes` minutes counted from `start`."""
+
+    def __init__(self, minutes, start):
+        if minutes <= 0:
+            raise ValueError("every: interval must be positive")
+        self.period = timedelta(minutes=minutes)
+        self.start = start
+
+    def next_after(self, after):
+        if after < self.start:
+            return self.start
+        periods = (after - self.start) // self.period + 1
+        return self.start + periods * self.period
+
+
+class Cron:
+    """
+    Five cron fields "minute hour day-of-month month day-of-week" with *,
+    lists, ranges and /steps (Sunday is 0 or 7). As in cron, when both day
+    fields are restricted a day matching either one counts.
+    """
+
+    FIELDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expr):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron: expected 5 fields, got '{expr}'")
+        values = [self._field(part, lo, hi) for part, (lo, hi) in zip(parts, self.FIELDS)]
+        self.minutes, self.hours, days, months, dows = values
+        self.days, self.months = frozenset(days), frozenset(months)
+        # cron weekday (0 = Sunday) -> Python weekday (0 = Monday)
+        self.weekdays = frozenset((d - 1) % 7 for d in dows)
+        self.day_any = parts[2] == "*"
+        self.dow_any = parts[4] == "*"
+
+    @staticmethod
+    def _field(text, lo, hi):
+        values = set()
+        for item in text.split(","):
+            span, _, step = item.partition("/")
+            step = int(step) if step else 1
+            if span == "*":
+                start, end = lo, hi
+            elif "-" in span:
+                start, end = (int(v) for v in span.split("-"))
+            else:
+                start = int(span)
+                end = hi if step > 1 else start
+            if not (lo <= start <= end <= hi) or step < 1:
+                raise ValueError(f"cron: '{item}' out of range {lo}-{hi}")
+            values.update(range(start, end + 1, step))
+        return sorted(values)
+
+    def _day_matches(self, day):
+        in_month = day.day in self.days
+        in_week = day.weekday() in self.weekdays
+        if self.day_any and self.dow_any:
+            return True
+        if self.day_any:
+            return in_week
+        if self.dow_any:
+            return in_month
+        return in_month or in_week
+
+    def _first_time(self, not_before):
+        """Earliest (hour, minute) on a matching day at or after `not_before`."""
+        h = bisect.bisect_left(self.hours, not_before.hour)
+        if h < len(self.hours) and self.hours[h] == not_before.hour:
+            m = bisect.bisect_left(self.minutes, not_before.minute)
+            if m < len(self.minutes):
+                return time(self.hours[h], self.minutes[m])
+            h += 1
+        if h < len(self.hours):
+            return time(self.hours[h], self.minutes[0])
+        return None
+
+    def next_after(self, after):
+        start = _next_minute(after)
+        day = start.date()
+        not_before = start.time()
+        # Whole months are skipped at once; 8 years covers "Feb 29 on a Monday"
+        limit = day + timedelta(days=366 * 8)
+        while day <= limit:
+            if day.month not in self.months:
+                day = date(day.year + day.month // 12, day.month % 12 + 1, 1)
+                not_before = time(0, 0)
+                continue
+            if self._day_matches(day):
+                at = self._first_time(not_before)
+                if at is not None:
+                    return datetime.combine(day, at)
+            day += timedelta(days=1)
+            not_before = time(0, 0)
+        return None
+
+
+class RRule:
+    """
+    RFC 5545 subset: FREQ=MINUTELY|HOURLY|DAILY|WEEKLY, INTERVAL, UNTIL,
+    and for DAILY/WEEKLY also BYDAY, BYHOUR and BYMINUTE. Periods are
+    counted from `start` (DTSTART); hour/minute default to start's.
+    """
+
+    def __init__(self, text, start):
+        parts = dict(item.split("=", 1) for item in text.upper().split(";") if item)
+        self.freq = parts.get("FREQ")
+        if self.freq not in ("MINUTELY", "HOURLY", "DAILY", "WEEKLY"):
+            raise ValueError(f"rrule: unsupported FREQ '{self.freq}'")
+        self.interval = int(parts.get("INTERVAL", 1))
+        if self.interval < 1:
+            raise ValueError("rrule: INTERVAL must be positive")
+        self.start = start.replace(second=0, microsecond=0)
+        self.until = parse_datetime(parts["UNTIL"]) if "UNTIL" in parts else None
+
+        if self.freq in ("MINUTELY", "HOURLY"):
+            minutes = self.interval * (60 if self.freq == "HOURLY" else 1)
+            self._every = Every(minutes, self.start)
+            return
+        self.weekdays = frozenset(RRULE_DAYS.index(d) for d in parts["BYDAY"].split(",")) \
+            if "BYDAY" in parts else None
+        if self.freq == "WEEKLY" and self.weekdays is None:
+            self.weekdays = frozenset([self.start.weekday()])
+        hours = [int(h) for h in parts["BYHOUR"].split(",")] if "BYHOUR" in parts else [self.start.hour]
+        minutes = [int(m) for m in parts["BYMINUTE"].split(",")] if "BYMINUTE" in parts else [self.start.minute]
+        self.times = sorted(time(h, m) for h in hours for m in minutes)
+
+    def _in_period(self, day):
+        """Does `day` fall in one of the INTERVAL-spaced days/weeks?"""
+        if self.freq == "DAILY":
+            return (day - self.start.date()).days % self.interval == 0
+        week = (day - timedelta(days=day.weekday())
+                - (self.start.date() - timedelta(days=self.start.weekday()))).days // 7
+        return week % self.interval == 0
+
+    def _next(self, after):
+        if self.freq in ("MINUTELY", "HOURLY"):
+            return self._every.next_after(after)
+        after = max(after, self.start - timedelta(microseconds=1))
+        day = after.date()
+        # A day is in play only if its period and weekday match; both repeat
+        # within 7 * INTERVAL days, so this loop is bounded.
+        for _ in range(7 * self.interval + 1):
+            if self._in_period(day) and (self.weekdays is None or day.weekday() in self.weekdays):
+                i = 0
+                if day == after.date():
+                    i = bisect.bisect_right(self.times, after.time())
+                if i < len(self.times):
+                    return datetime.combine(day, self.times[i])
+            day += timedelta(days=1)
+        return None
+
+    def next_after(self, after):
+        when = self._next(after)
+        if when is not None and self.until is not None and when > self.until:
+            return None
+        return when
+
+
+@functools.lru_cache(maxsize=4096)
+def _rule(kind, spec, days, start):
+    start = parse_datetime(start) if start is not None else None
+    if kind == "time":
+        weekdays = [WEEKDAYS.index(d[:3].lower()) for d in days] if days else None
+        return Daily(parse_time(spec), weekdays)
+    if kind == "at":
+        return OneShot(parse_datetime(spec))
+    if kind == "every":
+        return Every(float(spec), start or datetime.now().replace(second=0, microsecond=0))
+    if kind == "cron":
+        return Cron(spec)
+    if kind == "rrule":
+        return RRule(spec, start or datetime.now().replace(second=0, microsecond=0))
+    raise ValueError(f"Unknown recurrence '{kind}'")
+
+
+def parse_rule(alarm):
+    """The rule object for an alarm dict (ValueError if it has none or is malformed)."""
+    for kind in ("rrule", "cron", "every", "at", "time"):
+        if kind in alarm:
+            days = tuple(alarm.get("days") or ()) if kind == "time" else ()
+            try:
+                return _rule(kind, alarm[kind], days, alarm.get("start"))
+            except (KeyError, IndexError, TypeError, AttributeError) as e:
+                raise ValueError(f"Bad {kind} rule {alarm[kind]!r}: {e}") from None
+    raise ValueError("Alarm has no time, at, every, cron or rrule")
+
+
+def next_occurrence(alarm, after):
+    """Next datetime strictly after `after` the alarm rings, or None."""
+    if not alarm.get("enabled", True):
+        return None
+    when = parse_rule(alarm).next_after(after)
+    snooze = alarm.get("snooze_until")
+    if snooze is not None:
+        snooze = parse_datetime(snooze)
+        if snooze > after and (when is None or snooze < when):
+            when = snooze
+    return when
+
+
+def describe(alarm):
+    """Short human-readable form for log lines."""
+    for kind in ("rrule", "cron", "every", "at", "time"):
+        if kind in alarm:
+            if kind == "every":
+                return f"every {alarm[kind]} min"
+            if kind == "time" and alarm.get("days"):
+                return f"{alarm[kind]} on {','.join(alarm['days'])}"
+            return str(alarm[kind])
+    return "?"
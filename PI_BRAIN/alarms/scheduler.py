@@ -1,50 +1,127 @@
-import json
 import os
+import sys
+import threading
+from datetime import datetime, timedelta
 
-CONFIG_PATH = "config/scheduler.json"
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-# Create the file if it doesn't exist
-if not os.path.exists("config"):
-    os.makedirs("config")
+from config import settings
+from alarms.recurrence import describe, next_occurrence, parse_rule
+from alarms.store import open_store
+
+# Keys that pick the rule (see alarms/recurrence.py); an alarm has one
+RULE_KEYS = ("rrule", "cron", "every", "at", "time")
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The shared alarm store (opened on first use, backend from settings)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = open_store(settings.ALARM_STORE_BACKEND, settings.ALARM_STORE_PATH)
+        return _store
+
+
+def transaction():
+    """Batch several add/modify/delete calls into one write."""
+    return get_store().transaction()
 
-if not os.path.exists(CONFIG_PATH):
-    with open(CONFIG_PATH, "w") as f:
-        json.dump({"alarms": {}}, f, indent=4)
 
 def load_data():
-    with open(CONFIG_PATH, "r") as f:
-        return json.load(f)
+    return {"alarms": get_store().all()}
 
 def save_data(data):
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(data, f, indent=4)
+    get_store().replace_all(data.get("alarms", {}))
 
-def add_alarm(alarm_id, time_str):
-    data = load_data()
-    data["alarms"][alarm_id] = {
+def add_alarm(alarm_id, time_str, days=None):
+    alarm = {
         "time": time_str,   # format "HH:MM"
         "enabled": True
     }
-    save_data(data)
-    print(f"✅ Alarm '{alarm_id}' added at {time_str}")
+    if days:
+        alarm["days"] = list(days)   # e.g. ["mon", "tue", "wed", "thu", "fri"]
+    add_reminder(alarm_id, **alarm)
+
+def add_reminder(alarm_id, **rule):
+    """
+    Any rule from alarms/recurrence.py, e.g.
+    add_reminder("focus", every=25) or add_reminder("bins", cron="0 19 * * 2").
+    """
+    alarm = {"enabled": True, **rule}
+    _default_start(alarm)
+    error = _rule_error(alarm)
+    if error:
+        print(f"❌ Alarm '{alarm_id}' not added: {error}")
+        return False
+    get_store().put(alarm_id, alarm)
+    print(f"✅ Alarm '{alarm_id}' added ({describe(alarm)})")
+    return True
+
+def _default_start(alarm):
+    if ("every" in alarm or "rrule" in alarm) and "start" not in alarm:
+        alarm["start"] = datetime.now().replace(second=0, microsecond=0).isoformat()
+
+def _rule_error(alarm):
+    """Why the alarm cannot be scheduled, or None."""
+    kinds = [kind for kind in RULE_KEYS if kind in alarm]
+    if len(kinds) > 1:
+        return f"more than one rule ({', '.join(kinds)})"
+    try:
+        # Build the rule and compute one occurrence, so errors that only
+        # show when evaluating (e.g. bad UNTIL) are caught here
+        parse_rule(alarm)
+        next_occurrence(alarm, datetime.now())
+    except (ValueError, TypeError) as e:
+        return str(e)
+    return None
 
 def delete_alarm(alarm_id):
-    data = load_data()
-    if alarm_id in data["alarms"]:
-        del data["alarms"][alarm_id]
-        save_data(data)
+    if get_store().delete(alarm_id):
         print(f"🗑️ Alarm '{alarm_id}' deleted")
     else:
         print(f"❌ Alarm '{alarm_id}' not found")
 
-def modify_alarm(alarm_id, time=None, enabled=None):
-    data = load_data()
-    if alarm_id in data["alarms"]:
-        if time is not None:
-            data["alarms"][alarm_id]["time"] = time
-        if enabled is not None:
-            data["alarms"][alarm_id]["enabled"] = enabled
-        save_data(data)
-        print(f"✏️ Alarm '{alarm_id}' modified")
-    else:
-        print(f"❌ Alarm '{alarm_id}' not found")
+def modify_alarm(alarm_id, time=None, enabled=None, **rule):
+    """
+    Change fields of an alarm. A new rule (time=, at=, every=, cron=,
+    rrule=) replaces the old one, with its days/start unless given again.
+    The merged alarm is checked like add_reminder(); False if rejected.
+    """
+    fields = dict(rule)
+    if time is not None:
+        fields["time"] = time
+    if enabled is not None:
+        fields["enabled"] = enabled
+    store = get_store()
+    with store.transaction():
+        alarm = store.get(alarm_id)
+        if alarm is None:
+            print(f"❌ Alarm '{alarm_id}' not found")
+            return False
+        if any(kind in fields for kind in RULE_KEYS):
+            for key in RULE_KEYS + ("days", "start"):
+                alarm.pop(key, None)
+        alarm.update(fields)
+        _default_start(alarm)
+        error = _rule_error(alarm)
+        if error:
+            print(f"❌ Alarm '{alarm_id}' not modified: {error}")
+            return False
+        store.put(alarm_id, alarm)
+    print(f"✏️ Alarm '{alarm_id}' modified ({describe(alarm)})")
+    return True
+
+def snooze_alarm(alarm_id, minutes=None):
+    """Ring `alarm_id` again in `minutes` (settings.ALARM_SNOOZE_MINUTES by default)."""
+    minutes = minutes if minutes is not None else settings.ALARM_SNOOZE_MINUTES
+    until = (datetime.now() + timedelta(minutes=minutes)).replace(microsecond=0)
+    if get_store().update(alarm_id, snooze_until=until.isoformat()):
+        print(f"😴 Alarm '{alarm_id}' snoozed until {until:%H:%M}")
+        return True
+    print(f"❌ Alarm '{alarm_id}' not found")
+    return False
@@ -0,0 +1,329 @@
+"""
+store.py - Alarm storage with an in-memory cache and atomic commits.
+
+Two backends behind the same interface:
+
+    JsonAlarmStore    config/scheduler.json, the whole map rewritten with
+                      write-then-rename (a crash leaves the old file intact)
+    SQLiteAlarmStore  one row per alarm, indexed by next fire time, for
+                      large reminder sets
+
+Reads come from the cache. Writes go to the cache and are committed at
+once, or at the end of the outermost transaction():
+
+    with store.transaction():
+        for i in range(100):
+            store.put(f"pill_{i}", {"time": "08:00", "enabled": True})
+    # -> one file write / one SQLite transaction
+
+Listeners registered with subscribe() are called after every commit with
+the set of changed alarm ids; AlarmRunner uses this to reschedule at once.
+refresh() picks up edits made by another process.
+"""
+
+import contextlib
+import copy
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from alarms.recurrence import next_occurrence
+
+
+def next_fire_epoch(alarm, after):
+    """next_occurrence() as epoch seconds; None if it never rings again or is invalid."""
+    try:
+        when = next_occurrence(alarm, after)
+    except (ValueError, TypeError, KeyError, OverflowError):
+        return None
+    return when.timestamp() if when is not None else None
+
+
+def _resolve(path):
+    return path if os.path.isabs(path) else os.path.join(project_root, path)
+
+
+class AlarmStore:
+    """Cache, transactions and change listeners; backends implement the I/O."""
+
+    def __init__(self):
+        self._alarms = {}
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._depth = 0
+        self._pending = set()
+        self._snapshot = None
+
+    # =========================
+    # READS
+    # =========================
+    def get(self, alarm_id):
+        with self._lock:
+            alarm = self._alarms.get(alarm_id)
+            return dict(alarm) if alarm is not None else None
+
+    def all(self):
+        """Copy of {alarm_id: alarm}."""
+        with self._lock:
+            return copy.deepcopy(self._alarms)
+
+    def __contains__(self, alarm_id):
+        return alarm_id in self._alarms
+
+    def __len__(self):
+        return len(self._alarms)
+
+    def upcoming(self, after, limit=None):
+        """[(epoch, alarm_id, alarm)] of enabled alarms by next fire time."""
+        after_dt = datetime.fromtimestamp(after)
+        with self._lock:
+            entries = []
+            for alarm_id, alarm in self._alarms.items():
+                when = next_fire_epoch(alarm, after_dt)
+                if when is not None:
+                    entries.append((when, alarm_id, dict(alarm)))
+        entries.sort(key=lambda entry: entry[0])
+        return entries[:limit] if limit else entries
+
+    # =========================
+    # WRITES
+    # =========================
+    def put(self, alarm_id, alarm):
+        with self.transaction():
+            self._alarms[alarm_id] = dict(alarm)
+            self._pending.add(alarm_id)
+
+    def update(self, alarm_id, **fields):
+        """Change some fields of an existing alarm. False if it does not exist."""
+        with self.transaction():
+            if alarm_id not in self._alarms:
+                return False
+            self._alarms[alarm_id].update(fields)
+            self._pending.add(alarm_id)
+            return True
+
+    def delete(self, alarm_id):
+        with self.transaction():
+            if self._alarms.pop(alarm_id, None) is None:
+                return False
+            self._pending.add(alarm_id)
+            return True
+
+    def replace_all(self, alarms):
+        with self.transaction():
+            self._pending.update(self._alarms)
+            self._pending.update(alarms)
+            self._alarms = copy.deepcopy(alarms)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Batch writes into one commit; an exception rolls the cache back."""
+        with self._lock:
+            if self._depth == 0:
+                self._snapshot = copy.deepcopy(self._alarms)
+                self._pending = set()
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._alarms = self._snapshot
+                    self._pending = set()
+                raise
+            self._depth -= 1
+            if self._depth or not self._pending:
+                return
+            changed, self._pending = self._pending, set()
+            try:
+                self._commit(changed)
+            except Exception:
+                self._alarms = self._snapshot
+                raise
+            finally:
+                self._snapshot = None
+        self._notify(changed)
+
+    # =========================
+    # LISTENERS
+    # =========================
+    def subscribe(self, callback):
+        """callback(store, changed_ids) after each commit or external change."""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, changed):
+        for callback in list(self._listeners):
+            try:
+                callback(self, changed)
+            except Exception as e:
+                print(f"[AlarmStore] Listener error: {e}")
+
+    # =========================
+    # BACKEND HOOKS
+    # =========================
+    def _commit(self, changed):
+        raise NotImplementedError
+
+    def refresh(self):
+        """Reload if another process changed the data. True if it did."""
+        return False
+
+    def close(self):
+        pass
+
+
+class JsonAlarmStore(AlarmStore):
+    """The original {"alarms": {...}} file, written atomically."""
+
+    def __init__(self, path="config/scheduler.json"):
+        super().__init__()
+        self.path = _resolve(path)
+        self._mtime = None
+        self._load()
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self):
+        mtime = self._stat()
+        alarms = {}
+        if mtime is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    alarms = json.load(f).get("alarms", {})
+            except (OSError, ValueError) as e:
+                print(f"❌ Could not read alarms from {self.path}: {e}")
+                return False
+        with self._lock:
+            self._alarms = alarms
+            self._mtime = mtime
+        return True
+
+    def _commit(self, changed):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"alarms": self._alarms}, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._mtime = self._stat()
+
+    def refresh(self):
+        if self._stat() == self._mtime:
+            return False
+        with self._lock:
+            before = self._alarms
+            if not self._load():
+                return False
+            changed = {k for k in set(before) | set(self._alarms)
+                       if before.get(k) != self._alarms.get(k)}
+        if changed:
+            self._notify(changed)
+        return bool(changed)
+
+
+class SQLiteAlarmStore(AlarmStore):
+    """
+    One row per alarm with its next fire time in an indexed column, so
+    upcoming() reads only the first rows instead of scanning every alarm.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS alarms (
+            id        TEXT PRIMARY KEY,
+            data      TEXT NOT NULL,
+            next_fire REAL
+        );
+        CREATE INDEX IF NOT EXISTS alarms_next_fire ON alarms (next_fire);
+    """
+
+    def __init__(self, path="config/alarms.db"):
+        super().__init__()
+        self.path = _resolve(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(self.SCHEMA)
+        self._load()
+
+    def _data_version(self):
+        return self._db.execute("PRAGMA data_version").fetchone()[0]
+
+    def _load(self):
+        with self._lock:
+            rows = self._db.execute("SELECT id, data FROM alarms").fetchall()
+            self._alarms = {alarm_id: json.loads(data) for alarm_id, data in rows}
+            self._version = self._data_version()
+
+    def _commit(self, changed):
+        now = datetime.now()
+        with self._db:
+            for alarm_id in changed:
+                alarm = self._alarms.get(alarm_id)
+                if alarm is None:
+                    self._db.execute("DELETE FROM alarms WHERE id = ?", (alarm_id,))
+                    continue
+                self._db.execute(
+                    "INSERT OR REPLACE INTO alarms (id, data, next_fire) VALUES (?, ?, ?)",
+                    (alarm_id, json.dumps(alarm), next_fire_epoch(alarm, now)))
+        self._version = self._data_version()
+
+    def upcoming(self, after, limit=None):
+        with self._lock:
+            # Rows whose stored time has passed get their next occurrence first
+            after_dt = datetime.fromtimestamp(after)
+            stale = self._db.execute(
+                "SELECT id, data FROM alarms WHERE next_fire <= ?", (after,)).fetchall()
+            if stale:
+                with self._db:
+                    self._db.executemany(
+                        "UPDATE alarms SET next_fire = ? WHERE id = ?",
+                        [(next_fire_epoch(json.loads(data), after_dt), alarm_id)
+                         for alarm_id, data in stale])
+                self._version = self._data_version()
+            query = ("SELECT next_fire, id FROM alarms "
+                     "WHERE next_fire IS NOT NULL ORDER BY next_fire")
+            if limit:
+                query += f" LIMIT {int(limit)}"
+            return [(when, alarm_id, dict(self._alarms[alarm_id]))
+                    for when, alarm_id in self._db.execute(query)
+                    if alarm_id in self._alarms]
+
+    def refresh(self):
+        with self._lock:
+            if self._data_version() == self._version:
+                return False
+            before = self._alarms
+            self._load()
+            changed = {k for k in set(before) | set(self._alarms)
+                       if before.get(k) != self._alarms.get(k)}
+        if changed:
+            self._notify(changed)
+        return bool(changed)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def open_store(backend="json", path=None):
+    """Store for `backend` ("json" or "sqlite") at `path` (default per backend)."""
+    if backend == "sqlite":
+        return SQLiteAlarmStore(path or "config/alarms.db")
+    if backend == "json":
+        return JsonAlarmStore(path or "config/scheduler.json")
+    raise ValueError(f"Unknown alarm store backend '{backend}'")
@@ -1,31 +1,91 @@
 import threading
+import time
+
+from config import settings
+from core import actions
 from audio.audio_receiver import AudioReceiver
+from audio.pipeline import AudioPipeline
+from telemetry.latency import LatencyTracker
+
 
 class AudioManager:
-    def __init__(self, decision_engine=None):
+    """
+    Voice interaction: capture -> recognition -> intent -> speech.
+
+    The stages run concurrently (see audio/pipeline.py), so the robot keeps
+    listening while it recognizes a phrase or speaks a reply.
+
+    Payloads between stages carry a latency Interaction, so every command
+    is timed from end of speech to first audio out (telemetry/latency.py).
+    """
+
+    def __init__(self, decision_engine=None, latency=None):
         self.audio = AudioReceiver()
+        # Wake word while the robot is talking: stop talking and listen
+        self.audio.on_wake = actions.talk_barge_in
+        # Our own replies reach the mic too; capture flags them as echo
+        self.audio.capture.muted = actions.speaking
         self.engine = decision_engine
+        noise = getattr(self.audio.capture, "noise", None)
+        if noise is not None and decision_engine is not None:
+            # Separate noise floor while the drive motors are running
+            noise.condition = lambda: decision_engine.motors_running
         self.running = False
         self.thread = None
+        if latency is None and settings.LATENCY_LOG_ENABLED:
+            latency = LatencyTracker()
+        self.latency = latency
+        self.pipeline = AudioPipeline(
+            capture=self.audio.capture,
+            recognize=self._recognize,
+            handle_intent=self._handle_command,
+            speak=self._speak,
+            queue_size=settings.AUDIO_STAGE_QUEUE_SIZE
+        )
+
+    def _recognize(self, utterance):
+        """Recognition stage: utterance -> (command, interaction) or None."""
+        interaction = self.latency.begin(utterance.ended) if self.latency else None
+        command = self.audio.handle_utterance(utterance, interaction)
+        if not command:
+            if interaction:
+                interaction.discard()
+            return None
+        if interaction:
+            interaction.note("command", command)
+        return command, interaction
+
+    def _handle_command(self, payload):
+        """Intent stage: update robot state, return the reply for the speech stage."""
+        command, interaction = payload
+        if not self.engine:
+            print("[AudioManager] Received command but decision engine not set")
+            return None
+        response = self.engine.handle_voice(command, speak=False, interaction=interaction)
+        return (response, interaction) if response else None
+
+    def _speak(self, payload):
+        """Speech stage: hand the reply to the speech output queue."""
+        text, interaction = payload
+        on_audio = (lambda at: interaction.mark("audio_out", at)) if interaction else None
+        actions.talk(text, priority="response", on_audio=on_audio)
 
+    def metrics(self):
+        return self.pipeline.metrics()
 
     def run(self):
         self.running = True
+        self.pipeline.start()
         print("[AudioManager] Started")
-        while self.running:
-            try:
-                if not self.audio.listen_for_wake_word():
-                    continue
-                command = self.audio.listen_for_command()
-                if command:
-                    if self.engine:
-                        self.engine.handle_voice(command)
-                    else:
-                        print("[AudioManager] Received command but decision engine not set")
-            except KeyboardInterrupt:
-                self.running = False
-            except Exception as e:
-                print(f"[AudioManager] Error: {e}")
+        try:
+            while self.running:
+                time.sleep(0.2)
+                if self.latency:
+                    self.latency.flush()
+        except KeyboardInterrupt:
+            self.running = False
+        finally:
+            self.pipeline.stop()
 
     def start_async(self):
         self.thread = threading.Thread(target=self.run, daemon=True)
@@ -36,3 +96,10 @@ class AudioManager:
         self.running = False
         if self.thread:
             self.thread.join(timeout=2)
+        print(f"[AudioManager] Stage metrics: {self.metrics()}")
+        noise = getattr(self.audio.capture, "noise", None)
+        if noise is not None:
+            print(f"[AudioManager] Noise floor: {noise.snapshot()}")
+        if self.latency:
+            self.latency.close()
+        self.audio.close()
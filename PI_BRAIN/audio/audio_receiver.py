@@ -1,47 +1,183 @@
-import speech_recognition as sr
+import time
+
+from config import settings
+from audio.stt import STTError, StreamingDecoder, create_backend
+from audio.capture import CaptureStream
+from audio.wake_word import WakeWordDetector
+
+# Command audio left after the wake word shorter than this is ignored (bytes)
+MIN_COMMAND_BYTES = int(0.3 * 16000) * 2
+
 
 class AudioReceiver:
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
-        self.wake_words = ["hey panda", "ok panda", "panda"]
+    """
+    Turns segmented utterances into commands.
+
+    After the wake word a session stays open for COMMAND_TIMEOUT seconds,
+    and every recognized command extends it by SESSION_TIMEOUT, so several
+    commands can follow one "hey panda".
+
+    Echo utterances (captured while the robot was talking) are only
+    checked for the wake word (barge-in), by the local spotter or, without
+    one, by speech-to-text. Only a command after that wake word is taken
+    from them, or the robot would answer its own replies.
+    """
 
+    def __init__(self, stt=None, capture=None):
+        # STT backend is loaded once here, not per utterance
+        self.stt = stt or create_backend()
+        self.decoder = None
         try:
-            with self.microphone as source:
-                print("[Audio] Calibrating microphone...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            self.stt.load()
+            print(f"[Audio] Speech-to-text backend: {self.stt.name}")
+            if settings.STT_STREAMING:
+                # Own recognizer instance (same model), fed by the capture thread
+                self.decoder = StreamingDecoder(self.stt.spawn())
+                self.decoder.start()
+        except STTError as e:
+            print(f"[Audio] Warning: speech-to-text unavailable: {e}")
+
+        self.wake_words = ["hey panda", "ok panda", "panda"]
+        # While talking: the robot says "Panda" itself, so only the full phrases
+        self.echo_wake_words = ["hey panda", "ok panda"]
+        self.on_wake = None  # optional callback when the wake word is heard
+
+        # Local wake-word spotting; only audio after the wake word is sent to STT
+        self.wake_detector = WakeWordDetector.from_settings()
+        if self.wake_detector is None:
+            print("[Audio] No local wake-word model (or no NumPy) - using speech-to-text for wake word")
+        self._awake_until = 0.0
+
+        # One persistent microphone stream, segmented by VAD
+        self.capture = capture or CaptureStream()
+        if self.decoder is not None:
+            self.capture.decoder = self.decoder
+        noise = getattr(self.capture, "noise", None)
+        if noise is not None and self.wake_detector is not None:
+            noise.attach(self.wake_detector.gate)  # same adaptive threshold
+        if not self.capture.is_alive():
+            self.capture.start()
+        if self.capture.wait_ready(timeout=2):
             print("[Audio] Microphone ready")
-        except Exception as e:
-            print(f"[Audio] Warning: Could not calibrate microphone: {e}")
+        else:
+            print(f"[Audio] Warning: microphone not ready: {self.capture.error}")
+
+    # =========================
+    # WAKE WORD
+    # =========================
+    def _strip_wake_word(self, text: str, wake_words=None):
+        """Text after the wake word, '' if only the wake word, None if absent."""
+        lowered = text.lower()
+        for wake in wake_words or self.wake_words:  # longest phrases first
+            index = lowered.find(wake)
+            if index >= 0:
+                return text[index + len(wake):].strip(" ,.!?")
+        return None
 
-    def _is_wake_word(self, text: str) -> bool:
-        text = text.lower()
-        return any(wake in text for wake in self.wake_words)
+    def _woke(self, at):
+        print("[Heard] wake word")
+        self._awake_until = at + settings.COMMAND_TIMEOUT
+        if self.on_wake:
+            self.on_wake()
 
-    def listen_for_wake_word(self) -> bool:
-        print("[Audio] Listening for wake word...")
-        try:
-            with self.microphone as source:
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=3)
-            text = self.recognizer.recognize_google(audio)
-            print(f"[Heard] {text}")
-            return self._is_wake_word(text)
-        except (sr.WaitTimeoutError, sr.UnknownValueError):
-            return False
-        except sr.RequestError as e:
-            print(f"[Audio] STT error: {e}")
-            return False
+    # =========================
+    # UTTERANCES
+    # =========================
+    def _transcribe(self, utterance):
+        """Text streamed while the utterance was spoken, else decode it now."""
+        if getattr(utterance, "decoded", False):
+            return utterance.text
+        return self.stt.transcribe(utterance.pcm)
+
+    def is_awake(self, at=None) -> bool:
+        return (time.monotonic() if at is None else at) < self._awake_until
+
+    def handle_utterance(self, utterance, interaction=None) -> str | None:
+        """
+        Process one utterance from the capture stream.
+
+        Args:
+            utterance: capture.Utterance
+            interaction: Optional latency Interaction, marked at wake / stt
 
-    def listen_for_command(self) -> str | None:
-        print("[Audio] Listening for command...")
+        Returns:
+            str or None: The command text if this utterance carried one
+        """
+        at = utterance.ended
+        pcm = utterance.pcm
         try:
-            with self.microphone as source:
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=5)
-            text = self.recognizer.recognize_google(audio)
-            print(f"[Command] {text}")
-            return text
-        except (sr.WaitTimeoutError, sr.UnknownValueError):
-            print("[Audio] Could not understand command")
-        except sr.RequestError as e:
+            if getattr(utterance, "echo", False):
+                text = self._handle_echo(utterance, interaction)
+            elif not self.is_awake(at):
+                if self.wake_detector is not None:
+                    detected, end = self.wake_detector.detect_pcm(pcm)
+                    if not detected:
+                        return None
+                    if interaction:
+                        interaction.mark("wake")
+                    self._woke(at)
+                    if len(pcm) - end < MIN_COMMAND_BYTES:
+                        return None
+                    # Command spoken in the same phrase: the streamed text
+                    # minus the wake word, or a decode of the audio after it
+                    text = None
+                    if getattr(utterance, "decoded", False):
+                        text = self._strip_wake_word(utterance.text or "")
+                    if text is None:
+                        text = self.stt.transcribe(pcm[end:])
+                else:
+                    heard = self._transcribe(utterance)
+                    text = self._strip_wake_word(heard) if heard else None
+                    if text is None:
+                        return None
+                    if interaction:
+                        interaction.mark("wake")
+                    self._woke(at)
+            else:
+                text = self._transcribe(utterance)
+                if text:
+                    stripped = self._strip_wake_word(text)
+                    text = text if stripped is None else stripped
+        except STTError as e:
             print(f"[Audio] STT error: {e}")
-        return None
+            return None
+
+        if interaction:
+            interaction.mark("stt")
+        if not text:
+            return None
+        print(f"[Command] {text}")
+        self._awake_until = at + settings.SESSION_TIMEOUT
+        return text
+
+    def _handle_echo(self, utterance, interaction):
+        """
+        Our own speech may hide a barge-in. Returns the command after the
+        wake word, or None (no wake word, or nothing after it).
+        """
+        at = utterance.ended
+        pcm = utterance.pcm
+        if self.wake_detector is not None:
+            detected, end = self.wake_detector.detect_pcm(pcm)
+            if not detected:
+                return None
+            if interaction:
+                interaction.mark("wake")
+            self._woke(at)
+            if len(pcm) - end < MIN_COMMAND_BYTES:
+                return None
+            return self.stt.transcribe(pcm[end:])
+
+        heard = self._transcribe(utterance)
+        text = self._strip_wake_word(heard, self.echo_wake_words) if heard else None
+        if text is None:
+            return None
+        if interaction:
+            interaction.mark("wake")
+        self._woke(at)
+        return text
+
+    def close(self):
+        self.capture.stop()
+        if self.decoder is not None:
+            self.decoder.stop()
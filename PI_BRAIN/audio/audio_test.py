@@ -11,7 +11,7 @@ class MockSensors:
 # ---- MOCK ACTIONS OUTPUT ----
 import core.actions as actions
 
-def mock_talk(text):
+def mock_talk(text, priority="response", key=None):
     print(f"[PANDA] {text}")
 
 actions.talk = mock_talk
@@ -0,0 +1,310 @@
+"""
+capture.py - Persistent microphone stream with VAD segmentation.
+
+One PyAudio input stream stays open for the lifetime of the robot. Every
+20 ms frame goes into a ring buffer and through a frame-level energy VAD;
+a small state machine cuts utterances and puts them on a queue.
+
+Because the stream is never reopened and each utterance starts with a
+pre-roll of the audio *before* speech was detected, a command spoken
+right after "hey panda" is not lost.
+
+The VAD threshold follows the ambient noise (audio/noise_floor.py); there
+is no blocking calibration at startup. Only frames the VAD calls silence
+(including pauses inside an utterance) update it, never speech or our own
+playback, so talking does not raise the floor. An utterance cut at
+CAPTURE_MAX_UTTERANCE without a single quiet frame is a new background
+louder than the threshold, not speech: its levels are fed too, otherwise
+the threshold would never catch up with it.
+
+With a `decoder` (stt.StreamingDecoder) set, every utterance is fed to
+speech-to-text frame by frame from onset, and is emitted with its text
+once the decoder has finished it.
+
+While the robot itself is talking (`muted`, wired to the speech output)
+and for CAPTURE_ECHO_TAIL after, utterances are flagged `echo`: the mic
+hears our own TTS, and the receiver must not take it for a command.
+"""
+
+import collections
+import os
+import queue
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from core.device_registry import devices
+from audio.noise_floor import NoiseFloor
+from audio.wake_word import EnergyGate, pcm_rms
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+
+def open_input(device_index=None):
+    """
+    (PyAudio, stream) in the capture format. Hardware validation opens the
+    microphone with this and hands it over through the device registry,
+    so CaptureStream does not have to open it a second time.
+    """
+    import pyaudio
+    if device_index is None:
+        device_index = settings.MIC_DEVICE_INDEX
+    pa = pyaudio.PyAudio()
+    try:
+        stream = pa.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=SAMPLE_RATE,
+            input=True,
+            input_device_index=device_index,
+            frames_per_buffer=SAMPLE_RATE * settings.CAPTURE_FRAME_MS // 1000
+        )
+    except Exception:
+        pa.terminate()
+        raise
+    return pa, stream
+
+
+def close_input(pa, stream):
+    try:
+        stream.stop_stream()
+        stream.close()
+    finally:
+        pa.terminate()
+
+
+class Utterance:
+    """One VAD-segmented utterance (16 kHz mono int16 PCM)."""
+
+    __slots__ = ("pcm", "started", "ended", "echo", "text", "decoded")
+
+    def __init__(self, pcm, started, ended, echo=False):
+        self.pcm = pcm
+        self.started = started  # time.monotonic() of the first frame (incl. pre-roll)
+        self.ended = ended      # time.monotonic() when VAD declared end of speech
+        self.echo = echo        # overlapped our own speech output (or its tail)
+        self.text = None        # streamed STT result, if decoded is True
+        self.decoded = False
+
+    @property
+    def duration(self):
+        return len(self.pcm) / float(SAMPLE_RATE * SAMPLE_WIDTH)
+
+
+class CaptureStream(threading.Thread):
+    """
+    Continuous capture + segmentation.
+
+    Consumers call next_utterance(timeout), or set `sink` to receive each
+    utterance directly (the audio pipeline does). When the queue is full the
+    oldest utterance is dropped (stale speech is worth less than new).
+    """
+
+    def __init__(self, gate=None, device_index=None, noise=None):
+        super().__init__(daemon=True)
+        self.gate = gate or EnergyGate()
+        if noise is None and settings.NOISE_TRACKING:
+            noise = NoiseFloor()
+        self.noise = noise
+        if self.noise is not None:
+            self.noise.attach(self.gate)
+        self.device_index = settings.MIC_DEVICE_INDEX if device_index is None else device_index
+
+        self.frame_samples = SAMPLE_RATE * settings.CAPTURE_FRAME_MS // 1000
+        frame_s = settings.CAPTURE_FRAME_MS / 1000.0
+        self.start_frames = settings.CAPTURE_START_FRAMES
+        self.pre_roll_frames = int(settings.CAPTURE_PRE_ROLL / frame_s)
+        self.hangover_frames = int(settings.CAPTURE_HANGOVER / frame_s)
+        self.max_frames = int(settings.CAPTURE_MAX_UTTERANCE / frame_s)
+        self.min_speech_frames = int(settings.CAPTURE_MIN_SPEECH / frame_s)
+
+        # Last CAPTURE_RING_SECONDS of raw audio, whatever the VAD decided
+        self.ring = collections.deque(maxlen=int(settings.CAPTURE_RING_SECONDS / frame_s))
+        self.utterances = queue.Queue(maxsize=settings.CAPTURE_QUEUE_SIZE)
+
+        self._stopped = threading.Event()
+        self._ready = threading.Event()
+        self._pa = None
+        self._stream = None
+        self.error = None
+        self.dropped = 0
+        self.sink = None
+        self.muted = None       # callable -> True while the robot is talking
+        self.decoder = None     # stt.StreamingDecoder fed while speech is going on
+        self.echo_tail = settings.CAPTURE_ECHO_TAIL
+        self._echo_until = 0.0  # monotonic end of the last playback + tail
+
+    # =========================
+    # CONSUMER API
+    # =========================
+    def next_utterance(self, timeout=None):
+        """Block for the next utterance. Returns None on timeout."""
+        try:
+            return self.utterances.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def flush(self):
+        """Discard queued utterances (e.g. our own TTS picked up by the mic)."""
+        while True:
+            try:
+                self.utterances.get_nowait()
+            except queue.Empty:
+                return
+
+    def recent_audio(self, seconds):
+        """Raw PCM of the last `seconds` from the ring buffer."""
+        frames = int(seconds * 1000 / settings.CAPTURE_FRAME_MS)
+        return b"".join(list(self.ring)[-frames:])
+
+    def in_echo(self, now=None):
+        """True while the robot talks and for CAPTURE_ECHO_TAIL after."""
+        now = time.monotonic() if now is None else now
+        muted = self.muted
+        if muted is not None and muted():
+            self._echo_until = now + self.echo_tail
+        return now < self._echo_until
+
+    def wait_ready(self, timeout=None):
+        """True once the stream is open (False on timeout or open failure)."""
+        return self._ready.wait(timeout) and self.error is None
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=2)
+
+    # =========================
+    # CAPTURE THREAD
+    # =========================
+    def _open(self):
+        handed_over = devices.take("microphone")
+        if handed_over is not None:
+            # Opened by hardware validation; paused until now
+            self._pa, self._stream = handed_over
+            self._stream.start_stream()
+            return
+        self._pa, self._stream = open_input(self.device_index)
+
+    def _close(self):
+        try:
+            if self._stream is not None:
+                self._stream.stop_stream()
+                self._stream.close()
+            if self._pa is not None:
+                self._pa.terminate()
+        except Exception:
+            pass
+        self._stream = self._pa = None
+
+    def run(self):
+        try:
+            self._open()
+        except Exception as e:
+            self.error = e
+            print(f"[Capture] Could not open microphone: {e}")
+            self._ready.set()
+            return
+
+        self._ready.set()
+        print("[Capture] Microphone stream open")
+        try:
+            self._segment_loop()
+        finally:
+            self._close()
+            if self.noise is not None:
+                self.noise.save()
+
+    def _segment_loop(self):
+        pre_roll = collections.deque(maxlen=self.pre_roll_frames + self.start_frames)
+        active = False
+        frames = []
+        started = 0.0
+        echo = False
+        levels = []     # frame levels of the open utterance; None once one was quiet
+        decoder = None  # decoder streaming the open utterance
+        consecutive = speech = silence = 0
+
+        while not self._stopped.is_set():
+            frame = self._stream.read(self.frame_samples, exception_on_overflow=False)
+            self.ring.append(frame)
+            level = pcm_rms(frame)
+            is_speech = level >= self.gate.threshold
+            in_echo = self.in_echo()
+            if self.noise is not None and not (is_speech or in_echo):
+                self.noise.update(level)
+
+            if not active:
+                pre_roll.append(frame)
+                consecutive = consecutive + 1 if is_speech else 0
+                if consecutive >= self.start_frames:
+                    active = True
+                    frames = list(pre_roll)
+                    started = time.monotonic() - len(frames) * settings.CAPTURE_FRAME_MS / 1000.0
+                    speech, silence = consecutive, 0
+                    levels = []
+                    echo = in_echo
+                    pre_roll.clear()
+                    # Our own speech is not decoded (see audio_receiver)
+                    decoder = self.decoder if not echo else None
+                    if decoder is not None:
+                        decoder.begin()
+                        for buffered in frames:
+                            decoder.feed(buffered)
+                continue
+
+            frames.append(frame)
+            if levels is not None:
+                if is_speech:
+                    levels.append(level)
+                else:
+                    levels = None
+            echo = echo or in_echo
+            if decoder is not None:
+                decoder.feed(frame)
+            if is_speech:
+                speech += 1
+                silence = 0
+            else:
+                silence += 1
+
+            if silence >= self.hangover_frames or len(frames) >= self.max_frames:
+                if len(frames) >= self.max_frames and levels and self.noise is not None and not echo:
+                    for value in levels:
+                        self.noise.update(value)
+                if speech >= self.min_speech_frames:
+                    utterance = Utterance(b"".join(frames), started, time.monotonic(), echo)
+                    if decoder is not None:
+                        decoder.end(utterance, self._emit)
+                    else:
+                        self._emit(utterance)
+                elif decoder is not None:
+                    decoder.cancel()
+                decoder = None
+                active = False
+                frames = []
+                consecutive = 0
+
+    def _emit(self, utterance):
+        sink = self.sink
+        if sink is not None:
+            sink(utterance)
+            return
+        # Two producers (this thread and the streaming decoder): the slot
+        # freed by dropping the oldest may be taken again, so retry
+        while True:
+            try:
+                self.utterances.put_nowait(utterance)
+                return
+            except queue.Full:
+                try:
+                    self.utterances.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
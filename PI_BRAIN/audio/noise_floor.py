@@ -0,0 +1,177 @@
+"""
+noise_floor.py - Continuous ambient-noise tracking for the VAD threshold.
+
+Instead of a one-off calibration at startup, the level of every 20 ms
+frame the VAD calls silence is fed to a sliding window (NOISE_WINDOW
+seconds); audio/capture.py skips speech and the robot's own playback. A
+low percentile of that window is the noise floor, so a word that slips
+under the threshold barely moves it, while motor whine or a noisy room
+lifts it within a few seconds (one loud enough to pass for speech after
+CAPTURE_MAX_UTTERANCE, when capture cuts the endless "utterance").
+
+    threshold = clamp(floor * NOISE_THRESHOLD_RATIO,
+                      NOISE_THRESHOLD_MIN, NOISE_THRESHOLD_MAX)
+
+Floors are kept separately for "motors running" and "quiet", since the
+drive motors add a lot of noise and come and go. The last floors are
+saved to NOISE_CALIBRATION_PATH, so the next start uses them right away
+instead of calibrating.
+"""
+
+import bisect
+import collections
+import json
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from telemetry.stats import percentile_sorted
+
+QUIET = "quiet"
+MOTORS = "motors"
+
+
+class _Window:
+    """Last N levels, also kept sorted so a percentile is a lookup."""
+
+    def __init__(self, size):
+        self.levels = collections.deque(maxlen=size)
+        self.ordered = []
+
+    def add(self, level):
+        if len(self.levels) == self.levels.maxlen:
+            old = self.levels[0]
+            del self.ordered[bisect.bisect_left(self.ordered, old)]
+        self.levels.append(level)
+        bisect.insort(self.ordered, level)
+
+    def percentile(self, pct):
+        return percentile_sorted(self.ordered, pct)
+
+    def __len__(self):
+        return len(self.levels)
+
+
+class NoiseFloor:
+    """
+    Running noise-floor estimate and the VAD threshold derived from it.
+
+    `condition` is an optional callable returning True while the drive
+    motors run. Gates registered with attach() get their threshold
+    updated whenever it is recomputed.
+    """
+
+    def __init__(self, path=None, condition=None, frame_ms=None):
+        path = path or settings.NOISE_CALIBRATION_PATH
+        if not os.path.isabs(path):
+            path = os.path.join(project_root, path)
+        self.path = path
+        self.condition = condition
+        frame_ms = frame_ms or settings.CAPTURE_FRAME_MS
+
+        size = int(settings.NOISE_WINDOW * 1000 / frame_ms)
+        self._windows = {QUIET: _Window(size), MOTORS: _Window(size)}
+        self._min_frames = int(settings.NOISE_MIN_WINDOW * 1000 / frame_ms)
+        self._recompute_every = max(1, int(settings.NOISE_UPDATE_INTERVAL * 1000 / frame_ms))
+        self._frames = 0
+        self._gates = []
+        self._lock = threading.Lock()
+        self._last_save = time.monotonic()
+
+        self.floors = {QUIET: None, MOTORS: None}
+        self.load()
+        self.threshold = self._threshold_for(QUIET)
+
+    # =========================
+    # STATE
+    # =========================
+    def current_condition(self):
+        try:
+            return MOTORS if self.condition and self.condition() else QUIET
+        except Exception:
+            return QUIET
+
+    def _threshold_for(self, condition):
+        floor = self.floors.get(condition)
+        if floor is None:
+            floor = self.floors.get(QUIET)
+        if floor is None:
+            return settings.VAD_ENERGY_THRESHOLD
+        return min(settings.NOISE_THRESHOLD_MAX,
+                   max(settings.NOISE_THRESHOLD_MIN, floor * settings.NOISE_THRESHOLD_RATIO))
+
+    def attach(self, gate):
+        """Keep gate.threshold in sync with this estimator."""
+        gate.threshold = self.threshold
+        self._gates.append(gate)
+
+    # =========================
+    # UPDATES (capture thread)
+    # =========================
+    def update(self, level):
+        """Feed one frame level (RMS, 0..1). Returns the current threshold."""
+        condition = self.current_condition()
+        window = self._windows[condition]
+        window.add(level)
+        self._frames += 1
+        if self._frames % self._recompute_every:
+            return self.threshold
+
+        # Until the window has enough frames the saved floor keeps being used
+        if len(window) >= self._min_frames:
+            with self._lock:
+                self.floors[condition] = window.percentile(settings.NOISE_FLOOR_PERCENTILE)
+        self._set_threshold(self._threshold_for(condition))
+        if time.monotonic() - self._last_save >= settings.NOISE_SAVE_INTERVAL:
+            self.save()
+        return self.threshold
+
+    def _set_threshold(self, threshold):
+        self.threshold = threshold
+        for gate in self._gates:
+            gate.threshold = threshold
+
+    # =========================
+    # PERSISTENCE
+    # =========================
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        for condition in self.floors:
+            value = saved.get(condition)
+            if isinstance(value, (int, float)) and value > 0:
+                self.floors[condition] = float(value)
+        return True
+
+    def save(self):
+        """Write the floors (write-then-rename, never a half-written file)."""
+        self._last_save = time.monotonic()
+        with self._lock:
+            data = {k: v for k, v in self.floors.items() if v is not None}
+        if not data:
+            return
+        data["saved_at"] = time.time()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[NoiseFloor] Could not save calibration: {e}")
+
+    def snapshot(self):
+        return {
+            "threshold": round(self.threshold, 4),
+            "condition": self.current_condition(),
+            "floors": {k: (round(v, 4) if v is not None else None) for k, v in self.floors.items()}
+        }
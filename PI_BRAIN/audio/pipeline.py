@@ -0,0 +1,152 @@
+"""
+pipeline.py - Concurrent stages connected by bounded queues.
+
+    capture ──> recognition ──> intent ──> speech
+    (VAD)       (wake + STT)    (engine)   (SpeechOutput queue)
+
+Each stage is a thread with its own bounded inbox, so the robot keeps
+listening while it recognizes or talks. Producers never block: when an
+inbox is full the OLDEST item is dropped and counted.
+
+Per-stage metrics: queue depth, items processed/dropped, time spent
+waiting in the queue and time spent in the handler.
+"""
+
+import queue
+import threading
+import time
+
+
+class StageMetrics:
+    """Counters for one stage (updated by the stage thread only)."""
+
+    def __init__(self):
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_busy = 0.0
+
+    def record(self, wait, busy):
+        self.processed += 1
+        self.total_wait += wait
+        self.total_busy += busy
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def snapshot(self, depth):
+        n = max(self.processed, 1)
+        return {
+            "depth": depth,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "avg_wait_ms": round(1000.0 * self.total_wait / n, 1),
+            "max_wait_ms": round(1000.0 * self.max_wait, 1),
+            "avg_busy_ms": round(1000.0 * self.total_busy / n, 1)
+        }
+
+
+class Stage(threading.Thread):
+    """
+    One pipeline stage.
+
+    handler(payload) returns the payload for the next stage, or None to
+    stop this item here.
+    """
+
+    def __init__(self, name, handler, maxsize=4, next_stage=None):
+        super().__init__(daemon=True, name=f"audio-{name}")
+        self.stage_name = name
+        self.handler = handler
+        self.next_stage = next_stage
+        self.inbox = queue.Queue(maxsize=maxsize)
+        self.metrics = StageMetrics()
+        self._stopped = threading.Event()
+        # Inboxes have several producers (capture and the streaming decoder
+        # feed recognition); only the stage thread takes, so with producers
+        # serialized the slot freed by a drop stays free
+        self._put_lock = threading.Lock()
+
+    def put(self, payload):
+        """Enqueue without blocking; drops the oldest item when full."""
+        item = (time.monotonic(), payload)
+        with self._put_lock:
+            try:
+                self.inbox.put_nowait(item)
+            except queue.Full:
+                try:
+                    self.inbox.get_nowait()
+                    self.metrics.dropped += 1
+                except queue.Empty:
+                    pass
+                self.inbox.put_nowait(item)
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                enqueued, payload = self.inbox.get(timeout=0.2)
+            except queue.Empty:
+                continue
+
+            started = time.monotonic()
+            try:
+                result = self.handler(payload)
+            except Exception as e:
+                self.metrics.errors += 1
+                print(f"[AudioPipeline] {self.stage_name} error: {e}")
+                result = None
+            self.metrics.record(started - enqueued, time.monotonic() - started)
+
+            if result is not None and self.next_stage is not None:
+                self.next_stage.put(result)
+
+    def snapshot(self):
+        return self.metrics.snapshot(self.inbox.qsize())
+
+
+class AudioPipeline:
+    """Wires capture -> recognition -> intent -> speech."""
+
+    def __init__(self, capture, recognize, handle_intent, speak, queue_size=4):
+        self.capture = capture
+        self.speech = Stage("speech", self._speak(speak), queue_size)
+        self.intent = Stage("intent", handle_intent, queue_size, self.speech)
+        self.recognition = Stage("recognition", recognize, queue_size, self.intent)
+        self.stages = [self.recognition, self.intent, self.speech]
+
+    @staticmethod
+    def _speak(speak):
+        def handler(text):
+            speak(text)
+            return None
+        return handler
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+        # Capture pushes utterances straight into the recognition stage
+        self.capture.sink = self.recognition.put
+
+    def stop(self):
+        self.capture.sink = None
+        for stage in self.stages:
+            stage.stop()
+        for stage in self.stages:
+            stage.join(timeout=1)
+
+    def metrics(self):
+        """Per-stage queue depth and timing (see StageMetrics.snapshot)."""
+        result = {
+            "capture": {
+                "depth": 0,
+                "dropped": getattr(self.capture, "dropped", 0)
+            }
+        }
+        for stage in self.stages:
+            result[stage.stage_name] = stage.snapshot()
+        return result
@@ -0,0 +1,245 @@
+"""
+speaker.py - Speech and beeps through the sound card.
+
+The object bound as actions' speaker (actions.bind_hardware(speaker=...)).
+
+    speaker.say("Stopping now.")   # cached WAV, plays immediately
+    speaker.beep()
+    speaker.play(clip, loop=True)  # pre-decoded PCM (alarm sound), until cancelled
+
+Replies are spoken sentence by sentence. A sentence is played from the
+TTS cache when it was rendered before; a sentence that fills a known
+template ("It's about {t} degrees.") is assembled from the cached static
+fragments plus a freshly rendered value; anything else is synthesized once
+and cached for next time.
+
+prepare(texts) registers the reply templates and pre-renders every static
+reply and fragment on a background thread, so the first "Following you
+now." is already instant.
+"""
+
+import math
+import os
+import re
+import struct
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from audio.tts_cache import EspeakSynthesizer, TTSCache, TTSError, read_wav_bytes
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_PLACEHOLDER = re.compile(r"(\{\w+\})")
+
+PLAYBACK_CHUNK = 1024  # frames per stream.write (checked for interruption)
+
+
+def split_sentences(text: str):
+    return [s for s in _SENTENCE_END.split(text.strip()) if s]
+
+
+def _speakable(part: str) -> bool:
+    return any(ch.isalnum() for ch in part)
+
+
+class Clip:
+    """Pre-decoded PCM ready for the sound card (e.g. the alarm sound)."""
+
+    __slots__ = ("name", "pcm", "rate", "channels", "width")
+
+    def __init__(self, name, pcm, rate, channels, width):
+        self.name = name
+        self.pcm = pcm
+        self.rate = rate
+        self.channels = channels
+        self.width = width
+
+    @property
+    def duration(self):
+        return len(self.pcm) / float(self.rate * self.channels * self.width)
+
+    def __repr__(self):
+        return f"Clip({self.name!r}, {self.duration:.1f}s)"
+
+
+class Speaker:
+    """espeak-ng + TTS cache + PyAudio playback."""
+
+    def __init__(self, synthesizer=None, cache=None, device_index=None):
+        self.synth = synthesizer or EspeakSynthesizer()
+        self.cache = cache or TTSCache(engine=self.synth.name, voice=self.synth.voice_key)
+        self.device_index = settings.SPEAKER_DEVICE_INDEX if device_index is None else device_index
+        self._templates = []  # (compiled regex, template parts)
+        self._pa = None
+        self._play_lock = threading.Lock()
+        self._interrupt = threading.Event()
+        self._prerender_thread = None
+
+    # =========================
+    # TEMPLATES / PRE-RENDER
+    # =========================
+    def add_template(self, template: str):
+        """Register a reply with {placeholders}; its static parts become fragments."""
+        parts = [p for p in _PLACEHOLDER.split(template) if p]
+        pattern = "".join(
+            "(.+?)" if _PLACEHOLDER.fullmatch(p) else re.escape(p) for p in parts
+        )
+        self._templates.append((re.compile(pattern), parts))
+
+    def fragments(self, text: str):
+        """Texts to render, in order, for speaking `text`."""
+        result = []
+        for sentence in split_sentences(text):
+            if sentence in self.cache:
+                result.append(sentence)
+                continue
+            for regex, parts in self._templates:
+                match = regex.fullmatch(sentence)
+                if match is None:
+                    continue
+                values = iter(match.groups())
+                for part in parts:
+                    piece = next(values) if _PLACEHOLDER.fullmatch(part) else part
+                    piece = piece.strip()
+                    if _speakable(piece):
+                        result.append(piece)
+                break
+            else:
+                result.append(sentence)
+        return result
+
+    def prepare(self, texts, background=True):
+        """
+        Register templates among `texts` and pre-render the static audio.
+
+        Runs on a daemon thread by default; missing espeak-ng is reported
+        once and playback falls back to rendering on demand.
+        """
+        static = []
+        for text in texts:
+            if _PLACEHOLDER.search(text):
+                self.add_template(text)
+                parts = [p.strip() for p in _PLACEHOLDER.split(text)]
+                static.extend(p for p in parts if _speakable(p))
+            else:
+                static.extend(split_sentences(text))
+        static = list(dict.fromkeys(static))
+
+        if not background:
+            return self._prerender(static)
+        self._prerender_thread = threading.Thread(
+            target=self._prerender, args=(static,), daemon=True, name="tts-prerender"
+        )
+        self._prerender_thread.start()
+        return None
+
+    def _prerender(self, texts):
+        started = time.monotonic()
+        rendered = 0
+        for text in texts:
+            if text in self.cache:
+                continue
+            try:
+                self.cache.put(text, self.synth.synthesize(text))
+                rendered += 1
+            except TTSError as e:
+                print(f"[Speaker] Pre-render stopped: {e}")
+                return rendered
+        print(f"[Speaker] Pre-rendered {rendered} phrases "
+              f"({len(texts) - rendered} cached) in {time.monotonic() - started:.1f}s")
+        return rendered
+
+    # =========================
+    # RENDERING
+    # =========================
+    def render(self, text: str) -> bytes:
+        """WAV bytes for one fragment (cache first)."""
+        data = self.cache.get(text)
+        if data is None:
+            data = self.synth.synthesize(text)
+            self.cache.put(text, data)
+        return data
+
+    # =========================
+    # OUTPUT (actions speaker interface)
+    # =========================
+    def say(self, text: str, cancel=None, on_audio=None):
+        """
+        Speak `text`. Blocking; stop() from another thread, or setting the
+        optional `cancel` event, cuts it off. `on_audio(monotonic_time)` is
+        called once, just before the first chunk is written.
+        """
+        self._interrupt.clear()
+        gap = b""
+        chunks = []
+        audio_format = None
+        for fragment in self.fragments(text):
+            pcm, rate, channels, width = read_wav_bytes(self.render(fragment))
+            if audio_format not in (None, (rate, channels, width)):
+                self._play(b"".join(chunks), *audio_format, cancel=cancel, on_audio=on_audio)
+                chunks, on_audio = [], None
+            audio_format = (rate, channels, width)
+            gap = b"\0" * (int(rate * settings.TTS_FRAGMENT_GAP) * channels * width)
+            chunks.extend((pcm, gap))
+        if chunks:
+            self._play(b"".join(chunks[:-1]), *audio_format, cancel=cancel, on_audio=on_audio)
+
+    def play(self, clip, cancel=None, on_audio=None, loop=False):
+        """Play a Clip (blocking); with loop=True until stop() or `cancel`."""
+        self._interrupt.clear()
+        self._play(clip.pcm, clip.rate, clip.channels, clip.width,
+                   cancel=cancel, on_audio=on_audio, loop=loop)
+
+    def beep(self, frequency=880, duration=0.15, rate=22050):
+        samples = int(rate * duration)
+        pcm = b"".join(
+            struct.pack("<h", int(12000 * math.sin(2 * math.pi * frequency * i / rate)))
+            for i in range(samples)
+        )
+        self._interrupt.clear()
+        self._play(pcm, rate, 1, 2)
+
+    def stop(self):
+        """Interrupt the current playback."""
+        self._interrupt.set()
+
+    def close(self):
+        self.stop()
+        with self._play_lock:
+            if self._pa is not None:
+                self._pa.terminate()
+                self._pa = None
+
+    def _play(self, pcm, rate, channels, width, cancel=None, on_audio=None, loop=False):
+        import pyaudio
+
+        with self._play_lock:
+            if self._pa is None:
+                self._pa = pyaudio.PyAudio()
+            stream = self._pa.open(
+                format=self._pa.get_format_from_width(width),
+                channels=channels,
+                rate=rate,
+                output=True,
+                output_device_index=self.device_index
+            )
+            try:
+                step = PLAYBACK_CHUNK * channels * width
+                while True:
+                    for offset in range(0, len(pcm), step):
+                        if self._interrupt.is_set() or (cancel is not None and cancel.is_set()):
+                            return
+                        if on_audio is not None:
+                            on_audio(time.monotonic())
+                            on_audio = None
+                        stream.write(pcm[offset:offset + step])
+                    if not loop or not pcm:
+                        return
+            finally:
+                stream.stop_stream()
+                stream.close()
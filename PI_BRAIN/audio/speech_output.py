@@ -0,0 +1,225 @@
+"""
+speech_output.py - Prioritized, interruptible speech.
+
+One thread owns the speaker; everybody else enqueues:
+
+    handle = speech.say("Stopping now.")                    # response
+    speech.say("CO detected!", priority="safety", key="gas")
+    speech.play(alarm_clip, key="alarm", loop=True)         # alarm sound
+    handle.wait(5)
+
+Rules:
+- Priority order: safety > alarm > response > chatter. Within a priority,
+  FIFO. Sound clips (audio/speaker.Clip) queue like text, so the alarm
+  and speech never open the sound card at the same time.
+- Preemption: a message that outranks the one playing cuts it off.
+- Barge-in: barge_in() (wired to the wake word) stops the current reply
+  and drops queued responses/chatter; safety and alarm items are never
+  dropped.
+- Supersession: a message with the same `key` replaces the queued one
+  ("Battery 20%" is pointless once "Battery 15%" is queued).
+- Staleness: responses and chatter older than SPEECH_MAX_AGE_* by the
+  time they would play are dropped instead of spoken late.
+"""
+
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+PRIORITIES = {"safety": 0, "alarm": 1, "response": 2, "chatter": 3}
+
+# Priorities barge_in() leaves alone
+BARGE_IN_KEEPS = ("safety", "alarm")
+
+# Final states of a SpeechHandle
+SPOKEN = "spoken"
+PREEMPTED = "preempted"
+CANCELLED = "cancelled"
+SUPERSEDED = "superseded"
+STALE = "stale"
+FAILED = "failed"       # the speaker raised; `error` says why
+
+
+class SpeechHandle:
+    """Returned by SpeechOutput.say()/play(); lets the caller wait or cancel."""
+
+    def __init__(self, output, text, priority, key, deadline, on_audio=None, clip=None, loop=False):
+        self.text = text
+        self.clip = clip          # Clip to play instead of speaking `text`
+        self.loop = loop
+        self.priority = priority
+        self.key = key
+        self.created = time.monotonic()
+        self.deadline = deadline  # monotonic time after which it is stale (None = never)
+        self.state = "queued"
+        self.started = None       # monotonic time playback began
+        self.on_audio = on_audio  # callback(monotonic time) at the first audio chunk
+        self.error = None         # speaker exception text when the state is FAILED
+        self._output = output
+        self._done = threading.Event()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """True once the message reached a final state."""
+        return self._done.wait(timeout)
+
+    def cancel(self):
+        self._output.cancel(self)
+
+    def _finish(self, state):
+        if not self._done.is_set():
+            self.state = state
+            self._done.set()
+
+    def __repr__(self):
+        return f"SpeechHandle({self.text!r}, {self.priority}, {self.state})"
+
+
+class SpeechOutput(threading.Thread):
+    """
+    Speech service in front of a speaker with say(text, cancel=event,
+    on_audio=callback) and play(clip, cancel=event, on_audio=callback,
+    loop=bool).
+
+    The speaker must stop playing soon after `cancel` is set; that is how
+    preemption, barge-in and cancel() cut off the message being spoken.
+    """
+
+    def __init__(self, speaker):
+        super().__init__(daemon=True, name="speech-output")
+        self.speaker = speaker
+        self.max_age = {
+            "safety": None,
+            "alarm": None,
+            "response": settings.SPEECH_MAX_AGE_RESPONSE,
+            "chatter": settings.SPEECH_MAX_AGE_CHATTER
+        }
+        self.stats = {SPOKEN: 0, PREEMPTED: 0, CANCELLED: 0, SUPERSEDED: 0, STALE: 0, FAILED: 0}
+
+        self._heap = []
+        self._seq = itertools.count()
+        self._current = None
+        self._cond = threading.Condition()
+        self._stopped = False
+
+    # =========================
+    # PRODUCER API
+    # =========================
+    def say(self, text, priority="response", key=None, on_audio=None):
+        """Enqueue `text`; never blocks. Returns a SpeechHandle."""
+        return self._enqueue(text, priority, key, on_audio)
+
+    def play(self, clip, priority="alarm", key=None, on_audio=None, loop=False):
+        """Enqueue a Clip; with loop=True it repeats until cancelled or preempted."""
+        return self._enqueue(clip.name, priority, key, on_audio, clip=clip, loop=loop)
+
+    def _enqueue(self, text, priority, key, on_audio, clip=None, loop=False):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown speech priority '{priority}'")
+        max_age = self.max_age[priority]
+        deadline = time.monotonic() + max_age if max_age is not None else None
+        handle = SpeechHandle(self, text, priority, key, deadline, on_audio, clip, loop)
+
+        with self._cond:
+            if key is not None:
+                for _, _, queued in self._heap:
+                    if queued.key == key and not queued.done:
+                        self._finish(queued, SUPERSEDED)
+            heapq.heappush(self._heap, (PRIORITIES[priority], next(self._seq), handle))
+
+            current = self._current
+            if current is not None and (
+                PRIORITIES[priority] < PRIORITIES[current.priority]
+                or (key is not None and current.key == key)
+            ):
+                self._finish(current, PREEMPTED)
+            self._cond.notify()
+        return handle
+
+    def cancel(self, handle):
+        with self._cond:
+            self._finish(handle, CANCELLED)
+
+    def barge_in(self):
+        """The user started talking: silence everything except safety and alarms."""
+        with self._cond:
+            for _, _, queued in self._heap:
+                if queued.priority not in BARGE_IN_KEEPS:
+                    self._finish(queued, CANCELLED)
+            current = self._current
+            if current is not None and current.priority not in BARGE_IN_KEEPS:
+                self._finish(current, CANCELLED)
+
+    def speaking(self):
+        """The handle being played, or None."""
+        return self._current
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            for _, _, queued in self._heap:
+                self._finish(queued, CANCELLED)
+            self._heap = []
+            if self._current is not None:
+                self._finish(self._current, CANCELLED)
+            self._cond.notify()
+
+    # =========================
+    # OUTPUT THREAD
+    # =========================
+    def _finish(self, handle, state):
+        """Move a handle to a final state (condition lock held)."""
+        if not handle.done:
+            handle._finish(state)
+            self.stats[state] += 1
+
+    def _next(self):
+        """Pop the next playable handle, dropping finished and stale ones."""
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                while self._heap:
+                    _, _, handle = heapq.heappop(self._heap)
+                    if handle.done:
+                        continue
+                    if handle.deadline is not None and now > handle.deadline:
+                        self._finish(handle, STALE)
+                        continue
+                    handle.state = "playing"
+                    handle.started = now
+                    self._current = handle
+                    return handle
+                self._cond.wait()
+            return None
+
+    def run(self):
+        while True:
+            handle = self._next()
+            if handle is None:
+                return
+            state = SPOKEN
+            try:
+                if handle.clip is not None:
+                    self.speaker.play(handle.clip, cancel=handle._done,
+                                      on_audio=handle.on_audio, loop=handle.loop)
+                else:
+                    self.speaker.say(handle.text, cancel=handle._done, on_audio=handle.on_audio)
+            except Exception as e:
+                print(f"[SpeechOutput] Speaker error: {e}")
+                handle.error = str(e)
+                state = FAILED
+            with self._cond:
+                self._current = None
+                self._finish(handle, state)
@@ -0,0 +1,367 @@
+"""
+stt.py - Speech-to-text backends.
+
+All backends take 16 kHz mono int16 PCM and share one interface:
+
+    backend.load()            # once at startup (model loading, clients)
+    backend.start()           # begin an utterance
+    backend.accept(pcm)       # feed audio as it arrives -> partial text / None
+    backend.finish()          # end of utterance -> final text / None
+    backend.transcribe(pcm)   # start + accept + finish for a whole utterance
+    backend.spawn()           # second instance for concurrent use, shares models
+
+StreamingDecoder runs start/accept/finish on its own thread while the
+utterance is being spoken (capture feeds it frame by frame), so only the
+final decode is left when the speaker stops.
+
+Backends:
+- VoskBackend   : offline, streaming (local Kaldi model)
+- GoogleBackend : cloud (speech_recognition.recognize_google), buffered
+- StubBackend   : deterministic scripted results for tests / dev
+- FallbackBackend(primary, fallback): uses fallback only when primary fails
+
+Failures that mean "this backend cannot answer" raise STTError; silence or
+unintelligible speech is simply None.
+"""
+
+import abc
+import json
+import os
+import queue
+import sys
+import threading
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+
+class STTError(Exception):
+    """The backend is unavailable (no model, no network, ...)."""
+
+
+class STTBackend(abc.ABC):
+    name = "base"
+
+    def load(self):
+        """Load models / clients. Safe to call more than once."""
+
+    @abc.abstractmethod
+    def start(self):
+        """Begin an utterance."""
+
+    @abc.abstractmethod
+    def accept(self, pcm):
+        """Feed audio; partial text or None."""
+
+    @abc.abstractmethod
+    def finish(self):
+        """End the utterance; final text or None."""
+
+    def transcribe(self, pcm):
+        self.start()
+        self.accept(pcm)
+        return self.finish()
+
+    def spawn(self):
+        """An independent instance (own utterance state); loaded models are shared."""
+        return type(self)()
+
+
+class VoskBackend(STTBackend):
+    """Offline streaming recognizer; the model is loaded once."""
+
+    name = "vosk"
+
+    def __init__(self, model_path=None):
+        self.model_path = model_path or settings.STT_MODEL_PATH
+        if not os.path.isabs(self.model_path):
+            self.model_path = os.path.join(project_root, self.model_path)
+        self._model = None
+        self._recognizer = None
+        self._segments = []
+
+    def load(self):
+        if self._model is not None:
+            return
+        try:
+            import vosk
+        except ImportError as e:
+            raise STTError(f"vosk not installed: {e}")
+        if not os.path.isdir(self.model_path):
+            raise STTError(f"Vosk model not found at {self.model_path}")
+
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        self._model = vosk.Model(self.model_path)
+
+    def start(self):
+        self.load()
+        self._recognizer = self._vosk.KaldiRecognizer(self._model, SAMPLE_RATE)
+        self._segments = []
+
+    def spawn(self):
+        other = VoskBackend(self.model_path)
+        if self._model is not None:
+            other._vosk, other._model = self._vosk, self._model
+        return other
+
+    def accept(self, pcm):
+        if self._recognizer is None:
+            self.start()
+        if self._recognizer.AcceptWaveform(pcm):
+            # Vosk finalized a segment; keep it, the utterance continues
+            text = json.loads(self._recognizer.Result()).get("text")
+            if text:
+                self._segments.append(text)
+            partial = ""
+        else:
+            partial = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        return " ".join(self._segments + [partial]).strip() or None
+
+    def finish(self):
+        if self._recognizer is None:
+            return None
+        text = json.loads(self._recognizer.FinalResult()).get("text", "")
+        self._recognizer = None
+        return " ".join(self._segments + [text]).strip() or None
+
+
+class GoogleBackend(STTBackend):
+    """Cloud recognizer. Not streaming: audio is buffered until finish()."""
+
+    name = "google"
+
+    def __init__(self):
+        self._recognizer = None
+        self._buffer = bytearray()
+
+    def load(self):
+        if self._recognizer is None:
+            try:
+                import speech_recognition as sr
+            except ImportError as e:
+                raise STTError(f"speech_recognition not installed: {e}")
+            self._sr = sr
+            self._recognizer = sr.Recognizer()
+
+    def start(self):
+        self.load()
+        self._buffer = bytearray()
+
+    def spawn(self):
+        other = GoogleBackend()
+        if self._recognizer is not None:
+            other._sr, other._recognizer = self._sr, self._recognizer
+        return other
+
+    def accept(self, pcm):
+        self._buffer.extend(pcm)
+        return None
+
+    def finish(self):
+        self.load()
+        audio = self._sr.AudioData(bytes(self._buffer), SAMPLE_RATE, SAMPLE_WIDTH)
+        self._buffer = bytearray()
+        try:
+            return self._recognizer.recognize_google(audio) or None
+        except self._sr.UnknownValueError:
+            return None
+        except self._sr.RequestError as e:
+            raise STTError(str(e))
+
+
+class StubBackend(STTBackend):
+    """
+    Deterministic backend for tests.
+
+    Returns the scripted results in order (cycling), regardless of audio.
+    A script entry of None simulates unintelligible speech, an Exception
+    instance is raised as-is. Spawned instances (the streaming decoder)
+    have their own buffer but take results from, and record `calls` and
+    `received` on, the stub they were spawned from.
+    """
+
+    name = "stub"
+
+    def __init__(self, script=None):
+        self.script = list(script or [])
+        self.calls = 0
+        self.received = []  # bytes per utterance, for assertions
+        self._buffer = bytearray()
+        self._owner = self
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._buffer = bytearray()
+
+    def spawn(self):
+        other = StubBackend(self.script)
+        other._owner = self._owner
+        return other
+
+    def accept(self, pcm):
+        self._buffer.extend(pcm)
+        return None
+
+    def finish(self):
+        owner = self._owner
+        with owner._lock:
+            owner.received.append(bytes(self._buffer))
+            if not owner.script:
+                return None
+            result = owner.script[owner.calls % len(owner.script)]
+            owner.calls += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class FallbackBackend(STTBackend):
+    """Primary backend with an optional fallback used only on STTError."""
+
+    def __init__(self, primary, fallback=None):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = primary.name if fallback is None else f"{primary.name}+{fallback.name}"
+        self._primary_ok = True
+        self._buffer = bytearray()
+
+    def load(self):
+        try:
+            self.primary.load()
+        except STTError as e:
+            if self.fallback is None:
+                raise
+            print(f"[STT] {self.primary.name} unavailable ({e}) - using {self.fallback.name}")
+            self._primary_ok = False
+            self.fallback.load()
+
+    def start(self):
+        self._buffer = bytearray()
+        if self._primary_ok:
+            self.primary.start()
+
+    def spawn(self):
+        other = FallbackBackend(self.primary.spawn(),
+                                self.fallback.spawn() if self.fallback is not None else None)
+        other._primary_ok = self._primary_ok
+        return other
+
+    def accept(self, pcm):
+        if self.fallback is not None:
+            self._buffer.extend(pcm)  # kept in case the primary fails
+        if not self._primary_ok:
+            return None
+        try:
+            return self.primary.accept(pcm)
+        except STTError:
+            return None
+
+    def finish(self):
+        if self._primary_ok:
+            try:
+                return self.primary.finish()
+            except STTError as e:
+                if self.fallback is None:
+                    raise
+                print(f"[STT] {self.primary.name} failed ({e}) - trying {self.fallback.name}")
+        if self.fallback is None:
+            return None
+        return self.fallback.transcribe(bytes(self._buffer))
+
+
+class StreamingDecoder(threading.Thread):
+    """
+    Decodes an utterance while it is spoken.
+
+    The capture thread calls begin() at speech onset, feed(frame) for each
+    frame and end(utterance, deliver) at hangover (or cancel() if the
+    utterance is discarded). The backend runs on this thread, so capture
+    never waits for it; deliver(utterance) is called with utterance.text
+    set once finish() returns. If the backend fails, the utterance is
+    delivered undecoded and the receiver transcribes it itself.
+    """
+
+    def __init__(self, backend):
+        super().__init__(daemon=True, name="stt-stream")
+        self.backend = backend
+        self.partial = None  # latest partial text of the open utterance
+        self._events = queue.Queue()
+        self._active = False
+
+    def begin(self):
+        self._events.put(("begin", None))
+
+    def feed(self, pcm):
+        self._events.put(("audio", pcm))
+
+    def end(self, utterance, deliver):
+        self._events.put(("end", (utterance, deliver)))
+
+    def cancel(self):
+        self._events.put(("cancel", None))
+
+    def stop(self):
+        self._events.put(None)
+
+    def run(self):
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            kind, payload = event
+            if kind == "end":
+                utterance, deliver = payload
+                self._finish(utterance)
+                deliver(utterance)
+                continue
+            try:
+                if kind == "begin":
+                    self.partial = None
+                    self.backend.start()
+                    self._active = True
+                elif kind == "audio" and self._active:
+                    self.partial = self.backend.accept(payload)
+                elif kind == "cancel" and self._active:
+                    self._active = False
+                    self.backend.finish()
+            except Exception as e:
+                print(f"[STT] Streaming decode failed: {e}")
+                self._active = False
+
+    def _finish(self, utterance):
+        if not self._active:
+            return
+        self._active = False
+        try:
+            utterance.text = self.backend.finish()
+            utterance.decoded = True
+        except Exception as e:
+            print(f"[STT] Streaming decode failed: {e}")
+
+
+def create_backend(name=None):
+    """
+    Build the configured backend (settings.STT_BACKEND).
+
+    The cloud recognizer is added as a fallback when STT_CLOUD_FALLBACK is on.
+    """
+    name = name or settings.STT_BACKEND
+    backends = {
+        "vosk": VoskBackend,
+        "google": GoogleBackend,
+        "stub": StubBackend,
+    }
+    if name not in backends:
+        raise ValueError(f"Unknown STT backend '{name}'")
+
+    primary = backends[name]()
+    if name != "google" and settings.STT_CLOUD_FALLBACK:
+        return FallbackBackend(primary, GoogleBackend())
+    return FallbackBackend(primary)
@@ -0,0 +1,177 @@
+"""
+tts_cache.py - On-disk cache of synthesized speech.
+
+Entries are WAV files named by a hash of (engine, voice, text), so changing
+the TTS engine or voice never plays stale audio. The directory has a size
+cap; when it is exceeded the least recently *played* entries are evicted
+(a cache hit touches the file's mtime, which is what LRU order is rebuilt
+from at startup).
+
+Synthesis is pluggable; EspeakSynthesizer shells out to espeak-ng, which
+is fast, offline and available on Raspberry Pi OS.
+"""
+
+import collections
+import hashlib
+import io
+import os
+import subprocess
+import sys
+import threading
+import wave
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+
+class TTSError(Exception):
+    """The synthesizer could not produce audio."""
+
+
+class EspeakSynthesizer:
+    """espeak-ng -> WAV bytes (22050 Hz mono int16)."""
+
+    name = "espeak-ng"
+
+    def __init__(self, voice=None, speed=None, binary="espeak-ng"):
+        self.voice = voice or settings.TTS_VOICE
+        self.speed = speed or settings.TTS_SPEED
+        self.binary = binary
+
+    @property
+    def voice_key(self):
+        """Everything besides the text that changes the audio."""
+        return f"{self.voice}@{self.speed}"
+
+    def synthesize(self, text: str) -> bytes:
+        try:
+            result = subprocess.run(
+                [self.binary, "--stdout", "-v", self.voice, "-s", str(self.speed), text],
+                capture_output=True,
+                timeout=10
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise TTSError(f"{self.binary} failed: {e}")
+        if result.returncode != 0 or not result.stdout:
+            raise TTSError(f"{self.binary} exited with {result.returncode}")
+        return result.stdout
+
+
+def read_wav_bytes(data: bytes):
+    """WAV bytes -> (pcm, sample_rate, channels, sample_width)."""
+    with wave.open(io.BytesIO(data), "rb") as w:
+        return w.readframes(w.getnframes()), w.getframerate(), w.getnchannels(), w.getsampwidth()
+
+
+class TTSCache:
+    """
+    Size-capped LRU cache of WAV files.
+
+    Thread-safe: the pre-render thread and the speaker share one instance.
+    """
+
+    def __init__(self, directory=None, max_bytes=None, engine="espeak-ng", voice=""):
+        directory = directory or settings.TTS_CACHE_DIR
+        if not os.path.isabs(directory):
+            directory = os.path.join(project_root, directory)
+        self.directory = directory
+        self.max_bytes = settings.TTS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.engine = engine
+        self.voice = voice
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # key -> size, oldest first
+        self._size = 0
+        self._load_index()
+
+    def _load_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".wav"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            found.append((st.st_mtime, name[:-4], st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+        self._evict()  # max_bytes may have been lowered since last run
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)."""
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            old, size = self._entries.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(old))
+            except OSError:
+                pass
+
+    def key(self, text: str) -> str:
+        raw = f"{self.engine}\0{self.voice}\0{text}".encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".wav")
+
+    def __contains__(self, text):
+        with self._lock:
+            return self.key(text) in self._entries
+
+    @property
+    def size(self):
+        return self._size
+
+    def get(self, text: str):
+        """Cached WAV bytes for `text`, or None. Marks the entry as recently used."""
+        key = self.key(text)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            with self._lock:
+                self._size -= self._entries.pop(key, 0)
+            return None
+
+    def put(self, text: str, data: bytes):
+        """Store WAV bytes (write-then-rename) and evict down to max_bytes."""
+        key = self.key(text)
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
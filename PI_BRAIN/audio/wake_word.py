@@ -0,0 +1,330 @@
+"""
+wake_word.py - Local wake-word spotting (no network).
+
+Pipeline per utterance (16 kHz mono int16 PCM):
+    1. Energy gate   : reject near-silence before computing anything
+    2. MFCC frames   : 25 ms windows / 10 ms hop, NumPy only
+    3. Keyword model : pluggable; scores the utterance and reports where
+                       the keyword ends so only the audio AFTER it is sent
+                       to speech-to-text
+
+The default model (TemplateKeywordModel) matches enrolled recordings of
+"hey panda" with subsequence DTW. Any object with the KeywordModel
+interface can be passed to WakeWordDetector instead.
+
+NumPy is optional for the rest of the audio stack: without it this module
+still imports (EnergyGate thresholds and pcm_rms() are pure Python), but
+WakeWordDetector.from_settings() returns None and the receiver falls back
+to the speech-to-text wake-word check.
+"""
+
+import abc
+import array
+import math
+import os
+import sys
+import wave
+
+try:
+    import numpy as np
+except ImportError:  # NumPy missing - no local spotting, see from_settings()
+    np = None
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+SAMPLE_RATE = 16000
+FRAME_LEN = 400      # 25 ms
+FRAME_HOP = 160      # 10 ms
+N_FFT = 512
+N_MELS = 26
+N_MFCC = 13
+
+
+# =========================
+# PCM HELPERS
+# =========================
+def pcm_to_array(pcm):
+    """int16 little-endian bytes -> float32 array in [-1, 1)."""
+    return np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def pcm_rms(pcm):
+    """RMS level (0..1) of int16 little-endian bytes, without NumPy."""
+    samples = array.array("h", pcm[:len(pcm) - len(pcm) % 2])
+    if not samples:
+        return 0.0
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return math.sqrt(sum(s * s for s in samples) / len(samples)) / 32768.0
+
+
+def read_wav(path):
+    """
+    Load a WAV file as 16 kHz mono float32.
+
+    Only 16-bit PCM is supported; other rates are resampled linearly.
+    """
+    with wave.open(path, "rb") as w:
+        if w.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV is supported")
+        rate = w.getframerate()
+        channels = w.getnchannels()
+        data = pcm_to_array(w.readframes(w.getnframes()))
+
+    if channels > 1:
+        data = data.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE and len(data):
+        duration = len(data) / rate
+        target = np.linspace(0, len(data) - 1, int(duration * SAMPLE_RATE))
+        data = np.interp(target, np.arange(len(data)), data).astype(np.float32)
+    return data
+
+
+def rms(signal):
+    """Root-mean-square level of a float signal (0..1)."""
+    if len(signal) == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(signal * signal)))
+
+
+# =========================
+# ENERGY GATE
+# =========================
+class EnergyGate:
+    """
+    Frame-level energy VAD.
+
+    An utterance passes when at least `min_speech_frames` 20 ms frames are
+    above `threshold` (RMS, 0..1 full scale).
+    """
+
+    FRAME = 320  # 20 ms at 16 kHz
+
+    def __init__(self, threshold=None, min_speech_frames=None):
+        self.threshold = settings.VAD_ENERGY_THRESHOLD if threshold is None else threshold
+        self.min_speech_frames = (settings.VAD_MIN_SPEECH_FRAMES
+                                  if min_speech_frames is None else min_speech_frames)
+
+    def frame_levels(self, signal):
+        usable = len(signal) - len(signal) % self.FRAME
+        if usable <= 0:
+            return np.zeros(0, dtype=np.float32)
+        frames = signal[:usable].reshape(-1, self.FRAME)
+        return np.sqrt(np.mean(frames * frames, axis=1))
+
+    def is_speech(self, frame):
+        """Single-frame decision (used by streaming capture)."""
+        return rms(frame) >= self.threshold
+
+    def passes(self, signal):
+        return int(np.count_nonzero(self.frame_levels(signal) >= self.threshold)) \
+            >= self.min_speech_frames
+
+
+# =========================
+# MFCC
+# =========================
+_MEL_FILTERS = None
+_DCT = None
+_WINDOW = None
+
+
+def _hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _mel_to_hz(mel):
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+
+def _init_tables():
+    """Build the mel filterbank, DCT matrix and window once."""
+    global _MEL_FILTERS, _DCT, _WINDOW
+
+    mels = np.linspace(_hz_to_mel(20.0), _hz_to_mel(SAMPLE_RATE / 2), N_MELS + 2)
+    bins = np.floor((N_FFT + 1) * _mel_to_hz(mels) / SAMPLE_RATE).astype(int)
+
+    filters = np.zeros((N_MELS, N_FFT // 2 + 1), dtype=np.float32)
+    for m in range(1, N_MELS + 1):
+        left, center, right = bins[m - 1], bins[m], bins[m + 1]
+        for k in range(left, center):
+            filters[m - 1, k] = (k - left) / max(center - left, 1)
+        for k in range(center, right):
+            filters[m - 1, k] = (right - k) / max(right - center, 1)
+
+    n = np.arange(N_MELS)
+    dct = np.cos(np.pi / N_MELS * (n[None, :] + 0.5) * np.arange(N_MFCC)[:, None])
+
+    _MEL_FILTERS = filters.T                     # (bins, mels)
+    _DCT = dct.astype(np.float32).T              # (mels, mfcc)
+    _WINDOW = np.hamming(FRAME_LEN).astype(np.float32)
+
+
+def mfcc(signal):
+    """
+    MFCC features with per-utterance mean normalization.
+
+    Returns:
+        numpy.ndarray: (frames, N_MFCC - 1) float32; c0 (energy) is dropped
+    """
+    if _MEL_FILTERS is None:
+        _init_tables()
+
+    if len(signal) < FRAME_LEN:
+        return np.zeros((0, N_MFCC - 1), dtype=np.float32)
+
+    emphasized = np.append(signal[0], signal[1:] - 0.97 * signal[:-1])
+    count = 1 + (len(emphasized) - FRAME_LEN) // FRAME_HOP
+    index = np.arange(FRAME_LEN)[None, :] + FRAME_HOP * np.arange(count)[:, None]
+    frames = emphasized[index] * _WINDOW
+
+    power = np.abs(np.fft.rfft(frames, N_FFT)) ** 2 / N_FFT
+    energies = np.log(power @ _MEL_FILTERS + 1e-10)
+    coeffs = (energies @ _DCT)[:, 1:]
+    return (coeffs - coeffs.mean(axis=0)).astype(np.float32)
+
+
+# =========================
+# KEYWORD MODELS
+# =========================
+class KeywordModel(abc.ABC):
+    """
+    Interface for wake-word models.
+
+    score(features) -> (score, end_frame)
+        score     : 0..1, higher means more likely the keyword
+        end_frame : MFCC frame index where the keyword ends
+    """
+
+    @abc.abstractmethod
+    def score(self, features):
+        """(score, end_frame) for an utterance's MFCC frames."""
+
+
+class TemplateKeywordModel(KeywordModel):
+    """
+    Subsequence DTW against enrolled keyword recordings.
+
+    The keyword may start and end anywhere in the utterance. Step pattern
+    (1,1), (1,2), (2,1) keeps the warp slope within [1/2, 2] and lets each
+    DTW column be computed as one vector operation.
+    """
+
+    def __init__(self, templates):
+        self.templates = [t for t in templates if len(t) >= 3]
+        if not self.templates:
+            raise ValueError("No usable wake-word templates")
+
+    @classmethod
+    def from_directory(cls, directory):
+        paths = sorted(
+            os.path.join(directory, n) for n in os.listdir(directory)
+            if n.lower().endswith(".wav")
+        )
+        return cls([mfcc(read_wav(p)) for p in paths])
+
+    @staticmethod
+    def _match(template, features):
+        """Best (normalized cost, end frame) of template inside features."""
+        m, n = len(template), len(features)
+        if n < m // 2:
+            return np.inf, 0
+
+        # Pairwise Euclidean distances (m, n)
+        cost = np.sqrt(np.maximum(
+            (template * template).sum(1)[:, None]
+            + (features * features).sum(1)[None, :]
+            - 2.0 * template @ features.T, 0.0))
+
+        inf = np.float32(np.inf)
+        prev2 = np.full(m, inf, dtype=np.float32)
+        prev1 = np.full(m, inf, dtype=np.float32)
+        last_row = np.empty(n, dtype=np.float32)
+
+        for j in range(n):
+            best = np.full(m, inf, dtype=np.float32)
+            best[1:] = np.minimum(prev1[:-1], prev2[:-1])   # (1,1) and (1,2)
+            best[2:] = np.minimum(best[2:], prev1[:-2])     # (2,1)
+            best[0] = 0.0                                   # free start
+            column = cost[:, j] + best
+            last_row[j] = column[-1]
+            prev2, prev1 = prev1, column
+
+        end = int(np.argmin(last_row))
+        return float(last_row[end]) / m, end
+
+    def score(self, features):
+        best_cost, best_end = np.inf, 0
+        for template in self.templates:
+            cost, end = self._match(template, features)
+            if cost < best_cost:
+                best_cost, best_end = cost, end
+        if not np.isfinite(best_cost):
+            return 0.0, 0
+        scale = settings.WAKE_WORD_DISTANCE_SCALE
+        return float(np.exp(-best_cost / scale)), best_end
+
+
+# =========================
+# DETECTOR
+# =========================
+class WakeWordDetector:
+    """Energy gate + MFCC + keyword model."""
+
+    def __init__(self, model, gate=None, threshold=None):
+        self.model = model
+        self.gate = gate or EnergyGate()
+        self.threshold = settings.WAKE_WORD_THRESHOLD if threshold is None else threshold
+        self.last_score = 0.0
+
+    @classmethod
+    def from_settings(cls):
+        """
+        Build the configured detector.
+
+        Returns:
+            WakeWordDetector or None if no model is available (or NumPy is not)
+        """
+        if np is None:
+            return None
+        directory = settings.WAKE_WORD_TEMPLATES_DIR
+        if not os.path.isabs(directory):
+            directory = os.path.join(project_root, directory)
+        if not os.path.isdir(directory):
+            return None
+        try:
+            return cls(TemplateKeywordModel.from_directory(directory))
+        except ValueError:
+            return None
+
+    def detect(self, signal):
+        """
+        Args:
+            signal: float32 16 kHz mono samples (see pcm_to_array)
+
+        Returns:
+            tuple: (detected: bool, end_sample: int) - end_sample is where
+                   the command audio starts when detected
+        """
+        self.last_score = 0.0
+        if not self.gate.passes(signal):
+            return False, 0
+
+        features = mfcc(signal)
+        if len(features) == 0:
+            return False, 0
+
+        score, end_frame = self.model.score(features)
+        self.last_score = score
+        if score < self.threshold:
+            return False, 0
+        return True, min(len(signal), (end_frame + 1) * FRAME_HOP + FRAME_LEN)
+
+    def detect_pcm(self, pcm):
+        """detect() for raw int16 PCM bytes; end is returned in BYTES."""
+        detected, end = self.detect(pcm_to_array(pcm))
+        return detected, end * 2
@@ -0,0 +1,100 @@
+"""
+wake_word_bench.py - Measure the local wake-word detector on recorded WAVs.
+
+Usage:
+    python audio/wake_word_bench.py --positives recordings/hey_panda \
+                                    --negatives recordings/other_speech
+
+Reports hit rate (positives detected), false accepts (negatives detected),
+the score distribution of both sets to help pick WAKE_WORD_THRESHOLD, and
+CPU seconds spent per second of audio.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from telemetry.stats import percentile_sorted
+from audio.wake_word import SAMPLE_RATE, WakeWordDetector, TemplateKeywordModel, read_wav
+
+
+def _wavs(directory):
+    if not directory:
+        return []
+    return sorted(
+        os.path.join(directory, n) for n in os.listdir(directory)
+        if n.lower().endswith(".wav")
+    )
+
+
+def run_set(detector, paths):
+    """Returns (detections, scores, cpu_seconds, audio_seconds)."""
+    detections, scores = 0, []
+    cpu = audio = 0.0
+    for path in paths:
+        signal = read_wav(path)
+        audio += len(signal) / SAMPLE_RATE
+
+        start = time.process_time()
+        detected, _ = detector.detect(signal)
+        cpu += time.process_time() - start
+
+        detections += int(detected)
+        scores.append(detector.last_score)
+    return detections, scores, cpu, audio
+
+
+def _describe(scores):
+    if not scores:
+        return "-"
+    ordered = sorted(scores)
+    mid = percentile_sorted(ordered, 50)
+    return f"min {ordered[0]:.3f}  median {mid:.3f}  max {ordered[-1]:.3f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wake-word detector benchmark")
+    parser.add_argument("--positives", help="Directory of WAVs containing the wake word")
+    parser.add_argument("--negatives", help="Directory of WAVs without the wake word")
+    parser.add_argument("--templates", help="Template directory (default: settings)")
+    parser.add_argument("--threshold", type=float, help="Override WAKE_WORD_THRESHOLD")
+    args = parser.parse_args(argv)
+
+    if args.templates:
+        detector = WakeWordDetector(TemplateKeywordModel.from_directory(args.templates))
+    else:
+        detector = WakeWordDetector.from_settings()
+    if detector is None:
+        print("[WakeBench] No wake-word model available (check WAKE_WORD_TEMPLATES_DIR)")
+        return 1
+    if args.threshold is not None:
+        detector.threshold = args.threshold
+
+    positives, negatives = _wavs(args.positives), _wavs(args.negatives)
+    hits, pos_scores, cpu_p, audio_p = run_set(detector, positives)
+    false_accepts, neg_scores, cpu_n, audio_n = run_set(detector, negatives)
+
+    cpu, audio = cpu_p + cpu_n, audio_p + audio_n
+    print("=" * 60)
+    print(f"Threshold      : {detector.threshold:.3f}")
+    if positives:
+        print(f"Hit rate       : {hits}/{len(positives)} ({100.0 * hits / len(positives):.1f}%)")
+        print(f"  scores       : {_describe(pos_scores)}")
+    if negatives:
+        print(f"False accepts  : {false_accepts}/{len(negatives)} "
+              f"({100.0 * false_accepts / len(negatives):.1f}%)")
+        print(f"  scores       : {_describe(neg_scores)}")
+    if audio:
+        print(f"CPU per audio s: {cpu / audio * 1000.0:.1f} ms "
+              f"({cpu:.2f}s CPU for {audio:.1f}s audio)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+wake_word_enroll.py - Record wake-word templates for the local detector.
+
+Usage:
+    python audio/wake_word_enroll.py                 # 5 x "hey panda" into the templates dir
+    python audio/wake_word_enroll.py --count 8 --device 2
+    python audio/wake_word_enroll.py --clear         # replace the existing templates
+
+Each take is cut by the capture VAD (audio/capture.py), trimmed to the
+frames above the energy gate and written as 16 kHz mono 16-bit WAV to
+WAKE_WORD_TEMPLATES_DIR, where WakeWordDetector.from_settings() finds it
+on the next start. Afterwards every template is scored against the others
+(leave-one-out), so a bad take shows up before it costs wake-ups; then
+tune WAKE_WORD_THRESHOLD with audio/wake_word_bench.py.
+"""
+
+import argparse
+import os
+import sys
+import wave
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from audio.wake_word import (SAMPLE_RATE, EnergyGate, TemplateKeywordModel, WakeWordDetector,
+                             mfcc, np, pcm_to_array, read_wav)
+
+# Frames of margin kept around the speech when trimming a take
+TRIM_MARGIN_FRAMES = 2
+
+
+def templates_dir(directory=None):
+    directory = directory or settings.WAKE_WORD_TEMPLATES_DIR
+    if not os.path.isabs(directory):
+        directory = os.path.join(project_root, directory)
+    return directory
+
+
+def trim(pcm, threshold):
+    """The part of `pcm` from the first to the last frame above `threshold`."""
+    gate = EnergyGate(threshold=threshold)
+    loud = np.flatnonzero(gate.frame_levels(pcm_to_array(pcm)) >= threshold)
+    if not len(loud):
+        return b""
+    first = max(0, loud[0] - TRIM_MARGIN_FRAMES) * gate.FRAME
+    last = (loud[-1] + 1 + TRIM_MARGIN_FRAMES) * gate.FRAME
+    return pcm[first * 2:last * 2]
+
+
+def write_wav(path, pcm):
+    """Write-then-rename, like the rest of the robot's files."""
+    tmp = path + ".tmp"
+    with wave.open(tmp, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(pcm)
+    os.replace(tmp, path)
+
+
+def _wavs(directory):
+    return sorted(
+        os.path.join(directory, n) for n in os.listdir(directory)
+        if n.lower().endswith(".wav")
+    )
+
+
+def _next_path(directory, prefix):
+    index = 1
+    while os.path.exists(os.path.join(directory, f"{prefix}_{index:02d}.wav")):
+        index += 1
+    return os.path.join(directory, f"{prefix}_{index:02d}.wav")
+
+
+def record(count, directory, phrase, device_index=None, timeout=8.0):
+    """Record `count` takes into `directory`. Returns the written paths."""
+    from audio.capture import CaptureStream
+
+    capture = CaptureStream(device_index=device_index)
+    capture.start()
+    if not capture.wait_ready(timeout=5):
+        print(f"❌ Microphone not available: {capture.error}")
+        return []
+
+    prefix = phrase.lower().replace(" ", "_")
+    min_bytes = int(settings.CAPTURE_MIN_SPEECH * SAMPLE_RATE) * 2
+    written = []
+    try:
+        while len(written) < count:
+            print(f"\n🎤 [{len(written) + 1}/{count}] Say \"{phrase}\"...")
+            utterance = capture.next_utterance(timeout=timeout)
+            if utterance is None:
+                print("   (nothing heard - try again)")
+                continue
+            pcm = trim(utterance.pcm, capture.gate.threshold)
+            if len(pcm) < min_bytes:
+                print("   (too short - try again)")
+                continue
+            path = _next_path(directory, prefix)
+            write_wav(path, pcm)
+            written.append(path)
+            print(f"   ✓ {os.path.basename(path)} ({len(pcm) / 2 / SAMPLE_RATE:.2f}s)")
+    finally:
+        capture.stop()
+    return written
+
+
+def check(directory):
+    """Score every template against the others; returns {path: score}."""
+    paths = _wavs(directory)
+    features = {path: mfcc(read_wav(path)) for path in paths}
+    scores = {}
+    for path in paths:
+        others = [f for p, f in features.items() if p != path]
+        try:
+            detector = WakeWordDetector(TemplateKeywordModel(others))
+        except ValueError:
+            break  # fewer than two usable templates
+        detector.detect(read_wav(path))
+        scores[path] = detector.last_score
+    return scores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record wake-word templates")
+    parser.add_argument("--count", type=int, default=5, help="Number of takes to record")
+    parser.add_argument("--phrase", default="hey panda", help="Phrase to prompt for")
+    parser.add_argument("--dir", help="Template directory (default: WAKE_WORD_TEMPLATES_DIR)")
+    parser.add_argument("--device", type=int, help="Input device index (default: MIC_DEVICE_INDEX)")
+    parser.add_argument("--clear", action="store_true", help="Delete the existing templates first")
+    parser.add_argument("--check-only", action="store_true",
+                        help="Only score the existing templates")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("❌ The local wake-word detector needs NumPy (pip install numpy)")
+        return 1
+
+    directory = templates_dir(args.dir)
+    os.makedirs(directory, exist_ok=True)
+    if not args.check_only:
+        if args.clear:
+            for path in _wavs(directory):
+                os.remove(path)
+        written = record(args.count, directory, args.phrase, args.device)
+        if not written:
+            return 1
+
+    scores = check(directory)
+    print("\n" + "=" * 60)
+    print(f"Templates in {directory}: {len(_wavs(directory))}")
+    if not scores:
+        print("⚠ Record at least two takes to check them against each other")
+    for path, score in scores.items():
+        flag = "" if score >= settings.WAKE_WORD_THRESHOLD else \
+            f"   ⚠ below WAKE_WORD_THRESHOLD ({settings.WAKE_WORD_THRESHOLD}) - consider re-recording"
+        print(f"  {os.path.basename(path):24} {score:.3f}{flag}")
+    print("=" * 60)
+    print("Tune WAKE_WORD_THRESHOLD with audio/wake_word_bench.py")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,10 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-import cv2
 from config import settings
+from core.lazy_import import lazy_module
+
+cv2 = lazy_module("cv2")  # imported when the first camera is opened
 
 class CameraManager:
     def __init__(self, source=None):
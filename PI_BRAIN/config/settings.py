@@ -3,6 +3,9 @@
 # --- Ultrasonic ---
 ULTRASONIC_INTERVAL = 0.1
 SAFE_DISTANCE_CM = 30
+ULTRASONIC_STALE_AFTER = 0.5   # seconds without a sample -> obstacle data unusable
+ULTRASONIC_SETTLE_TIME = 0.1   # triggers held low before the first ping (driver thread)
+ULTRASONIC_MAX_RANGE_CM = 400.0  # reported when the echo times out (nothing in range)
 LEFT_ULTRASONIC_SENSOR_TRIG_PIN = None
 LEFT_ULTRASONIC_SENSOR_ECHO_PIN = None
 RIGHT_ULTRASONIC_SENSOR_TRIG_PIN = None
@@ -10,14 +13,44 @@ RIGHT_ULTRASONIC_SENSOR_ECHO_PIN = None
 
 # --- Gas ---
 MQ9_INTERVAL = 5
-GAS_THRESHOLD = 300
-MQ9_SENSOR_PIN = None
+GAS_THRESHOLD = 300                # ppm CO
+GAS_HYSTERESIS_PPM = 50            # alarm clears below GAS_THRESHOLD - this
+MQ9_SENSOR_PIN = None              # digital comparator pin (fallback when no ADC)
+MQ9_SAMPLE_INTERVAL = 1.0          # seconds between oversampled bursts
+MQ9_OVERSAMPLE = 64                # ADC samples averaged per burst
+MQ9_STALE_AFTER = 5.0              # seconds
+
+# MQ-9 analog path (MCP3008 over SPI), opt-in: set MQ9_ADC_CHANNEL to the
+# channel the MQ-9 is wired to; None uses the comparator on MQ9_SENSOR_PIN
+MQ9_ADC_CHANNEL = None
+MCP3008_SPI_BUS = 0
+MCP3008_SPI_DEVICE = 0
+MQ9_ADC_MAX = 1023
+MQ9_ADC_FAULT_MARGIN = 3           # raw counts from 0 / full scale read as open / short circuit
+MQ9_LOAD_RESISTANCE_KOHM = 10.0    # RL on the module
+MQ9_R0_KOHM = 10.0                 # Rs in clean air / MQ9_CLEAN_AIR_RATIO (calibrate!)
+MQ9_CLEAN_AIR_RATIO = 9.6          # Rs/R0 in clean air (datasheet)
+MQ9_CURVE_A = 599.65               # CO: ppm = A * (Rs/R0)^B
+MQ9_CURVE_B = -2.244
 
 # --- GPS ---
 GPS_MODULE_PORT = None
+GPS_STALE_AFTER = 5.0           # seconds without a parsed sentence
+
+# --- DHT11 ---
+DHT11_STALE_AFTER = 10.0        # seconds (sensor is read every 2 s)
 
 # --- Scheduler ---
 SCHEDULER_INTERVAL = 60  # every minute
+ALARM_STORE_BACKEND = "json"    # "json" (config/scheduler.json) or "sqlite"
+ALARM_STORE_PATH = None         # None = backend default, relative to PI_BRAIN/
+ALARM_SNOOZE_MINUTES = 9        # default snooze length
+ALARM_MAX_RING = 300.0          # seconds an unanswered alarm rings before it stops by itself
+ALARM_MIXER_RATE = 44100        # Hz the alarm sound is decoded to
+ALARM_MIXER_BUFFER = 512        # mixer buffer in frames (pygame default is 4096+)
+ALARM_CATCHUP_WINDOW = 300.0    # seconds late an alarm still rings (stall, suspend, restart)
+ALARM_CLOCK_JUMP = 2.0          # wall-clock step (s) treated as a clock change, not drift
+ALARM_FIRED_LOG_PATH = "cache/alarm_fired.json"  # relative to PI_BRAIN/
 
 # --- LCD ---
 LCD_INTERVAL = 0.5
@@ -39,3 +72,85 @@ RED_DETECT_LOWER_1 = (0, 120, 70)
 RED_DETECT_UPPER_1 = (10, 255, 255)
 RED_DETECT_LOWER_2 = (170, 120, 70)
 RED_DETECT_UPPER_2 = (180, 255, 255)
+
+# --- Hardware validation ---
+VALIDATION_WORKERS = 4               # checks running at once
+VALIDATION_TIMEOUT = 5.0             # seconds a check may take before it counts as failed
+VALIDATION_TIMEOUTS = {              # per-check overrides
+    "camera": 8.0,                   # open + auto-exposure + first frame
+    "microphone": 5.0,
+}
+SENSOR_READY_TIMEOUT = 3.0           # sensor checks wait this long for a first valid sample
+SENSOR_READY_TIMEOUTS = {            # per-sensor overrides
+    "gps": 1.0,                      # a fix can take minutes; don't hold up boot for it
+}
+VALIDATION_CACHE_PATH = "cache/validation.json"
+VALIDATION_CACHE_TTL = 600.0         # seconds a passed full validation covers warm restarts (0 = always cold)
+
+# --- Telemetry ---
+TELEMETRY_ENABLED = True
+TELEMETRY_DIR = "logs/telemetry"               # relative to PI_BRAIN/
+TELEMETRY_SEGMENT_MAX_BYTES = 8 * 1024 * 1024  # rotate after 8 MB
+TELEMETRY_SEGMENT_MAX_AGE = 3600               # or after one hour (seconds)
+TELEMETRY_FLUSH_INTERVAL = 1.0                 # seconds
+TELEMETRY_QUEUE_SIZE = 2048                    # ticks buffered before dropping
+
+# --- Audio / Wake word ---
+MIC_SAMPLE_RATE = 16000
+VAD_ENERGY_THRESHOLD = 0.01          # frame RMS (0..1 full scale) counted as speech
+VAD_MIN_SPEECH_FRAMES = 10           # 20 ms frames of speech needed to consider a phrase
+WAKE_WORD_TEMPLATES_DIR = "audio/wake_word_templates"  # enrolled "hey panda" WAVs
+WAKE_WORD_THRESHOLD = 0.5            # 0..1, tune with audio/wake_word_bench.py
+WAKE_WORD_DISTANCE_SCALE = 12.0      # DTW cost -> score scaling
+
+# --- Speech-to-text ---
+STT_BACKEND = "vosk"                 # "vosk" (offline), "google" (cloud) or "stub"
+STT_MODEL_PATH = "models/vosk-model-small-en-us-0.15"  # relative to PI_BRAIN/
+STT_CLOUD_FALLBACK = True            # use Google STT only when the offline engine fails
+STT_STREAMING = True                 # decode while the user speaks (capture feeds the recognizer)
+
+# --- Microphone capture (persistent stream) ---
+MIC_DEVICE_INDEX = None              # None = default input device
+CAPTURE_FRAME_MS = 20                # VAD frame size
+CAPTURE_START_FRAMES = 3             # consecutive speech frames that open an utterance
+CAPTURE_PRE_ROLL = 0.3               # seconds of audio kept before speech onset
+CAPTURE_HANGOVER = 0.6               # seconds of silence that close an utterance
+CAPTURE_MAX_UTTERANCE = 8.0          # seconds
+CAPTURE_MIN_SPEECH = 0.2             # seconds of speech frames for a valid utterance
+CAPTURE_RING_SECONDS = 10.0          # raw audio history kept in memory
+CAPTURE_QUEUE_SIZE = 8               # utterances waiting for recognition
+CAPTURE_ECHO_TAIL = 0.3              # seconds after our own speech still treated as echo
+COMMAND_TIMEOUT = 5.0                # seconds to wait for a command after the wake word
+SESSION_TIMEOUT = 10.0               # seconds a voice session stays open after a command
+AUDIO_STAGE_QUEUE_SIZE = 4           # bounded queue between audio pipeline stages
+
+# --- Ambient noise tracking (adaptive VAD threshold) ---
+NOISE_TRACKING = True                # False = fixed VAD_ENERGY_THRESHOLD
+NOISE_CALIBRATION_PATH = "cache/noise_floor.json"  # last floors, relative to PI_BRAIN/
+NOISE_WINDOW = 5.0                   # seconds of frame levels in the sliding window
+NOISE_MIN_WINDOW = 1.0               # seconds of data before a floor is trusted
+NOISE_UPDATE_INTERVAL = 0.5          # seconds between threshold updates
+NOISE_FLOOR_PERCENTILE = 20          # low percentile of frame levels = noise floor
+NOISE_THRESHOLD_RATIO = 3.0          # speech threshold = floor * ratio (~ +10 dB)
+NOISE_THRESHOLD_MIN = 0.005
+NOISE_THRESHOLD_MAX = 0.2
+NOISE_SAVE_INTERVAL = 60.0           # seconds between calibration saves
+
+# --- Voice intents ---
+INTENT_FUZZY_ENABLED = True          # n-gram fallback when no keyword matches
+INTENT_FUZZY_THRESHOLD = 0.5         # cosine similarity needed to accept a fuzzy match
+
+# --- Speech output (TTS) ---
+TTS_VOICE = "en-us"                  # espeak-ng voice
+TTS_SPEED = 150                      # words per minute
+TTS_CACHE_DIR = "cache/tts"          # rendered WAVs, relative to PI_BRAIN/
+TTS_CACHE_MAX_BYTES = 16 * 1024 * 1024  # least recently played entries evicted above this
+TTS_PRERENDER = True                 # render all static replies in the background at startup
+TTS_FRAGMENT_GAP = 0.05              # seconds of silence between joined fragments
+SPEAKER_DEVICE_INDEX = None          # None = default output device
+SPEECH_MAX_AGE_RESPONSE = 5.0        # seconds a queued reply may wait before it is dropped
+SPEECH_MAX_AGE_CHATTER = 3.0         # same for low-priority chatter (safety never expires)
+
+# --- Voice latency log ---
+LATENCY_LOG_ENABLED = True
+LATENCY_LOG_PATH = "logs/latency/voice_latency.jsonl"  # relative to PI_BRAIN/
@@ -13,7 +13,7 @@ Responsibilities:
 NOT responsible for:
 - GPIO initialization (handled by startup.py)
 - Speed limits (handled by MovementController)
-- Threading (handled by AudioManager)
+- Threading (handled by AudioManager / SpeechOutput)
 - Error recovery (handled by callers)
 """
 
@@ -22,18 +22,20 @@ _serial = None
 _speaker = None
 _lcd = None
 _shift_register = None
+_speech = None  # SpeechOutput queue in front of _speaker
 
 
-def bind_hardware(serial=None, speaker=None, lcd=None, shift_register=None):
+def bind_hardware(serial=None, speaker=None, lcd=None, shift_register=None, speech=None):
     """
     Inject hardware interfaces.
     Called once by startup.py after hardware initialization.
     """
-    global _serial, _speaker, _lcd, _shift_register
+    global _serial, _speaker, _lcd, _shift_register, _speech
     _serial = serial
     _speaker = speaker
     _lcd = lcd
     _shift_register = shift_register
+    _speech = speech
 
 
 # =============================================================================
@@ -116,6 +118,50 @@ def speaker_say(text: str):
         pass
 
 
+def talk(text: str, priority: str = "response", key=None, on_audio=None):
+    """
+    Queue text for speaking (non-blocking).
+    
+    Args:
+        text: Text to speak
+        priority: "safety", "response" or "chatter"
+        key: Optional; a newer message with the same key replaces this one
+        on_audio: Optional callback(monotonic_time) when the first audio plays
+    
+    Returns:
+        SpeechHandle or None if no speech output is bound
+    """
+    if _speech is None:
+        return None
+    
+    try:
+        return _speech.say(text, priority=priority, key=key, on_audio=on_audio)
+    except Exception:
+        return None
+
+
+def speaking() -> bool:
+    """True while the speech output is speaking text (sound clips such as the alarm don't count)."""
+    if _speech is None:
+        return False
+    handle = _speech.speaking()
+    return handle is not None and handle.clip is None
+
+
+def talk_barge_in():
+    """
+    Silence current and queued replies (the user started speaking).
+    Safety messages keep playing.
+    """
+    if _speech is None:
+        return
+    
+    try:
+        _speech.barge_in()
+    except Exception:
+        pass
+
+
 def speaker_beep():
     """
     Play short beep sound.
@@ -0,0 +1,267 @@
+"""
+boot_bench.py - Boot-to-ready times of RobotSystem.initialize().
+
+Usage:
+    python core/boot_bench.py                            # 5 boots under dev_mocks
+    python core/boot_bench.py --runs 20 --json boot.json
+    python core/boot_bench.py --no-vision                # e.g. CI without a camera
+    python core/boot_bench.py --budget 4000              # exit 1 if p95 > 4 s
+    python core/boot_bench.py --warm                     # boots after the first are warm
+
+Every boot is a fresh interpreter (dev_mocks installed, imports timed with
+core/lazy_import.py), so import costs count as they do on a real start.
+A boot records:
+  - imports_ms: interpreter start of the run until startup is importable
+  - the duration of each initialize() phase (RobotSystem.boot_timeline():
+    gpio, sensors, speaker, alarms, validation, vision_start, vision_ready,
+    decision, telemetry, audio, ready)
+  - first_valid_ms: first valid sample of each sensor, from the start of
+    initialize() (null if it never came within --sensor-wait; the summary
+    counts those per sensor under "first_valid_missing")
+  - the slowest imports and the lazy module loads
+  - validation: "cold" or "warm" (see core/validation_cache.py)
+
+dev_mocks simulates the HC-SR04 echoes, so validation runs and passes
+under the mocks; --no-vision also skips the camera check.
+
+Boots use a scratch validation cache, never the robot's own: each boot
+starts cold unless --warm shares one cache between them.
+
+Prints p50/p90/p95/max per metric; --json writes every run plus the
+summary. With --budget the exit code is 1 when the --percentile of the
+total boot time exceeds it, and 2 when a boot failed.
+"""
+
+import time
+
+_PROCESS_START = time.monotonic()
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from telemetry.stats import percentile
+
+
+# =========================
+# ONE BOOT (child process)
+# =========================
+def boot_once(args):
+    """Boot the robot once in this process and return the measurements."""
+    from core import lazy_import
+    lazy_import.install_report()
+
+    import dev_mocks
+    dev_mocks.install_mocks()
+
+    from config import settings
+    settings.VALIDATION_CACHE_PATH = args.validation_cache
+
+    import startup.startup as startup
+    from main import apply_dev_options
+    apply_dev_options(startup, no_hw_check=args.no_hw_check, no_vision=args.no_vision)
+    imported = time.monotonic()
+
+    robot = startup.RobotSystem()
+    try:
+        ok = robot.initialize()
+        ready = time.monotonic()
+
+        first_valid = {}
+        if robot.sensors:
+            started = robot.boot_marks[0][1]
+            deadline = time.monotonic() + args.sensor_wait
+            for name in robot.sensors.first_valid_times():
+                robot.sensors.wait_ready(name, max(0.0, deadline - time.monotonic()))
+            for name, at in robot.sensors.first_valid_times().items():
+                first_valid[name] = round((at - started) * 1000, 2) if at is not None else None
+
+        timeline = robot.boot_timeline()
+        return {
+            "ok": bool(ok),
+            "total_ms": round((ready - _PROCESS_START) * 1000, 2),
+            "imports_ms": round((imported - _PROCESS_START) * 1000, 2),
+            "initialize_ms": round((ready - robot.boot_marks[0][1]) * 1000, 2),
+            "phases": {entry["phase"]: entry["ms"] for entry in timeline},
+            "timeline": timeline,
+            "first_valid_ms": first_valid,
+            "validation": robot.validation_mode,
+            "imports": lazy_import.report_data(top=args.top_imports),
+        }
+    finally:
+        robot.shutdown()
+
+
+def child_main(args):
+    result = boot_once(args)
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+    # Driver threads are daemons; don't wait for them
+    sys.stdout.flush()
+    os._exit(0)
+
+
+# =========================
+# BENCHMARK (parent)
+# =========================
+def run_boot(args, scratch, index):
+    """One boot in a fresh interpreter. Returns its result dict."""
+    result_path = os.path.join(scratch, f"boot_{index}.json")
+    cache_path = os.path.join(scratch, "validation.json" if args.warm else f"validation_{index}.json")
+    command = [sys.executable, os.path.abspath(__file__), "--child", "--result", result_path,
+               "--validation-cache", cache_path,
+               "--sensor-wait", str(args.sensor_wait), "--top-imports", str(args.top_imports)]
+    if args.no_hw_check:
+        command.append("--no-hw-check")
+    if args.no_vision:
+        command.append("--no-vision")
+    proc = None
+    try:
+        proc = subprocess.run(
+            command, cwd=project_root, timeout=args.timeout,
+            stdout=None if args.verbose else subprocess.DEVNULL,
+            stderr=None if args.verbose else subprocess.PIPE,
+        )
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+    except subprocess.TimeoutExpired:
+        return {"ok": False, "error": f"no result within {args.timeout:.0f} s"}
+    except (OSError, ValueError):
+        if proc is None:
+            raise
+        error = (proc.stderr or b"").decode(errors="replace").strip().splitlines()
+        return {"ok": False, "error": error[-1] if error else f"exit code {proc.returncode}"}
+
+
+def missing_first_valid(runs):
+    """{sensor: number of successful boots where it never became valid}."""
+    missing = {}
+    for run in runs:
+        if not run.get("ok"):
+            continue
+        for name, ms in run["first_valid_ms"].items():
+            if ms is None:
+                missing[name] = missing.get(name, 0) + 1
+    return missing
+
+
+def summarize(runs):
+    """{metric: {p50, p90, p95, min, max, n}} over the successful runs (ms)."""
+    samples = {}
+
+    def add(metric, value):
+        if value is not None:
+            samples.setdefault(metric, []).append(value)
+
+    for run in runs:
+        if not run.get("ok"):
+            continue
+        for key in ("total_ms", "imports_ms", "initialize_ms"):
+            add(key, run[key])
+        for phase, ms in run["phases"].items():
+            add(f"phase.{phase}", ms)
+        if run.get("validation"):
+            add(f"validation.{run['validation']}", run["phases"].get("validation"))
+        for name, ms in run["first_valid_ms"].items():
+            add(f"first_valid.{name}", ms)
+        if run.get("imports"):
+            add("imports.total", run["imports"]["total_ms"])
+
+    return {
+        metric: {
+            "p50": round(percentile(values, 50), 2),
+            "p90": round(percentile(values, 90), 2),
+            "p95": round(percentile(values, 95), 2),
+            "min": round(min(values), 2),
+            "max": round(max(values), 2),
+            "n": len(values),
+        }
+        for metric, values in samples.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RobotSystem boot benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of boots")
+    parser.add_argument("--json", help="Write every run and the summary to this file")
+    parser.add_argument("--budget", type=float, help="Boot time budget in ms (total_ms)")
+    parser.add_argument("--percentile", type=float, default=95,
+                        help="Percentile of total_ms compared with --budget")
+    parser.add_argument("--no-hw-check", action="store_true", help="Skip hardware validation")
+    parser.add_argument("--no-vision", action="store_true", help="Use the vision stub")
+    parser.add_argument("--sensor-wait", type=float, default=3.0,
+                        help="Seconds after ready to wait for each sensor's first valid sample")
+    parser.add_argument("--top-imports", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds per boot")
+    parser.add_argument("--verbose", action="store_true", help="Show the boots' own output")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--warm", action="store_true",
+                        help="Share one validation cache so boots after the first are warm")
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    parser.add_argument("--validation-cache", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return child_main(args)
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="boot_bench_") as scratch:
+        for i in range(args.runs):
+            run = run_boot(args, scratch, i)
+            runs.append(run)
+            if run.get("ok"):
+                print(f"[BootBench] boot {i + 1}/{args.runs}: {run['total_ms']:8.0f} ms "
+                      f"(imports {run['imports_ms']:.0f} ms, validation {run['validation'] or 'skipped'})")
+            else:
+                print(f"[BootBench] boot {i + 1}/{args.runs}: FAILED {run.get('error', '(initialize returned False)')}")
+
+    summary = summarize(runs)
+    missing = missing_first_valid(runs)
+    failed = sum(1 for run in runs if not run.get("ok"))
+
+    print("=" * 60)
+    print(f"{'metric':<28} {'p50':>8} {'p90':>8} {'p95':>8} {'max':>8}")
+    for metric, stats in summary.items():
+        print(f"{metric:<28} {stats['p50']:8.1f} {stats['p90']:8.1f} {stats['p95']:8.1f} {stats['max']:8.1f}")
+    print("=" * 60)
+    ok_runs = len(runs) - failed
+    for name, count in missing.items():
+        print(f"⚠ first_valid.{name}: no valid sample within {args.sensor_wait:g} s "
+              f"in {count} of {ok_runs} boots")
+
+    exit_code = 2 if failed else 0
+    measured = None
+    if args.budget is not None and "total_ms" in summary:
+        totals = [run["total_ms"] for run in runs if run.get("ok")]
+        measured = round(percentile(totals, args.percentile), 2)
+        within = measured <= args.budget
+        print(f"Budget: p{args.percentile:g} {measured:.0f} ms / {args.budget:.0f} ms "
+              f"{'OK' if within else 'EXCEEDED'}")
+        if not within and not failed:
+            exit_code = 1
+    if failed:
+        print(f"{failed} of {len(runs)} boots failed")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "runs": runs,
+                "summary": summary,
+                "first_valid_missing": missing,
+                "budget_ms": args.budget,
+                "percentile": args.percentile,
+                "measured_ms": measured,
+                "failed": failed,
+            }, f, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
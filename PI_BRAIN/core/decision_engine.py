@@ -1,3 +1,4 @@
+import random
 import time
 
 from core.states import RobotState
@@ -18,16 +19,18 @@ class DecisionEngine:
     FRAME_CENTER_X = 160         # camera frame center X
     FRAME_CENTER_Y = 120         # camera frame center Y
 
-    def __init__(self, sensors, vision=None):
+    def __init__(self, sensors, vision=None, alarms=None):
         """
         Initialize the decision engine.
         
         Args:
             sensors: Sensor interface for reading robot sensors
             vision: Vision system for person tracking (required for MOVE state)
+            alarms: AlarmRunner, for "stop alarm" / "snooze" (optional)
         """
         self.sensors = sensors
         self.vision = vision
+        self.alarms = alarms
 
         self.state = RobotState.IDLE
         self.prev_state = RobotState.IDLE
@@ -35,8 +38,20 @@ class DecisionEngine:
         self.last_vision_time = None
         self.camera_angle = 90
 
+        # Last snapshot read by update() (consumed by telemetry)
+        self.last_sensor_data = {}
+
         # Motor state tracking to avoid repeated stop commands
         self._motors_stopped = True
+        self._obstacle_stale_warned = False
+
+        # Voice interaction whose state change the control loop has not acted on yet
+        self._pending_interaction = None
+
+        # Event-driven gas alarm: react as soon as the MQ-9 driver publishes
+        subscriptions = getattr(sensors, "subscriptions", None)
+        if subscriptions is not None:
+            subscriptions.on_change("mq9", "dangerous", callback=self._on_gas_event)
 
         print("[DecisionEngine] Initialized")
 
@@ -46,12 +61,13 @@ class DecisionEngine:
     def update(self):
         """Main control loop - called repeatedly to update robot behavior."""
         sensor_data = self.sensors.read() if self.sensors else {}
+        self.last_sensor_data = sensor_data
 
         # -------------------------
         # 1. GAS SAFETY (HIGHEST PRIORITY)
         # -------------------------
-        gas = sensor_data.get("gas", {}).get("mq9", {})
-        if gas.get("dangerous_CO", False):
+        gas = sensor_data.get("mq9", {})
+        if gas.get("dangerous", False):
             if self.state != RobotState.ALARM:
                 print("[DecisionEngine] ⚠ ALARM: Dangerous CO detected!")
             self.state = RobotState.ALARM
@@ -64,10 +80,26 @@ class DecisionEngine:
             actions.stop_motors()
             return
 
+        # -------------------------
+        # 3. OBSTACLE DATA FRESHNESS
+        # -------------------------
+        # Never drive on stale/invalid ultrasonic data: a frozen driver thread
+        # would otherwise keep reporting the last (clear) distances.
+        if self.state in (RobotState.MOVE, RobotState.SEARCH):
+            if not self._obstacle_data_fresh(sensor_data):
+                if not self._obstacle_stale_warned:
+                    print("[DecisionEngine] ⚠ Ultrasonic data stale - holding position")
+                    self._obstacle_stale_warned = True
+                self._ensure_stopped()
+                return
+            if self._obstacle_stale_warned:
+                print("[DecisionEngine] Ultrasonic data fresh again - resuming")
+                self._obstacle_stale_warned = False
+
         # -------------------------
         # 3. OBSTACLE AVOIDANCE
         # -------------------------
-        ultrasonic = sensor_data.get("ultrasonic", {}).get("ultrasonic", {})
+        ultrasonic = sensor_data.get("ultrasonic", {})
         left = ultrasonic.get("left")
         right = ultrasonic.get("right")
 
@@ -94,6 +126,12 @@ class DecisionEngine:
         elif self.state == RobotState.IDLE:
             self._ensure_stopped()
 
+        # Latency: first tick that acted on a voice-commanded state
+        interaction = self._pending_interaction
+        if interaction is not None:
+            self._pending_interaction = None
+            interaction.mark("actuated")
+
     # =========================
     # MOVE STATE (FOLLOW PERSON)
     # =========================
@@ -191,41 +229,88 @@ class DecisionEngine:
     # =========================
     # VOICE COMMAND HANDLING
     # =========================
-    def handle_voice(self, text: str):
+    def handle_voice(self, text: str, speak: bool = True, interaction=None):
         """
         Process voice commands and update robot state accordingly.
         ALARM state is locked and cannot be changed by voice.
         
         Args:
             text: Transcribed voice command text
+            speak: Speak the response here (False when the caller has its
+                   own speech stage, e.g. the audio pipeline)
+            interaction: Optional latency Interaction (telemetry/latency.py)
+        
+        Returns:
+            str or None: The response text
         """
         # ALARM state is locked - no voice commands accepted
         if self.state == RobotState.ALARM:
             print("[DecisionEngine] ALARM state locked - voice commands disabled")
-            return
+            return None
             
         print(f"[DecisionEngine] Processing voice: '{text}'")
 
         result = speech_engine.process(text, self.sensors)
         if not result:
-            return
+            return None
+        if interaction:
+            interaction.mark("intent")
+            interaction.note("intent", result.get("intent"))
+
+        # Alarm clock commands act on the ringing alarm
+        alarm_action = result.get("alarm")
+        if alarm_action is not None:
+            handled = False
+            if self.alarms is not None:
+                if alarm_action == "snooze":
+                    handled = self.alarms.snooze_alarm()
+                else:
+                    handled = self.alarms.stop_alarm()
+            if not handled:
+                result["response"] = random.choice(speech_engine.RESPONSES["no_alarm"])
+
+        # Update state first so motion reacts before the reply is spoken
+        new_state = result.get("state")
+        if new_state is not None and new_state != self.state:
+            self.prev_state = self.state
+            self.state = new_state
+            print(f"[DecisionEngine] State: {self.prev_state} → {self.state}")
+            if interaction:
+                interaction.mark("state")
+                self._pending_interaction = interaction
 
         # Speak response if available
         response = result.get("response")
         if response:
             print(f"[DecisionEngine] Response: {response}")
-            actions.talk(response)
+            if speak:
+                actions.talk(response)
+        return response
 
-        # Update state if command requires it
-        new_state = result.get("state")
-        if new_state is not None and new_state != self.state:
+    # =========================
+    # SENSOR EVENTS
+    # =========================
+    def _on_gas_event(self, event):
+        """Called from the MQ-9 thread when `dangerous` changes."""
+        if event["value"] and self.state != RobotState.ALARM:
+            print("[DecisionEngine] ⚠ ALARM: Dangerous CO detected!")
             self.prev_state = self.state
-            self.state = new_state
-            print(f"[DecisionEngine] State: {self.prev_state} → {self.state}")
+            self.state = RobotState.ALARM
+            actions.talk("Warning! Dangerous gas detected.", priority="safety", key="gas")
+
+    @property
+    def motors_running(self):
+        """True while drive motors were commanded and not stopped since."""
+        return not self._motors_stopped
 
     # =========================
     # INTERNAL HELPERS
     # =========================
+    def _obstacle_data_fresh(self, sensor_data):
+        """True only if the ultrasonic source reports fresh, valid samples."""
+        health = sensor_data.get("health", {}).get("ultrasonic", {})
+        return health.get("valid", False)
+
     def _ensure_stopped(self):
         """Stop motors only when they were previously running (avoid repeated calls)."""
         if not self._motors_stopped:
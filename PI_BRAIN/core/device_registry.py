@@ -0,0 +1,62 @@
+"""
+device_registry.py - Hand opened devices from validation to their users.
+
+Hardware validation has to open the camera and the microphone anyway, and
+opening them again right after costs seconds (camera auto-exposure, audio
+device setup). Instead the validator leaves the working device here and
+the subsystem that needs it takes it:
+
+    devices.put("camera", cam, release=cam.release)   # startup validation
+    cam = devices.take("camera") or CameraManager()   # VisionEngine.run
+
+take() transfers ownership: the registry forgets the device and the taker
+is responsible for releasing it. Devices nobody took (e.g. vision disabled)
+are released by release_unclaimed() at the end of startup.
+"""
+
+import threading
+
+
+class DeviceRegistry:
+    def __init__(self):
+        self._devices = {}  # name -> (handle, release callable or None)
+        self._lock = threading.Lock()
+
+    def put(self, name, handle, release=None):
+        """Offer an opened device; replaces (and releases) an unclaimed one."""
+        with self._lock:
+            previous = self._devices.pop(name, None)
+            self._devices[name] = (handle, release)
+        if previous is not None:
+            self._release(name, *previous)
+
+    def take(self, name):
+        """The warmed handle for `name` (caller now owns it), or None."""
+        with self._lock:
+            entry = self._devices.pop(name, None)
+        return entry[0] if entry is not None else None
+
+    def available(self):
+        with self._lock:
+            return sorted(self._devices)
+
+    def release_unclaimed(self):
+        """Release every device nobody took. Returns their names."""
+        with self._lock:
+            entries, self._devices = self._devices, {}
+        for name, (handle, release) in entries.items():
+            self._release(name, handle, release)
+        return sorted(entries)
+
+    @staticmethod
+    def _release(name, handle, release):
+        if release is None:
+            return
+        try:
+            release()
+        except Exception as e:
+            print(f"[Devices] Could not release {name}: {e}")
+
+
+# Shared by startup and the subsystems
+devices = DeviceRegistry()
@@ -0,0 +1,133 @@
+"""
+intent_bench.py - Throughput and accuracy of voice intent detection.
+
+Usage:
+    python core/intent_bench.py                      # synthetic corpus
+    python core/intent_bench.py --size 200000
+    python core/intent_bench.py --typos 0.3       # misspell 30% of phrases
+    python core/intent_bench.py --corpus utterances.tsv
+
+A corpus file has one "<intent>\\t<utterance>" per line (intent "unknown"
+for phrases that should not match). Without one, a labelled corpus is
+generated from INTENTS wrapped in filler words, plus distractors that
+contain intent keywords inside other words ("this", "sometimes").
+--typos replaces one letter of the intent phrase, like an STT slip, to
+exercise the fuzzy fallback.
+
+Reports microseconds per utterance and accuracy for the compiled matcher
+and, for comparison, the old substring scan.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from core import speech_engine
+
+# Fillers contain no intent keywords, so the label is the phrase's intent
+PREFIXES = ["", "", "please", "okay", "um", "can you", "robot", "so"]
+SUFFIXES = ["", "", "please", "now", "right now", "for me", "okay"]
+DISTRACTORS = [
+    "this is nice", "sometimes it rains", "the whitest wall", "phishing emails",
+    "a stopwatch on the shelf", "updated weekly", "the shipping label",
+    "he is chilling", "the history channel", "timeline of events",
+    "a nothingburger", "halter neck dress", "leftovers in the fridge",
+]
+
+
+def substring_detect(text: str) -> str:
+    """The previous detector: first dict-order substring hit."""
+    text = text.lower()
+    for intent, keywords in speech_engine.INTENTS.items():
+        if any(word in text for word in keywords):
+            return intent
+    return "unknown"
+
+
+def misspell(phrase, rng):
+    """Replace one letter (not the first) with a random vowel."""
+    positions = [i for i, ch in enumerate(phrase) if i > 0 and ch.isalpha()]
+    if not positions:
+        return phrase
+    i = rng.choice(positions)
+    return phrase[:i] + rng.choice("aeiou".replace(phrase[i], "")) + phrase[i + 1:]
+
+
+def exact_detect(text: str) -> str:
+    """Keyword matcher only, without the fuzzy fallback."""
+    ranked = speech_engine.rank_intents(text)
+    return ranked[0].intent if ranked else "unknown"
+
+
+def synthetic_corpus(size, seed=0, typos=0.0):
+    rng = random.Random(seed)
+    phrases = [(intent, p) for intent, ps in speech_engine.INTENTS.items() for p in ps]
+    corpus = []
+    for _ in range(size):
+        if rng.random() < 0.15:
+            corpus.append(("unknown", rng.choice(DISTRACTORS)))
+            continue
+        intent, phrase = rng.choice(phrases)
+        if rng.random() < typos:
+            phrase = misspell(phrase, rng)
+        words = [rng.choice(PREFIXES), phrase, rng.choice(SUFFIXES)]
+        corpus.append((intent, " ".join(w for w in words if w)))
+    return corpus
+
+
+def load_corpus(path):
+    corpus = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            intent, _, text = line.partition("\t")
+            corpus.append((intent.strip(), text))
+    return corpus
+
+
+def run(detector, corpus):
+    """Returns (correct, seconds)."""
+    correct = 0
+    start = time.perf_counter()
+    for expected, text in corpus:
+        correct += detector(text) == expected
+    return correct, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Intent matcher benchmark")
+    parser.add_argument("--corpus", help="TSV file of '<intent>\\t<utterance>' lines")
+    parser.add_argument("--size", type=int, default=50000, help="Synthetic corpus size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--typos", type=float, default=0.0,
+                        help="Share of synthetic phrases with a misspelled letter")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.size, args.seed, args.typos)
+    if not corpus:
+        print("[IntentBench] Empty corpus")
+        return 1
+
+    n = len(corpus)
+    print("=" * 60)
+    print(f"Utterances     : {n}")
+    for name, detector in (("compiled+fuzzy", speech_engine.detect_intent),
+                           ("compiled", exact_detect),
+                           ("substring", substring_detect)):
+        correct, seconds = run(detector, corpus)
+        print(f"{name:<15}: {seconds / n * 1e6:6.2f} us/utterance  "
+              f"accuracy {100.0 * correct / n:5.1f}%")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
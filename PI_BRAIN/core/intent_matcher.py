@@ -0,0 +1,241 @@
+"""
+intent_matcher.py - Compiled keyword matcher for voice intents.
+
+All intent phrases are merged into ONE regex trie, compiled once:
+
+    hi|hey|hello  ->  h(?:e(?:llo|y)|i)
+
+and wrapped in word boundaries, so "hi" no longer fires inside "this" and
+"time" not inside "sometimes". A single left-to-right scan finds every
+phrase; at each position the longest phrase wins ("what time" over "time").
+
+Each intent seen in the utterance becomes a candidate:
+
+    score      = words covered by its phrases + intent priority
+    confidence = words covered / words in the utterance
+
+Candidates are ranked by score, then by where they first appear, so
+"hey, stop" is a stop (priority) and "hey, what time is it" is a time
+question (longer match), not a greeting.
+"""
+
+import re
+
+_WORD = re.compile(r"[\w']+")
+
+
+class IntentCandidate:
+    """One ranked intent for an utterance."""
+
+    __slots__ = ("intent", "score", "confidence", "phrases", "position")
+
+    def __init__(self, intent, score, confidence, phrases, position):
+        self.intent = intent
+        self.score = score
+        self.confidence = confidence  # 0..1, share of the utterance explained
+        self.phrases = phrases        # matched phrases, in order
+        self.position = position      # character offset of the first match
+
+    def __repr__(self):
+        return (f"IntentCandidate({self.intent!r}, score={self.score}, "
+                f"confidence={self.confidence:.2f}, phrases={self.phrases})")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace (phrases use single spaces)."""
+    return " ".join(text.lower().split())
+
+
+def _trie_pattern(node):
+    """Regex for a character trie; '' marks the end of a phrase."""
+    branches = [re.escape(ch) + _trie_pattern(child)
+                for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        pattern = branches[0]
+    else:
+        pattern = "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A shorter phrase ends here; the greedy '?' still prefers the longer one
+        return "(?:" + pattern + ")?"
+    return pattern
+
+
+def compile_phrases(phrases):
+    """One word-bounded regex matching any of `phrases`, longest first."""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return re.compile(r"\b(?:" + _trie_pattern(trie) + r")\b")
+
+
+class IntentMatcher:
+    """
+    Built once from {intent: [phrases]} and an optional {intent: priority}.
+
+    Priorities are small integers added to the score; use them for intents
+    that must win a tie (safety commands like "stop").
+    """
+
+    def __init__(self, intents, priorities=None):
+        self.priorities = dict(priorities or {})
+        self._order = {intent: i for i, intent in enumerate(intents)}
+        self._owners = {}
+        for intent, phrases in intents.items():
+            for phrase in phrases:
+                self._owners.setdefault(normalize(phrase), []).append(intent)
+        self._pattern = compile_phrases(self._owners)
+
+    def rank(self, text: str):
+        """All intents found in `text`, best first (empty list if none)."""
+        text = normalize(text)
+        found = {}
+        for match in self._pattern.finditer(text):
+            phrase = match.group(0)
+            for intent in self._owners[phrase]:
+                entry = found.setdefault(intent, [match.start(), []])
+                entry[1].append(phrase)
+        if not found:
+            return []
+
+        total_words = max(len(_WORD.findall(text)), 1)
+        candidates = []
+        for intent, (position, phrases) in found.items():
+            covered = sum(len(p.split()) for p in phrases)
+            candidates.append(IntentCandidate(
+                intent,
+                covered + self.priorities.get(intent, 0),
+                min(1.0, covered / total_words),
+                phrases,
+                position
+            ))
+        candidates.sort(key=lambda c: (-c.score, c.position, self._order[c.intent]))
+        return candidates
+
+    def best(self, text: str):
+        """Top candidate or None."""
+        ranked = self.rank(text)
+        return ranked[0] if ranked else None
+
+
+def char_ngrams(text: str, n=3):
+    """Character n-grams of each word, padded with spaces (" fo", "fol", ...)."""
+    grams = []
+    for word in _WORD.findall(text):
+        padded = f" {word} "
+        if len(padded) <= n:
+            grams.append(padded)
+        else:
+            grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+class FuzzyIntentMatcher:
+    """
+    Fallback for STT slips ("fallow me", "turn lift").
+
+    Every intent phrase is embedded once as a character n-gram TF-IDF
+    vector (rows of one L2-normalized NumPy matrix, built on first use).
+    An utterance is scored with a single matrix-vector product: the cosine
+    similarity to every phrase. n-grams unknown to the vocabulary still
+    count towards the utterance norm, so unrelated words lower the score;
+    `ignore_words` (fillers like "please") are dropped first unless a
+    phrase uses them.
+
+    Without NumPy there is no fuzzy matching: rank() is always empty. The
+    import is tried once; `available` holds the outcome (None = not yet).
+    """
+
+    def __init__(self, intents, threshold=0.5, n=3, ignore_words=()):
+        self.intents = intents
+        self.threshold = threshold
+        self.n = n
+        phrase_words = {w for ps in intents.values() for p in ps for w in _WORD.findall(p.lower())}
+        self.ignore_words = set(ignore_words) - phrase_words
+        self.available = None
+        self._matrix = None
+
+    def _build(self):
+        """Build the phrase matrix on first use. False if NumPy is missing."""
+        if self.available is not None:
+            return self.available
+        try:
+            import numpy as np
+        except ImportError:
+            self.available = False
+            return False
+
+        rows, vocab, df = [], {}, {}
+        for intent, phrases in self.intents.items():
+            for phrase in phrases:
+                grams = char_ngrams(normalize(phrase), self.n)
+                rows.append((intent, phrase, grams))
+                for gram in set(grams):
+                    df[gram] = df.get(gram, 0) + 1
+                    vocab.setdefault(gram, len(vocab))
+
+        count = len(rows)
+        idf = np.ones(len(vocab))
+        for gram, index in vocab.items():
+            idf[index] = np.log((1.0 + count) / (1.0 + df[gram])) + 1.0
+
+        matrix = np.zeros((count, len(vocab)))
+        for row, (_, _, grams) in enumerate(rows):
+            for gram in grams:
+                matrix[row, vocab[gram]] += 1.0
+        matrix *= idf
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+        self._np = np
+        self._vocab = vocab
+        self._idf = idf
+        self._unknown_idf = np.log(1.0 + count) + 1.0  # as if df = 0
+        self._labels = [(intent, phrase) for intent, phrase, _ in rows]
+        self._matrix = matrix
+        self.available = True
+        return True
+
+    def similarities(self, text: str):
+        """Cosine similarity of `text` to every phrase (NumPy array)."""
+        if not self._build():
+            raise ImportError("fuzzy intent matching needs NumPy")
+        np = self._np
+        vector = np.zeros(len(self._vocab))
+        unknown = {}
+        words = [w for w in _WORD.findall(text.lower()) if w not in self.ignore_words]
+        for gram in char_ngrams(" ".join(words), self.n):
+            index = self._vocab.get(gram)
+            if index is None:
+                unknown[gram] = unknown.get(gram, 0) + 1
+            else:
+                vector[index] += 1.0
+        vector *= self._idf
+        unknown_sq = sum(c * c for c in unknown.values()) * self._unknown_idf ** 2
+        norm = np.sqrt(vector.dot(vector) + unknown_sq)
+        if norm == 0:
+            return np.zeros(len(self._labels))
+        return self._matrix.dot(vector) / norm
+
+    def rank(self, text: str):
+        """Best phrase per intent, above the threshold, best first."""
+        if not self._build():
+            return []
+        scores = self.similarities(text)
+        best = {}
+        for index in scores.argsort()[::-1]:
+            score = float(scores[index])
+            if score < self.threshold:
+                break
+            intent, phrase = self._labels[index]
+            if intent not in best:
+                best[intent] = IntentCandidate(intent, score, score, [phrase], 0)
+        return list(best.values())
+
+    def best(self, text: str):
+        """Top candidate or None."""
+        ranked = self.rank(text)
+        return ranked[0] if ranked else None
@@ -0,0 +1,207 @@
+"""
+lazy_import.py - Deferred imports of heavy modules and an import-time report.
+
+Heavy dependencies (cv2, mediapipe, serial, ...) cost seconds to import on
+a Pi. Modules that need them hold a LazyModule instead, so importing the
+module is free and the dependency loads at first use:
+
+    cv2 = lazy_module("cv2")
+    ...
+    cap = cv2.VideoCapture(0)     # cv2 is imported here
+
+warm(names) imports them on a background thread, e.g. while hardware
+validation runs, so first use does not wait either.
+
+Import-time report (like python -X importtime, but for our own boot):
+
+    python main.py --import-report
+
+install_report() times every module import from then on; print_report()
+lists the slowest with self and cumulative ms, and which lazy modules were
+loaded by whom (first use vs. warm-up).
+"""
+
+import importlib
+import importlib.abc
+import sys
+import threading
+import time
+
+
+class LazyModule:
+    """Module proxy that imports `name` on first attribute access."""
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = _timed_import(self.__dict__["_name"], "first use")
+                    self.__dict__["_module"] = module
+        return module
+
+    @property
+    def loaded(self):
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_module(name):
+    """The module itself if it is already imported, else a LazyModule."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+# name -> (seconds, "first use" | "warm-up") for modules loaded through here
+lazy_loads = {}
+
+
+def _timed_import(name, reason):
+    started = time.perf_counter()
+    already = name in sys.modules
+    module = importlib.import_module(name)
+    if not already:
+        lazy_loads.setdefault(name, (time.perf_counter() - started, reason))
+    return module
+
+
+def warm(names):
+    """Import `names` on a daemon thread (failures are ignored). Returns the thread."""
+    def run():
+        for name in names:
+            try:
+                _timed_import(name, "warm-up")
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=run, daemon=True, name="import-warmup")
+    thread.start()
+    return thread
+
+
+# =========================
+# IMPORT-TIME REPORT
+# =========================
+class _TimingLoader(importlib.abc.Loader):
+    def __init__(self, loader, recorder):
+        self._loader = loader
+        self._recorder = recorder
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._recorder.enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._recorder.leave(module.__name__)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _ImportRecorder(importlib.abc.MetaPathFinder):
+    """Wraps other finders' loaders to time module execution per thread."""
+
+    def __init__(self):
+        self.times = {}  # name -> [self seconds, cumulative seconds, thread name]
+        self._local = threading.local()
+        self._busy = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._busy, "active", False):
+            return None
+        self._busy.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimingLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._busy.active = False
+
+    def enter(self, name):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append([name, time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        stack = self._local.stack
+        _, started, children = stack.pop()
+        total = time.perf_counter() - started
+        self.times[name] = [total - children, total, threading.current_thread().name]
+        if stack:
+            stack[-1][2] += total
+
+
+_recorder = None
+
+
+def install_report():
+    """Start timing imports (call as early as possible)."""
+    global _recorder
+    if _recorder is None:
+        _recorder = _ImportRecorder()
+        sys.meta_path.insert(0, _recorder)
+    return _recorder
+
+
+def report_enabled():
+    return _recorder is not None
+
+
+def report_data(top=25):
+    """print_report() as a dict (ms), e.g. for JSON output. None if not installed."""
+    if _recorder is None:
+        return None
+    rows = sorted(_recorder.times.items(), key=lambda item: item[1][1], reverse=True)
+    return {
+        "modules": len(rows),
+        "total_ms": round(sum(own for own, _, _ in _recorder.times.values()) * 1000, 2),
+        "slowest": [
+            {"module": name, "self_ms": round(own * 1000, 2),
+             "cum_ms": round(cumulative * 1000, 2), "thread": thread}
+            for name, (own, cumulative, thread) in rows[:top]
+        ],
+        "lazy": {
+            name: {"ms": round(seconds * 1000, 2), "loaded_by": reason}
+            for name, (seconds, reason) in lazy_loads.items()
+        },
+    }
+
+
+def print_report(top=25, title="Import times"):
+    """The `top` slowest imports by cumulative time, plus lazy loads."""
+    if _recorder is None:
+        return
+    rows = sorted(_recorder.times.items(), key=lambda item: item[1][1], reverse=True)
+    total = sum(own for own, _, _ in _recorder.times.values())
+    print(f"\n⏱ {title}: {len(rows)} modules, {total * 1000:.0f} ms")
+    print(f"  {'self ms':>8} {'cum ms':>8}  {'thread':<14} module")
+    for name, (own, cumulative, thread) in rows[:top]:
+        print(f"  {own * 1000:8.1f} {cumulative * 1000:8.1f}  {thread[:14]:<14} {name}")
+    if lazy_loads:
+        print("  Lazy modules:")
+        for name, (seconds, reason) in lazy_loads.items():
+            print(f"    {name:<32} {seconds * 1000:8.1f} ms ({reason})")
@@ -1,6 +1,8 @@
 import random
 from datetime import datetime
+from config import settings
 from core.states import RobotState
+from core.intent_matcher import FuzzyIntentMatcher, IntentMatcher
 
 # ---------------- INTENTS ----------------
 INTENTS = {
@@ -16,9 +18,27 @@ INTENTS = {
     "turn_right": ["turn right", "rotate right", "look right"],
     "thanks": ["thanks", "thank you", "appreciate it"],
     "goodbye": ["bye", "goodbye", "see you later", "farewell"],
-    "introduce": ["who are you", "introduce yourself", "what are you"]
+    "introduce": ["who are you", "introduce yourself", "what are you"],
+    "stop_alarm": ["stop alarm", "stop the alarm", "alarm off", "turn off the alarm", "i'm awake"],
+    "snooze": ["snooze", "snooze alarm", "snooze the alarm", "five more minutes"]
 }
 
+# Added to an intent's score when several intents match one utterance
+# ("hey, stop" must stop). Intents not listed have priority 0.
+INTENT_PRIORITY = {
+    "stop": 3,
+    "stop_alarm": 3,
+    "snooze": 3,
+    "idle": 1,
+    "follow": 1,
+    "turn_left": 1,
+    "turn_right": 1
+}
+
+# Ignored by the fuzzy matcher so they don't dilute the similarity
+FILLER_WORDS = ["please", "now", "can", "could", "would", "just", "um", "uh",
+                "so", "the", "robot", "panda"]
+
 # ---------------- RESPONSES ----------------
 RESPONSES = {
     "greet": ["Hello!", "Hi there!", "Hey! I'm ready.", "Greetings!", "Nice to see you!"],
@@ -36,21 +56,58 @@ RESPONSES = {
     "turn_right": ["Turning right.", "Rotating right."],
     "thanks": ["You're welcome!", "Happy to help!", "Anytime."],
     "goodbye": ["Goodbye!", "See you later!", "Talk to you soon."],
-    "introduce": ["I'm Panda Robot, your autonomous assistant.", "I'm a smart robot built to help."]
+    "introduce": ["I'm Panda Robot, your autonomous assistant.", "I'm a smart robot built to help."],
+    "stop_alarm": ["Alarm off.", "Alarm stopped.", "Good morning!"],
+    "snooze": ["Snoozing for {minutes} minutes.", "Okay, {minutes} more minutes."],
+    "no_alarm": ["No alarm is ringing."],
+    "temp_unavailable": ["I cannot read the temperature right now."],
+    "unknown": ["Sorry, I didn't understand that."]
 }
 
+
+def response_texts():
+    """Every reply and reply template, for TTS pre-rendering."""
+    return [text for texts in RESPONSES.values() for text in texts]
+
 # ---------------- INTENT DETECTION ----------------
+_matcher = IntentMatcher(INTENTS, INTENT_PRIORITY)
+_fuzzy = FuzzyIntentMatcher(INTENTS, settings.INTENT_FUZZY_THRESHOLD,
+                            ignore_words=FILLER_WORDS)
+
+
+def rank_intents(text: str):
+    """Ranked IntentCandidates for `text` (see core/intent_matcher.py)."""
+    return _matcher.rank(text)
+
+
+def match_intent(text: str):
+    """
+    Best IntentCandidate, or None.
+
+    Exact keyword matching first; the fuzzy n-gram matcher only runs when
+    no keyword matched (e.g. STT heard "fallow me").
+    """
+    best = _matcher.best(text)
+    if best is None and settings.INTENT_FUZZY_ENABLED:
+        best = _fuzzy.best(text)  # None without NumPy (exact matching only)
+    return best
+
+
 def detect_intent(text: str) -> str:
-    text = text.lower()
-    for intent, keywords in INTENTS.items():
-        if any(word in text for word in keywords):
-            return intent
-    return "unknown"
+    best = match_intent(text)
+    return best.intent if best else "unknown"
 
 # ---------------- PROCESS FUNCTION ----------------
 def process(text: str, sensors):
-    intent = detect_intent(text)
-    result = {"intent": intent, "response": None, "state": None}
+    best = match_intent(text)
+    intent = best.intent if best else "unknown"
+    result = {
+        "intent": intent,
+        "confidence": best.confidence if best else 0.0,
+        "response": None,
+        "state": None,
+        "alarm": None       # "stop" / "snooze": the caller acts on the ringing alarm
+    }
 
     if intent == "greet":
         result["response"] = random.choice(RESPONSES["greet"])
@@ -75,7 +132,7 @@ def process(text: str, sensors):
                 mood = random.choice(RESPONSES["temp_normal"])
             result["response"] = f"{base} {mood}"
         else:
-            result["response"] = "I cannot read the temperature right now."
+            result["response"] = random.choice(RESPONSES["temp_unavailable"])
 
     elif intent == "time":
         now = datetime.now().strftime("%I:%M %p")
@@ -115,7 +172,16 @@ def process(text: str, sensors):
     elif intent == "introduce":
         result["response"] = random.choice(RESPONSES["introduce"])
 
+    elif intent == "stop_alarm":
+        result["response"] = random.choice(RESPONSES["stop_alarm"])
+        result["alarm"] = "stop"
+
+    elif intent == "snooze":
+        result["response"] = random.choice(RESPONSES["snooze"]).format(
+            minutes=settings.ALARM_SNOOZE_MINUTES)
+        result["alarm"] = "snooze"
+
     else:
-        result["response"] = "Sorry, I didn't understand that."
+        result["response"] = random.choice(RESPONSES["unknown"])
 
     return result
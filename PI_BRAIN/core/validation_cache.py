@@ -0,0 +1,147 @@
+"""
+validation_cache.py - Last full hardware validation, for fast warm restarts.
+
+    {"validated_at": 1792400000.0,
+     "fingerprint": {"camera": {...}, "serial": {...}, "audio": {...}},
+     "results": {"camera": true, "microphone": true, ...}}
+
+A full (cold) validation beeps the buzzer, flashes the LCD and waits for
+camera frames. When the process restarts soon after one that passed, on
+the same devices, startup only runs quick liveness probes (warm). The
+fingerprint holds the configured device identity (camera source and
+resolution, GPS serial port, audio device indexes) plus the stat() of
+each device node, which changes when a device is replugged or the Pi
+reboots. Entries older than VALIDATION_CACHE_TTL are ignored, and a warm
+start never refreshes `validated_at`, so a cold run happens at least
+that often.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+
+def _node(path):
+    """Identity of a device node: [rdev, inode, ctime], or None if absent."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_rdev, st.st_ino, int(st.st_ctime)]
+
+
+def camera_device():
+    """/dev/videoN for an integer CAMERA_SOURCE, the source itself if it is a path."""
+    source = settings.CAMERA_SOURCE
+    if isinstance(source, int):
+        return f"/dev/video{source}"
+    if isinstance(source, str) and source.startswith("/dev/"):
+        return source
+    return None
+
+
+def device_fingerprint():
+    """What the validated hardware was: configuration plus device nodes."""
+    camera = camera_device()
+    return {
+        "camera": {
+            "source": settings.CAMERA_SOURCE,
+            "resolution": [settings.FRAME_WIDTH, settings.FRAME_HEIGHT],
+            "node": _node(camera),
+        },
+        "serial": {
+            "port": settings.GPS_MODULE_PORT,
+            "node": _node(settings.GPS_MODULE_PORT),
+        },
+        "audio": {
+            "input": settings.MIC_DEVICE_INDEX,
+            "output": settings.SPEAKER_DEVICE_INDEX,
+            "rate": settings.MIC_SAMPLE_RATE,
+        },
+    }
+
+
+class ValidationCache:
+    def __init__(self, path=None, ttl=None):
+        path = path or settings.VALIDATION_CACHE_PATH
+        if not os.path.isabs(path):
+            path = os.path.join(project_root, path)
+        self.path = path
+        self.ttl = settings.VALIDATION_CACHE_TTL if ttl is None else ttl
+        self.validated_at = None
+        self.fingerprint = None
+        self.results = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        self.validated_at = saved.get("validated_at")
+        self.fingerprint = saved.get("fingerprint")
+        self.results = saved.get("results", {})
+        return True
+
+    def age(self, now=None):
+        if self.validated_at is None:
+            return None
+        return (time.time() if now is None else now) - self.validated_at
+
+    def cold_reason(self, fingerprint, critical=(), now=None):
+        """
+        Why a full validation is needed, or None if a warm start may rely
+        on the cached results.
+        """
+        if self.ttl <= 0:
+            return "cache disabled"
+        age = self.age(now)
+        if age is None:
+            return "no previous validation"
+        if age < 0 or age > self.ttl:
+            return f"last validation {age:.0f} s ago (TTL {self.ttl:.0f} s)"
+        if fingerprint != self.fingerprint:
+            changed = sorted(k for k in fingerprint if fingerprint.get(k) != (self.fingerprint or {}).get(k))
+            return f"devices changed ({', '.join(changed)})"
+        failed = [name for name in critical if not self.results.get(name)]
+        if failed:
+            return f"critical failures last time ({', '.join(failed)})"
+        return None
+
+    def record(self, fingerprint, results):
+        """Remember a passed cold validation; write-then-rename."""
+        self.validated_at = time.time()
+        self.fingerprint = fingerprint
+        self.results = dict(results)
+        data = {"validated_at": self.validated_at, "fingerprint": fingerprint, "results": self.results}
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except OSError as e:
+                print(f"⚠ Could not save validation cache: {e}")
+
+    def clear(self):
+        """Forget the last validation (next start is cold)."""
+        self.validated_at = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
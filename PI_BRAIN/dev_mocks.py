@@ -15,10 +15,15 @@ class _GPIO:
     PUD_DOWN = 'PUD_DOWN'
     PUD_UP = 'PUD_UP'
 
+    SPEED_OF_SOUND = 34300  # cm/s
+    ECHO_DELAY = 0.0002     # s between trigger and echo rising edge (HC-SR04 burst)
+
     def __init__(self):
         self._pin_states = {}
         self._last_trig_times = {}
         self._flip = False
+        self._echo_pairs = {}  # echo pin -> trig pin (simulated HC-SR04 wiring)
+        self._distances = {}   # trig pin -> simulated distance in cm (None = nothing in range)
 
     def setmode(self, mode):
         return None
@@ -45,6 +50,18 @@ class _GPIO:
         if pin == 'FLIP_SENSOR_PIN':
             return 1 if self._flip else 0
 
+        # Simulated HC-SR04: echo goes high ECHO_DELAY after its trigger,
+        # for as long as sound takes to travel to the obstacle and back
+        trig = self._echo_pairs.get(pin)
+        if trig is not None:
+            fired = self._last_trig_times.get(trig)
+            if fired is None:
+                return 0
+            distance = self._distances.get(trig)
+            width = 0.038 if distance is None else 2 * distance / self.SPEED_OF_SOUND
+            elapsed = time.time() - fired - self.ECHO_DELAY
+            return 1 if 0 <= elapsed < width else 0
+
         # Ultrasonic echo simulation based on recent trig events
         now = time.time()
         # Find the most recent trig time
@@ -69,6 +86,42 @@ class _GPIO:
     def set_flip(self, flipped: bool):
         self._flip = bool(flipped)
 
+    def wire_ultrasonic(self, trig, echo, distance_cm=100.0):
+        """Simulate an HC-SR04 on trig/echo seeing an obstacle at distance_cm."""
+        self._echo_pairs[echo] = trig
+        self._distances[trig] = distance_cm
+
+    def set_distance(self, trig, distance_cm):
+        """Move the simulated obstacle (None = nothing in range)."""
+        self._distances[trig] = distance_cm
+
+
+# Simulated wiring for sensors whose pins are not configured
+# (setting name prefix -> (trig, echo, obstacle distance in cm))
+_SIM_ULTRASONIC = {
+    "LEFT_ULTRASONIC_SENSOR": (23, 24, 120.0),
+    "RIGHT_ULTRASONIC_SENSOR": (25, 8, 150.0),
+}
+
+
+def _wire_ultrasonic(gpio):
+    """
+    Give unconfigured ultrasonic sensors simulated pins, so their driver
+    gets real echo pulses instead of timing out. Must run before the
+    sensor modules import config.settings.
+    """
+    try:
+        from config import settings
+    except ImportError:
+        return
+    for prefix, (trig, echo, distance) in _SIM_ULTRASONIC.items():
+        if getattr(settings, f"{prefix}_TRIG_PIN", None) is None:
+            setattr(settings, f"{prefix}_TRIG_PIN", trig)
+        if getattr(settings, f"{prefix}_ECHO_PIN", None) is None:
+            setattr(settings, f"{prefix}_ECHO_PIN", echo)
+        gpio.wire_ultrasonic(getattr(settings, f"{prefix}_TRIG_PIN"),
+                             getattr(settings, f"{prefix}_ECHO_PIN"), distance)
+
 
 # Simple DHT11 mock
 class _DHT11:
@@ -87,37 +140,126 @@ class _DHT11:
 
 
 # Simple Serial mock for GPS
+def _nmea(body):
+    """Wrap an NMEA body with '$' and a valid checksum."""
+    checksum = 0
+    for ch in body:
+        checksum ^= ord(ch)
+    return f"${body}*{checksum:02X}\r\n"
+
+
 class _Serial:
+    SENTENCE_PERIOD = 1.0  # the M6 module reports at 1 Hz
+
     def __init__(self, port, baudrate=9600, timeout=1):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.is_open = True
         self._counter = 0
+        self._pending = bytearray()
+        self._next_burst = time.time()
 
-    def readline(self):
-        # Return a fake GPGGA NMEA sentence with lat/lon that changes slowly
+    def _burst(self):
+        """One second of GGA/RMC/VTG/GSA around Algiers, drifting slowly."""
         self._counter += 1
-        lat = 12.3456 + (self._counter % 10) * 0.0001
-        lon = 65.4321 - (self._counter % 10) * 0.0001
-        line = f"$GPGGA,1,{lat:.6f},0,{lon:.6f},1,08,0.9,545.4,M,46.9,M,,*47\r\n"
-        return line.encode('ascii')
+        minutes = 45.2280 + (self._counter % 10) * 0.0006
+        lat = f"36{minutes:07.4f}"
+        lon = f"003{3.5280 - (self._counter % 10) * 0.0006:07.4f}"
+        utc = time.strftime("%H%M%S", time.gmtime()) + ".00"
+        date = time.strftime("%d%m%y", time.gmtime())
+        return "".join((
+            _nmea(f"GPGGA,{utc},{lat},N,{lon},E,1,08,0.9,545.4,M,46.9,M,,"),
+            _nmea(f"GPRMC,{utc},A,{lat},N,{lon},E,0.5,54.7,{date},,,A"),
+            _nmea("GPVTG,54.7,T,,M,0.5,N,0.9,K,A"),
+            _nmea("GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,0.9,2.1"),
+        )).encode('ascii')
+
+    def _fill(self):
+        now = time.time()
+        while now >= self._next_burst:
+            self._pending.extend(self._burst())
+            self._next_burst += self.SENTENCE_PERIOD
+
+    @property
+    def in_waiting(self):
+        self._fill()
+        return len(self._pending)
+
+    def read(self, size=1):
+        self._fill()
+        data = bytes(self._pending[:size])
+        del self._pending[:size]
+        return data
+
+    def readline(self):
+        self._fill()
+        end = self._pending.find(b"\n")
+        if end < 0:
+            return b""
+        return self.read(end + 1)
+
+    def write(self, data):
+        return len(data)
 
     def close(self):
         self.is_open = False
 
 
+# Simple SPI mock emulating an MCP3008 ADC
+class _SpiDev:
+    # Raw value that reads as clean air for the default MQ-9 calibration
+    # (Rs/R0 = 9.6 with RL = R0 = 10k -> 1023 * 10 / 106)
+    CLEAN_AIR_RAW = 97
+
+    _channels = {}  # shared by every SpiDev, like the real chip
+
+    def __init__(self):
+        self.max_speed_hz = 0
+        self.mode = 0
+        self._open = False
+        self._noise = 0
+
+    def open(self, bus, device):
+        self._open = True
+
+    def xfer2(self, data):
+        # MCP3008 single-ended: [1, (8 + ch) << 4, 0] -> [?, high 2 bits, low 8 bits]
+        channel = (data[1] >> 4) & 0x07
+        value = self._channels.get(channel, self.CLEAN_AIR_RAW)
+        # +/-1 LSB of dither so oversampling has something to average
+        self._noise = (self._noise + 1) % 3
+        value = max(0, min(1023, value + self._noise - 1))
+        return [0, (value >> 8) & 0x03, value & 0xFF]
+
+    def close(self):
+        self._open = False
+
+
+def set_adc_value(channel, value):
+    """Set the raw 10-bit value the mocked MCP3008 returns for a channel."""
+    _SpiDev._channels[channel] = int(value)
+
+
 # Simple PyAudio mock
 class _PyAudio:
     paInt16 = 8
 
     class _Stream:
-        def __init__(self):
+        def __init__(self, rate=16000, channels=1):
             self._open = True
+            self._bytes_per_second = rate * channels * 2
 
         def read(self, n, exception_on_overflow=True):
             return b"\x00" * n
 
+        def write(self, data):
+            # Playback takes as long as the audio would
+            time.sleep(len(data) / float(self._bytes_per_second))
+
+        def start_stream(self):
+            pass
+
         def stop_stream(self):
             pass
 
@@ -125,7 +267,10 @@ class _PyAudio:
             pass
 
     def open(self, *args, **kwargs):
-        return _PyAudio._Stream()
+        return _PyAudio._Stream(kwargs.get("rate", 16000), kwargs.get("channels", 1))
+
+    def get_format_from_width(self, width):
+        return self.paInt16
 
     def terminate(self):
         pass
@@ -174,6 +319,11 @@ def install_mocks(set_flip=False, use_audio=True):
     serial_mod.Serial = _Serial
     sys.modules['serial'] = serial_mod
 
+    # spidev (MCP3008 ADC for the MQ-9)
+    spidev_mod = ModuleType('spidev')
+    spidev_mod.SpiDev = _SpiDev
+    sys.modules['spidev'] = spidev_mod
+
     # pyaudio (optional)
     if use_audio:
         pyaudio_mod = ModuleType('pyaudio')
@@ -185,9 +335,13 @@ def install_mocks(set_flip=False, use_audio=True):
     if set_flip:
         gpio.set_flip(True)
 
+    _wire_ultrasonic(gpio)
+
     # Expose helper to tests
     sys.modules['dev_mocks'] = ModuleType('dev_mocks')
     sys.modules['dev_mocks'].set_flip = gpio.set_flip
     sys.modules['dev_mocks'].gpio = gpio
+    sys.modules['dev_mocks'].set_adc_value = set_adc_value
+    sys.modules['dev_mocks'].set_distance = gpio.set_distance
 
     return True
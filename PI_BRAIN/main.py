@@ -3,8 +3,10 @@
 Single entry point for the robot application.
 Provides simple CLI flags useful for development and testing:
   --no-hw-check  : Skip hardware validation (dev)
+  --cold-check   : Full hardware validation even if a recent one passed
   --no-vision    : Disable vision subsystem (dev)
   --debug        : Enable debug logging
+  --import-report: Print import times (slowest modules, lazy loads) once ready
 
 This file keeps changes lightweight by monkey-patching startup behavior when needed
 so we don't have to modify the existing startup flow more than necessary.
@@ -20,6 +22,11 @@ project_root = os.path.abspath(os.path.dirname(__file__))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Start timing imports before anything heavy is loaded
+if "--import-report" in sys.argv:
+    from core import lazy_import
+    lazy_import.install_report()
+
 # On non-Pi platforms, install dev mocks for GPIO/DHT/serial when RPi.GPIO is not present
 try:
     import RPi.GPIO  # type: ignore
@@ -33,31 +40,35 @@ except Exception:
         print(f"[main] failed to install dev_mocks: {e}")
 
 
-def main(argv=None):
-    parser = argparse.ArgumentParser(description="PI_BRAIN robot main entrypoint")
-    parser.add_argument("--no-hw-check", action="store_true", help="Skip hardware validation (dev)")
-    parser.add_argument("--no-vision", action="store_true", help="Disable vision subsystem (dev)")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+class DummyVisionEngine:
+    """Stands in for VisionEngine with --no-vision."""
 
-    args = parser.parse_args(argv)
+    def __init__(self):
+        self._running = False
 
-    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
-                        format="[%(levelname)s] %(message)s")
+    def start(self):
+        self._running = True
 
-    logging.info("Starting PI_BRAIN (main entrypoint)")
+    def stop(self):
+        self._running = False
 
-    # Import here so sys.path is already configured
-    try:
-        import startup.startup as startup
-    except Exception as e:
-        logging.error("Failed to import startup module: %s", e)
-        raise
+    def join(self, timeout=None):
+        return
+
+    def wait_ready(self, timeout=None):
+        return True
+
+    def get_target(self):
+        return {"center": None, "width": None}
 
+
+def apply_dev_options(startup, no_hw_check=False, no_vision=False):
+    """Patch the startup module for --no-hw-check / --no-vision (also used by core/boot_bench.py)."""
     # Option: skip hardware checks by replacing HardwareValidator.validate_all
-    if args.no_hw_check:
+    if no_hw_check:
         logging.info("--no-hw-check: hardware validation will be skipped")
 
-        def _always_ok(self, sensors):
+        def _always_ok(self, sensors, cold=False):
             logging.debug("Hardware validation skipped (no-hw-check)")
             return True
 
@@ -66,37 +77,52 @@ def main(argv=None):
         except Exception:
             logging.warning("Could not patch HardwareValidator; continuing anyway")
 
-    # Option: disable vision by patching VisionEngine with a minimal stub
-    if args.no_vision:
+    # Option: disable vision by patching VisionEngine with a minimal stub;
+    # nothing will use the camera, so validation does not open it either
+    if no_vision:
         logging.info("--no-vision: vision subsystem disabled (stub)")
 
-        class DummyVisionEngine:
-            def __init__(self):
-                self._running = False
+        def _camera_skipped(self, out, run):
+            out.append("  ⚠ Camera not checked (--no-vision)")
+            return True
 
-            def start(self):
-                self._running = True
+        try:
+            startup.VisionEngine = DummyVisionEngine
+            startup.HardwareValidator._check_camera = _camera_skipped
+            startup.HardwareValidator._probe_camera = _camera_skipped
+        except Exception:
+            logging.warning("Could not patch VisionEngine; continuing anyway")
 
-            def stop(self):
-                self._running = False
 
-            def join(self, timeout=None):
-                return
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PI_BRAIN robot main entrypoint")
+    parser.add_argument("--no-hw-check", action="store_true", help="Skip hardware validation (dev)")
+    parser.add_argument("--no-vision", action="store_true", help="Disable vision subsystem (dev)")
+    parser.add_argument("--cold-check", action="store_true",
+                        help="Run the full hardware validation instead of warm-restart probes")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--import-report", action="store_true",
+                        help="Print an import-time breakdown once the robot is ready")
 
-            def wait_ready(self, timeout=None):
-                return True
+    args = parser.parse_args(argv)
 
-            def get_target(self):
-                return {"center": None, "width": None}
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format="[%(levelname)s] %(message)s")
 
-        try:
-            startup.VisionEngine = DummyVisionEngine
-        except Exception:
-            logging.warning("Could not patch VisionEngine; continuing anyway")
+    logging.info("Starting PI_BRAIN (main entrypoint)")
+
+    # Import here so sys.path is already configured
+    try:
+        import startup.startup as startup
+    except Exception as e:
+        logging.error("Failed to import startup module: %s", e)
+        raise
+
+    apply_dev_options(startup, no_hw_check=args.no_hw_check, no_vision=args.no_vision)
 
     # Run startup main (it will register its own signal handler and perform initialize + run)
     try:
-        startup.main()
+        startup.main(cold_validation=args.cold_check)
     except SystemExit as se:
         # Propagate clean exits
         logging.info("Exiting: %s", se)
@@ -2,12 +2,18 @@ import time
 import adafruit_dht
 import threading
 
+from config import settings
+from sensors.health import SourceHealth
+from sensors.subscriptions import notify
+
 class DHT11Sensor:
     MIN_READ_INTERVAL = 2.0
 
     def __init__(self, board_pin):
         self.dht_device = adafruit_dht.DHT11(board_pin)
         self.latest_data = None
+        self.health = SourceHealth("dht11", settings.DHT11_STALE_AFTER)
+        self.on_publish = None  # set by RobotSensors (subscriptions)
         self._last_read_time = 0
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._loop, daemon=True)
@@ -35,6 +41,8 @@ class DHT11Sensor:
                     "timestamp": round(now, 2),
                     "valid": valid
                 }
+                self.health.record(valid)
+                notify(self.on_publish, self.latest_data)
 
             time.sleep(0.5)
 
@@ -1,45 +1,237 @@
-import serial
 import threading
 import time
 
-class GPSModule:
-    def __init__(self, port, baudrate=9600):
-        self.serial = serial.Serial(port, baudrate, timeout=1)
-        self.latest_data = None
+from config import settings
+from core.lazy_import import lazy_module
+from sensors.health import SourceHealth
+from sensors.subscriptions import notify
 
-        self._stop_event = threading.Event()
-        self._thread = threading.Thread(target=self._loop, daemon=True)
-        self._thread.start()
+serial = lazy_module("serial")  # pyserial, imported when the port is opened
+
+KNOTS_TO_KMH = 1.852
+
+
+class NMEAParser:
+    """
+    Incremental NMEA 0183 parser.
+
+    feed() accepts raw bytes in arbitrary chunks; complete sentences are
+    checksum-validated and merged into one position fix. Understands
+    GGA, RMC, VTG and GSA from any talker (GP, GN, GL, ...).
+    """
+
+    MAX_BUFFER = 4096  # drop garbage that never contains a newline
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.sentences = 0
+        self.checksum_errors = 0
+
+        self.latitude = None
+        self.longitude = None
+        self.altitude = None
+        self.speed = None        # km/h
+        self.course = None       # degrees true
+        self.fix_quality = 0     # GGA: 0 = none, 1 = GPS, 2 = DGPS, ...
+        self.fix_type = 1        # GSA: 1 = none, 2 = 2D, 3 = 3D
+        self.satellites = None
+        self.hdop = None
+        self.rmc_valid = False
+
+    # =========================
+    # STREAM HANDLING
+    # =========================
+    def feed(self, data):
+        """
+        Append raw bytes and parse every complete sentence.
+
+        Returns:
+            int: Number of valid sentences parsed from this chunk
+        """
+        buf = self._buffer
+        buf.extend(data)
+
+        parsed = 0
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            line = bytes(buf[start:end]).strip()
+            start = end + 1
+            if line and self.parse_sentence(line):
+                parsed += 1
+        del buf[:start]
+
+        if len(buf) > self.MAX_BUFFER:
+            buf.clear()
+        return parsed
+
+    @staticmethod
+    def checksum_ok(line):
+        """Validate `$...*HH`. Sentences without a checksum are rejected."""
+        star = line.rfind(b"*")
+        if not line.startswith(b"$") or star < 0 or len(line) < star + 3:
+            return False
+        calc = 0
+        for byte in line[1:star]:
+            calc ^= byte
+        try:
+            return calc == int(line[star + 1:star + 3], 16)
+        except ValueError:
+            return False
+
+    def parse_sentence(self, line):
+        """Parse one sentence (bytes). Returns True if it was understood."""
+        if not self.checksum_ok(line):
+            self.checksum_errors += 1
+            return False
+
+        body = line[1:line.rfind(b"*")].decode("ascii", errors="ignore")
+        fields = body.split(",")
+        kind = fields[0][-3:]
+
+        handler = {
+            "GGA": self._parse_gga,
+            "RMC": self._parse_rmc,
+            "VTG": self._parse_vtg,
+            "GSA": self._parse_gsa,
+        }.get(kind)
+        if handler is None:
+            return False
 
-    def _parse_nmea(self, line):
-        if not line.startswith("$GPGGA"):
-            return None
+        try:
+            handler(fields)
+        except (ValueError, IndexError):
+            return False
+        self.sentences += 1
+        return True
 
-        parts = line.split(",")
-        if len(parts) < 6 or parts[2] == "" or parts[4] == "":
-            return None
+    # =========================
+    # SENTENCES
+    # =========================
+    def _parse_gga(self, f):
+        self.fix_quality = _int(f[6]) or 0
+        self.satellites = _int(f[7])
+        self.hdop = _float(f[8])
+        if self.fix_quality > 0:
+            self.latitude = _coord(f[2], f[3])
+            self.longitude = _coord(f[4], f[5])
+            self.altitude = _float(f[9])
 
-        lat = parts[2]
-        lon = parts[4]
+    def _parse_rmc(self, f):
+        self.rmc_valid = f[2] == "A"
+        if self.rmc_valid:
+            self.latitude = _coord(f[3], f[4])
+            self.longitude = _coord(f[5], f[6])
+            knots = _float(f[7])
+            if knots is not None:
+                self.speed = round(knots * KNOTS_TO_KMH, 2)
+            course = _float(f[8])
+            if course is not None:
+                self.course = course
 
+    def _parse_vtg(self, f):
+        course = _float(f[1])
+        if course is not None:
+            self.course = course
+        kmh = _float(f[7])
+        if kmh is not None:
+            self.speed = kmh
+
+    def _parse_gsa(self, f):
+        self.fix_type = _int(f[2]) or 1
+        hdop = _float(f[16])
+        if hdop is not None:
+            self.hdop = hdop
+
+    # =========================
+    # OUTPUT
+    # =========================
+    @property
+    def has_fix(self):
+        return (self.fix_quality > 0 or self.rmc_valid) and self.latitude is not None
+
+    def snapshot(self):
+        fix = self.has_fix
         return {
-            "latitude_raw": lat,
-            "longitude_raw": lon
+            "latitude": self.latitude if fix else None,
+            "longitude": self.longitude if fix else None,
+            "altitude": self.altitude if fix else None,
+            "speed": self.speed if fix else None,
+            "course": self.course if fix else None,
+            "fix": fix,
+            "fix_quality": self.fix_quality,
+            "fix_type": self.fix_type,
+            "satellites": self.satellites,
+            "hdop": self.hdop
         }
 
+
+def _float(value):
+    return float(value) if value else None
+
+
+def _int(value):
+    return int(value) if value else None
+
+
+def _coord(value, hemisphere):
+    """Convert NMEA ddmm.mmmm / dddmm.mmmm to signed decimal degrees."""
+    if not value or not hemisphere:
+        return None
+    dot = value.find(".")
+    head = dot if dot >= 0 else len(value)
+    degrees = float(value[:head - 2])
+    minutes = float(value[head - 2:])
+    decimal = degrees + minutes / 60.0
+    if hemisphere in ("S", "W"):
+        decimal = -decimal
+    return round(decimal, 7)
+
+
+class GPSModule:
+    POLL_INTERVAL = 0.05  # seconds to wait when nothing is buffered
+
+    def __init__(self, port, baudrate=9600):
+        # timeout=0 -> read() never blocks, we only read what is waiting
+        self.serial = serial.Serial(port, baudrate, timeout=0)
+        self.parser = NMEAParser()
+        self.latest_data = None
+        # Health tracks the NMEA stream itself; fix quality is in the data
+        self.health = SourceHealth("gps", settings.GPS_STALE_AFTER)
+        self.on_publish = None  # set by RobotSensors (subscriptions)
+        self._checksum_errors = 0
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
     def _loop(self):
         while not self._stop_event.is_set():
             try:
-                line = self.serial.readline().decode("ascii", errors="ignore").strip()
-                parsed = self._parse_nmea(line)
-                if parsed:
+                waiting = self.serial.in_waiting
+                if not waiting:
+                    self._stop_event.wait(self.POLL_INTERVAL)
+                    continue
+
+                if self.parser.feed(self.serial.read(waiting)):
+                    gps = self.parser.snapshot()
                     self.latest_data = {
-                        "gps": parsed,
+                        "gps": gps,
                         "timestamp": round(time.time(), 2),
-                        "valid": True
+                        "valid": gps["fix"]
                     }
+                    self.health.record(True)
+                    notify(self.on_publish, self.latest_data)
+
+                bad = self.parser.checksum_errors - self._checksum_errors
+                if bad:
+                    self._checksum_errors = self.parser.checksum_errors
+                    self.health.error(bad)
             except Exception:
-                pass
+                self.health.error()
+                self._stop_event.wait(self.POLL_INTERVAL)
 
     def read(self):
         return self.latest_data
@@ -47,4 +239,4 @@ class GPSModule:
     def close(self):
         self._stop_event.set()
         if self.serial.is_open:
-            self.serial.close()
\ No newline at end of file
+            self.serial.close()
@@ -0,0 +1,82 @@
+# health.py
+import time
+
+
+class SourceHealth:
+    """
+    Freshness and error bookkeeping for one sensor source.
+
+    Drivers call record()/error() when they publish, which is O(1) and
+    lock-free. Readers call snapshot(), which only derives the age.
+    All times are time.monotonic() so wall-clock jumps don't fake staleness.
+    """
+
+    RATE_SMOOTHING = 0.2  # EWMA weight of the newest interval
+
+    def __init__(self, name, max_age):
+        self.name = name
+        self.max_age = max_age
+
+        self.last_update = None
+        self.first_valid_at = None
+        self.created_at = time.monotonic()
+        self.rate_hz = 0.0
+
+        self.updates = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.last_valid = False
+
+    def record(self, valid=True):
+        """A new sample was published (valid=False for e.g. an echo timeout)."""
+        now = time.monotonic()
+        last = self.last_update
+        if last is not None and now > last:
+            rate = 1.0 / (now - last)
+            self.rate_hz = rate if self.rate_hz == 0.0 else \
+                self.rate_hz + self.RATE_SMOOTHING * (rate - self.rate_hz)
+        self.last_update = now
+        self.updates += 1
+        self.last_valid = valid
+
+        if valid:
+            self.consecutive_errors = 0
+            if self.first_valid_at is None:
+                self.first_valid_at = now
+        else:
+            self.errors += 1
+            self.consecutive_errors += 1
+
+    def error(self, count=1):
+        """The driver failed to produce a sample at all."""
+        self.errors += count
+        self.consecutive_errors += count
+        self.last_valid = False
+
+    def age(self, now=None):
+        if self.last_update is None:
+            return None
+        return (now or time.monotonic()) - self.last_update
+
+    def snapshot(self, now=None):
+        """
+        Returns:
+            dict: {
+                "age": float or None,     # seconds since last sample
+                "rate_hz": float,         # measured update rate
+                "errors": int,            # total failed / invalid samples
+                "consecutive_errors": int,
+                "stale": bool,            # no sample within max_age
+                "valid": bool             # fresh AND last sample valid
+            }
+        """
+        age = self.age(now)
+        stale = age is None or age > self.max_age
+        return {
+            "age": round(age, 3) if age is not None else None,
+            "rate_hz": round(self.rate_hz, 2),
+            "errors": self.errors,
+            "consecutive_errors": self.consecutive_errors,
+            "stale": stale,
+            "valid": self.last_valid and not stale
+        }
@@ -0,0 +1,46 @@
+# mcp3008.py
+import spidev
+import threading
+
+
+class MCP3008:
+    """
+    8-channel 10-bit SPI ADC.
+
+    Single-ended reads: send [start, single|channel, 0] and take the low
+    10 bits of the reply. A lock serializes channels shared by several drivers.
+    """
+
+    MAX_VALUE = 1023
+
+    def __init__(self, bus=0, device=0, max_speed_hz=1350000):
+        self.spi = spidev.SpiDev()
+        self.spi.open(bus, device)
+        self.spi.max_speed_hz = max_speed_hz
+        self.spi.mode = 0
+        self._lock = threading.Lock()
+
+    def read(self, channel):
+        """Read one raw sample (0-1023) from channel 0-7."""
+        with self._lock:
+            reply = self.spi.xfer2([1, (8 + channel) << 4, 0])
+        return ((reply[1] & 0x03) << 8) | reply[2]
+
+    def read_sum(self, channel, count):
+        """
+        Read `count` back-to-back samples and return their integer sum.
+
+        The caller divides once, so oversampling costs one SPI transfer
+        and one add per sample.
+        """
+        command = (8 + channel) << 4
+        total = 0
+        with self._lock:
+            xfer = self.spi.xfer2
+            for _ in range(count):
+                reply = xfer([1, command, 0])
+                total += ((reply[1] & 0x03) << 8) | reply[2]
+        return total
+
+    def close(self):
+        self.spi.close()
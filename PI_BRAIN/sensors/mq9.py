@@ -3,30 +3,185 @@ import RPi.GPIO as GPIO
 import time
 import threading
 
+from config import settings
+from sensors.health import SourceHealth
+from sensors.subscriptions import notify
+
+
 class MQ9Sensor:
-    def __init__(self, pin):
+    """
+    MQ-9 CO sensor.
+
+    Analog mode (adc given): oversample the heater/load divider through an
+    MCP3008, convert to Rs/R0 and then to ppm with the datasheet power-law
+    curve ppm = A * (Rs/R0)^B. `dangerous_CO` uses GAS_THRESHOLD with
+    hysteresis so the alarm does not chatter around the limit.
+
+    Analog readings pinned at either end of the ADC range are wiring
+    faults, not gas levels (no MCP3008 or sensor reads 0): they are
+    published as valid=False, and `dangerous_CO` comes from the comparator
+    pin if one is wired, else keeps its last state.
+
+    Digital mode (no adc): read the module's comparator pin (no ppm).
+    """
+
+    def __init__(self, pin=None, adc=None, channel=None):
         self.pin = pin
+        self.adc = adc
+        self.channel = settings.MQ9_ADC_CHANNEL if channel is None else channel
+
+        self.r0 = settings.MQ9_R0_KOHM
+        self.oversample = settings.MQ9_OVERSAMPLE
+        self.interval = settings.MQ9_SAMPLE_INTERVAL
+        self._dangerous = False
+
         self.latest_data = None
+        self.health = SourceHealth("mq9", settings.MQ9_STALE_AFTER)
+        self.on_publish = None  # set by RobotSensors (subscriptions)
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._loop, daemon=True)
 
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setup(self.pin, GPIO.IN)
+        if self.adc is None or self.pin is not None:
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setup(self.pin, GPIO.IN)
         self._thread.start()
 
+    # =========================
+    # CONVERSION
+    # =========================
+    def _read_average(self):
+        """Burst-oversample the ADC and return the mean raw value."""
+        return self.adc.read_sum(self.channel, self.oversample) / self.oversample
+
+    @staticmethod
+    def adc_fault(raw):
+        """'open circuit' / 'short circuit' for a reading pinned at an end of the range, else None."""
+        margin = settings.MQ9_ADC_FAULT_MARGIN
+        if raw <= margin:
+            return "open circuit"   # no current through Rs (or no ADC at all)
+        if raw >= settings.MQ9_ADC_MAX - margin:
+            return "short circuit"
+        return None
+
+    @staticmethod
+    def raw_to_rs(raw):
+        """
+        Sensor resistance (kOhm) from a raw ADC value.
+
+        The ADC measures V_RL across the load resistor:
+            Rs = RL * (Vc - V_RL) / V_RL
+        Vc and the ADC reference are the same rail, so volts cancel out.
+        Check adc_fault() first; raw <= 0 raises ValueError.
+        """
+        if raw <= 0:
+            raise ValueError("MQ-9 ADC reads 0 (open circuit)")
+        full = float(settings.MQ9_ADC_MAX)
+        return settings.MQ9_LOAD_RESISTANCE_KOHM * (full - raw) / raw
+
+    def rs_to_ppm(self, rs):
+        ratio = max(rs / self.r0, 1e-3)  # Rs -> 0 would blow up the power law
+        return settings.MQ9_CURVE_A * (ratio ** settings.MQ9_CURVE_B), ratio
+
+    def _update_danger(self, ppm):
+        """Apply GAS_THRESHOLD with hysteresis."""
+        if self._dangerous:
+            if ppm < settings.GAS_THRESHOLD - settings.GAS_HYSTERESIS_PPM:
+                self._dangerous = False
+        elif ppm >= settings.GAS_THRESHOLD:
+            self._dangerous = True
+        return self._dangerous
+
+    def calibrate_r0(self, samples=50, delay=0.1):
+        """
+        Measure R0 in clean air (sensor must be pre-heated).
+
+        Returns:
+            float: R0 in kOhm (also applied to this instance)
+        """
+        if self.adc is None:
+            raise RuntimeError("R0 calibration needs the ADC")
+
+        total = 0.0
+        for _ in range(samples):
+            raw = self._read_average()
+            fault = self.adc_fault(raw)
+            if fault:
+                raise RuntimeError(f"R0 calibration failed: MQ-9 {fault} (raw {raw:.0f})")
+            total += self.raw_to_rs(raw)
+            time.sleep(delay)
+        self.r0 = (total / samples) / settings.MQ9_CLEAN_AIR_RATIO
+        return self.r0
+
+    # =========================
+    # THREAD
+    # =========================
     def _loop(self):
         while not self._stop_event.is_set():
-            dangerous = GPIO.input(self.pin) == GPIO.HIGH
+            if self.adc is not None:
+                self._sample_analog()
+            else:
+                dangerous = GPIO.input(self.pin) == GPIO.HIGH
+                self.latest_data = {
+                    "mq9": {"dangerous_CO": dangerous},
+                    "timestamp": round(time.time(), 2),
+                    "valid": True
+                }
+                self.health.record(True)
+                notify(self.on_publish, self.latest_data)
+            self._stop_event.wait(self.interval)
+
+    def _sample_analog(self):
+        try:
+            raw = self._read_average()
+            fault = self.adc_fault(raw)
+            if fault:
+                self._publish_fault(raw, fault)
+                return
+            ppm, ratio = self.rs_to_ppm(self.raw_to_rs(raw))
             self.latest_data = {
-                "mq9": {"dangerous_CO": dangerous},
+                "mq9": {
+                    "co_ppm": round(ppm, 1),
+                    "rs_r0": round(ratio, 3),
+                    "raw": round(raw, 1),
+                    "dangerous_CO": self._update_danger(ppm)
+                },
                 "timestamp": round(time.time(), 2),
                 "valid": True
             }
-            time.sleep(1)
+            self.health.record(True)
+            notify(self.on_publish, self.latest_data)
+        except Exception:
+            # Keep the last danger state; a failed read must not clear an alarm
+            self.latest_data = {
+                "mq9": {"co_ppm": None, "dangerous_CO": self._dangerous},
+                "timestamp": round(time.time(), 2),
+                "valid": False
+            }
+            self.health.error()
+            notify(self.on_publish, self.latest_data)
+
+    def _publish_fault(self, raw, fault):
+        """A sample arrived but the circuit is open/shorted: not a measurement."""
+        dangerous = self._dangerous
+        if self.pin is not None:
+            # The module's comparator still works without the analog path
+            dangerous = GPIO.input(self.pin) == GPIO.HIGH
+        self.latest_data = {
+            "mq9": {"co_ppm": None, "raw": round(raw, 1), "fault": fault,
+                    "dangerous_CO": dangerous},
+            "timestamp": round(time.time(), 2),
+            "valid": False
+        }
+        self.health.record(False)
+        notify(self.on_publish, self.latest_data)
 
     def read(self):
         return self.latest_data
 
     def cleanup(self):
         self._stop_event.set()
-        GPIO.cleanup()
+        if self.adc is not None:
+            self.adc.close()
+        else:
+            GPIO.cleanup()
+
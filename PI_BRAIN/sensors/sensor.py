@@ -6,11 +6,16 @@ The schema returned by read() is FROZEN and trusted by all consumers.
 """
 
 from sensors.mq9 import MQ9Sensor
+from sensors.mcp3008 import MCP3008
 from sensors.ultrasonic import UltrasonicArray
 from sensors.gps import GPSModule
 from sensors.dht11 import DHT11Sensor
+from sensors.subscriptions import SensorSubscriptions
 from config.settings import *
+from config import settings
 import board
+import threading
+import time
 
 try:
     import RPi.GPIO as GPIO
@@ -25,6 +30,59 @@ except Exception:
         GPIO_AVAILABLE = True
 
 
+# =========================
+# SCHEMA SECTIONS
+# =========================
+# Each helper maps a driver's latest_data (or None before the first poll)
+# onto its section of the stable schema.
+
+def _payload(raw, key):
+    return (raw or {}).get(key) or {}
+
+
+def _ultrasonic_section(raw):
+    data = _payload(raw, "ultrasonic")
+    return {
+        "left": data.get("left"),
+        "right": data.get("right")
+    }
+
+
+def _dht11_section(raw):
+    data = _payload(raw, "dht11")
+    return {
+        "temperature_c": data.get("temperature_c"),
+        "humidity": data.get("humidity_pct")
+    }
+
+
+def _mq9_section(raw):
+    data = _payload(raw, "mq9")
+    return {
+        "co_ppm": data.get("co_ppm"),
+        "dangerous": data.get("dangerous_CO", False)
+    }
+
+
+def _gps_section(raw):
+    data = _payload(raw, "gps")
+    return {
+        "latitude": data.get("latitude"),
+        "longitude": data.get("longitude"),
+        "altitude": data.get("altitude"),
+        "speed": data.get("speed"),
+        "fix": data.get("fix", False)
+    }
+
+
+_SECTIONS = {
+    "ultrasonic": _ultrasonic_section,
+    "dht11": _dht11_section,
+    "mq9": _mq9_section,
+    "gps": _gps_section
+}
+
+
 class RobotSensors:
     """
     Central sensor interface.
@@ -35,13 +93,35 @@ class RobotSensors:
     
     def __init__(self):
         # Initialize all sensor modules
-        self.mq9 = MQ9Sensor(MQ9_SENSOR_PIN)
+        self.mq9 = self._create_mq9()
         self.ultrasonic = UltrasonicArray({
             "left": {"trig": LEFT_ULTRASONIC_SENSOR_TRIG_PIN, "echo": LEFT_ULTRASONIC_SENSOR_ECHO_PIN},
             "right": {"trig": RIGHT_ULTRASONIC_SENSOR_TRIG_PIN, "echo": RIGHT_ULTRASONIC_SENSOR_ECHO_PIN}
         })
         self.gps = GPSModule(GPS_MODULE_PORT)
         self.dht11 = DHT11Sensor(board.D4)
+
+        # Sources with health tracking (see sensors/health.py)
+        self._sources = {
+            "ultrasonic": self.ultrasonic,
+            "dht11": self.dht11,
+            "mq9": self.mq9,
+            "gps": self.gps
+        }
+
+        # Threshold/change/validity subscriptions, evaluated by the drivers
+        # as they publish (see sensors/subscriptions.py)
+        self.subscriptions = SensorSubscriptions()
+        self._ready = {name: threading.Event() for name in self._sources}
+        for name, source in self._sources.items():
+            source.on_publish = self._publisher(name)
+        # The driver threads started in their constructors; a first valid
+        # sample published before its hook was attached never reached it.
+        # Drivers record health before calling on_publish, so any sample
+        # not seen here goes through the hook.
+        for name, source in self._sources.items():
+            if source.health.first_valid_at is not None:
+                self._ready[name].set()
         
         # Initialize orientation sensor (flip detector)
         self._orientation_pin = getattr(settings, 'FLIP_SENSOR_PIN', None)
@@ -59,6 +139,41 @@ class RobotSensors:
             except Exception:
                 self._orientation_available = False
 
+    def _publisher(self, name):
+        """Build the on_publish hook for one driver."""
+        section = _SECTIONS[name]
+        publish = self.subscriptions.publish
+        ready = self._ready[name]
+
+        def on_publish(raw):
+            valid = bool((raw or {}).get("valid"))
+            if valid and not ready.is_set():
+                ready.set()
+            publish(name, section(raw), valid)
+        return on_publish
+
+    def wait_ready(self, name, timeout=None):
+        """
+        Block until `name` (ultrasonic, dht11, mq9, gps) has published its
+        first valid sample. Returns False on timeout. Replaces fixed
+        settle sleeps; several sources can be awaited concurrently.
+        """
+        return self._ready[name].wait(timeout)
+
+    def first_valid_times(self):
+        """{source: monotonic time of its first valid sample, or None}."""
+        return {name: source.health.first_valid_at for name, source in self._sources.items()}
+
+    def _create_mq9(self):
+        """Analog MQ-9 through the MCP3008 when configured, else the digital pin."""
+        if MQ9_ADC_CHANNEL is not None:
+            try:
+                adc = MCP3008(MCP3008_SPI_BUS, MCP3008_SPI_DEVICE)
+                return MQ9Sensor(MQ9_SENSOR_PIN, adc=adc, channel=MQ9_ADC_CHANNEL)
+            except Exception as e:
+                print(f"[Sensors] MCP3008 unavailable ({e}) - MQ-9 digital pin only")
+        return MQ9Sensor(MQ9_SENSOR_PIN)
+
     def read(self):
         """
         Read all sensors and return STABLE schema.
@@ -88,50 +203,33 @@ class RobotSensors:
                 "orientation": {
                     "flipped": bool,      # True if robot is upside down
                     "available": bool     # True if sensor is working
+                },
+                "health": {
+                    "<ultrasonic|dht11|mq9|gps>": {
+                        "age": float or None,      # seconds since last sample
+                        "rate_hz": float,          # measured update rate
+                        "errors": int,
+                        "consecutive_errors": int,
+                        "stale": bool,
+                        "valid": bool              # fresh and last sample valid
+                    }
                 }
             }
+
+        Drivers only store their latest sample; this method never blocks
+        and is safe to call before the first poll (fields are None).
         """
-        # Read ultrasonic sensors
-        ultrasonic_raw = self.ultrasonic.read()
-        ultrasonic_data = ultrasonic_raw.get("ultrasonic", {})
-        
-        # Read DHT11 (temperature/humidity)
-        dht_raw = self.dht11.read()
-        dht_data = dht_raw.get("dht11", {})
-        
-        # Read MQ9 (gas sensor)
-        mq9_raw = self.mq9.read()
-        mq9_data = mq9_raw.get("mq9", {})
-        
-        # Read GPS
-        gps_raw = self.gps.read()
-        gps_data = gps_raw.get("gps", {})
-        
-        # Read orientation (flip sensor)
-        orientation = self._read_orientation()
-        
-        # Return STABLE schema
+        now = time.monotonic()
         return {
-            "ultrasonic": {
-                "left": ultrasonic_data.get("left"),
-                "right": ultrasonic_data.get("right")
-            },
-            "dht11": {
-                "temperature_c": dht_data.get("temperature"),
-                "humidity": dht_data.get("humidity")
-            },
-            "mq9": {
-                "co_ppm": mq9_data.get("co_ppm"),
-                "dangerous": mq9_data.get("dangerous_CO", False)
-            },
-            "gps": {
-                "latitude": gps_data.get("latitude"),
-                "longitude": gps_data.get("longitude"),
-                "altitude": gps_data.get("altitude"),
-                "speed": gps_data.get("speed"),
-                "fix": gps_data.get("latitude") is not None
-            },
-            "orientation": orientation
+            "ultrasonic": _ultrasonic_section(self.ultrasonic.read()),
+            "dht11": _dht11_section(self.dht11.read()),
+            "mq9": _mq9_section(self.mq9.read()),
+            "gps": _gps_section(self.gps.read()),
+            "orientation": self._read_orientation(),
+            "health": {
+                name: source.health.snapshot(now)
+                for name, source in self._sources.items()
+            }
         }
     
     def _read_orientation(self):
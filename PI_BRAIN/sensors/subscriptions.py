@@ -0,0 +1,235 @@
+"""
+subscriptions.py - Event subscriptions on top of the stable sensor schema.
+
+Drivers publish every new sample (already mapped to its schema section)
+and the hub evaluates only the subscriptions registered for that source,
+so consumers no longer have to poll read() and diff snapshots.
+
+Event format (dict):
+    {
+        "source": "mq9",          # schema section
+        "field": "co_ppm",        # None for validity events
+        "kind": "threshold" | "change" | "validity",
+        "value": ...,             # new value (validity: bool)
+        "previous": ...,          # last reported value (None at first)
+        "above": bool,            # threshold events only
+        "timestamp": float        # time.time() of the sample
+    }
+
+Delivery:
+    callback -> called in the publishing driver thread (keep it short)
+    queue    -> put_nowait(); when full the oldest event is dropped.
+                Several subscriptions may share one queue so a consumer can
+                block on a single get() for "anything relevant".
+
+Drivers hand samples over with notify(), so a failing hook can never
+kill a driver thread (its health would go stale and stop the robot).
+"""
+
+import abc
+import queue
+import threading
+import time
+
+DEFAULT_QUEUE_SIZE = 64
+
+
+def notify(on_publish, data):
+    """Call a driver's on_publish hook (if set); report, never raise."""
+    if on_publish is None:
+        return
+    try:
+        on_publish(data)
+    except Exception as e:
+        print(f"[Sensors] Publish hook failed: {e}")
+
+
+class Subscription(abc.ABC):
+    """Base subscription. Subclasses implement evaluate()."""
+
+    kind = None
+
+    def __init__(self, hub, source, field, callback=None, events=None):
+        self.hub = hub
+        self.source = source
+        self.field = field
+        self.callback = callback
+        # A queue is created when neither a callback nor a queue is given
+        if callback is None and events is None:
+            events = queue.Queue(maxsize=DEFAULT_QUEUE_SIZE)
+        self.events = events
+        self.active = True
+
+    @abc.abstractmethod
+    def evaluate(self, section, valid, timestamp):
+        """Check one published sample; _emit() an event if it fires."""
+
+    def get(self, timeout=None):
+        """Block until the next event (queue delivery only). None on timeout."""
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def cancel(self):
+        self.active = False
+        self.hub._remove(self)
+
+    def _emit(self, value, previous, timestamp, **extra):
+        event = {
+            "source": self.source,
+            "field": self.field,
+            "kind": self.kind,
+            "value": value,
+            "previous": previous,
+            "timestamp": timestamp
+        }
+        event.update(extra)
+
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"[Sensors] Subscription callback failed: {e}")
+
+        if self.events is not None:
+            # A shared queue has several publishing threads: another one may
+            # refill the slot we just freed, so retry until the put succeeds
+            while True:
+                try:
+                    self.events.put_nowait(event)
+                    return
+                except queue.Full:
+                    try:
+                        self.events.get_nowait()
+                    except queue.Empty:
+                        pass
+
+
+class ThresholdSubscription(Subscription):
+    """Fires when `field` crosses `threshold` (upwards at >= threshold,
+    downwards below threshold - hysteresis)."""
+
+    kind = "threshold"
+
+    def __init__(self, hub, source, field, threshold, hysteresis=0.0, **kwargs):
+        super().__init__(hub, source, field, **kwargs)
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.above = None
+        self.last = None
+
+    def evaluate(self, section, valid, timestamp):
+        value = section.get(self.field)
+        if value is None:
+            return
+
+        previous, self.last = self.last, value
+        if self.above:
+            if value < self.threshold - self.hysteresis:
+                self.above = False
+                self._emit(value, previous, timestamp, above=False)
+        elif value >= self.threshold:
+            self.above = True
+            self._emit(value, previous, timestamp, above=True)
+        else:
+            self.above = False
+
+
+class ChangeSubscription(Subscription):
+    """Fires when `field` moves by at least `delta` from the last reported
+    value (any change for non-numeric values and None transitions)."""
+
+    kind = "change"
+    _UNSET = object()
+
+    def __init__(self, hub, source, field, delta=0.0, **kwargs):
+        super().__init__(hub, source, field, **kwargs)
+        self.delta = delta
+        self.last = self._UNSET
+
+    def evaluate(self, section, valid, timestamp):
+        value = section.get(self.field)
+        last = self.last
+
+        if last is self._UNSET:
+            changed = True
+            last = None
+        elif value is None or last is None or isinstance(value, bool) \
+                or not isinstance(value, (int, float)):
+            changed = value != last
+        else:
+            changed = abs(value - last) >= self.delta and value != last
+
+        if changed:
+            self.last = value
+            self._emit(value, last, timestamp)
+
+
+class ValiditySubscription(Subscription):
+    """Fires when a source's published samples switch valid <-> invalid."""
+
+    kind = "validity"
+
+    def __init__(self, hub, source, **kwargs):
+        super().__init__(hub, source, None, **kwargs)
+        self.valid = None
+
+    def evaluate(self, section, valid, timestamp):
+        if valid != self.valid:
+            previous = self.valid
+            self.valid = valid
+            self._emit(valid, previous, timestamp)
+
+
+class SensorSubscriptions:
+    """Subscription hub owned by RobotSensors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # source -> tuple of subscriptions (copy-on-write, read lock-free)
+        self._by_source = {}
+
+    # =========================
+    # SUBSCRIBE
+    # =========================
+    def on_threshold(self, source, field, threshold, hysteresis=0.0,
+                     callback=None, queue=None):
+        return self._add(ThresholdSubscription(
+            self, source, field, threshold, hysteresis,
+            callback=callback, events=queue))
+
+    def on_change(self, source, field, delta=0.0, callback=None, queue=None):
+        return self._add(ChangeSubscription(
+            self, source, field, delta, callback=callback, events=queue))
+
+    def on_validity(self, source, callback=None, queue=None):
+        return self._add(ValiditySubscription(
+            self, source, callback=callback, events=queue))
+
+    # =========================
+    # PUBLISH (driver threads)
+    # =========================
+    def publish(self, source, section, valid):
+        """Evaluate the subscriptions of one source against a new sample."""
+        subs = self._by_source.get(source)
+        if not subs:
+            return
+        timestamp = time.time()
+        for sub in subs:
+            if sub.active:
+                sub.evaluate(section, valid, timestamp)
+
+    # =========================
+    # INTERNAL
+    # =========================
+    def _add(self, sub):
+        with self._lock:
+            current = self._by_source.get(sub.source, ())
+            self._by_source[sub.source] = current + (sub,)
+        return sub
+
+    def _remove(self, sub):
+        with self._lock:
+            current = self._by_source.get(sub.source, ())
+            self._by_source[sub.source] = tuple(s for s in current if s is not sub)
@@ -3,6 +3,10 @@ import RPi.GPIO as GPIO
 import time
 import threading
 
+from config import settings
+from sensors.health import SourceHealth
+from sensors.subscriptions import notify
+
 class UltrasonicArray:
     SPEED_OF_SOUND = 34300  # cm/s
 
@@ -10,6 +14,8 @@ class UltrasonicArray:
         self.sensors = sensors
         self.settle_time = settle_time
         self.latest_data = None
+        self.health = SourceHealth("ultrasonic", settings.ULTRASONIC_STALE_AFTER)
+        self.on_publish = None  # set by RobotSensors (subscriptions)
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._loop, daemon=True)
 
@@ -19,10 +25,16 @@ class UltrasonicArray:
             GPIO.setup(s["echo"], GPIO.IN)
             GPIO.output(s["trig"], False)
 
-        time.sleep(2)
+        # Settling happens on the driver thread; callers that need a
+        # reading wait for it (RobotSensors.wait_ready) instead of sleeping
         self._thread.start()
 
     def _measure_distance(self, trig, echo):
+        """
+        Distance in cm. An echo pulse that outlasts the sensor's range
+        means nothing is in front of it: ULTRASONIC_MAX_RANGE_CM (clear).
+        None only if the echo pin never goes high (wiring or GPIO fault).
+        """
         GPIO.output(trig, True)
         time.sleep(0.00001)
         GPIO.output(trig, False)
@@ -35,21 +47,31 @@ class UltrasonicArray:
                 return None
             start = time.time()
 
+        max_range = settings.ULTRASONIC_MAX_RANGE_CM
+        timeout = start + 2 * max_range / self.SPEED_OF_SOUND
+        end = start
         while GPIO.input(echo) == 1:
-            if time.time() > timeout:
-                return None
             end = time.time()
+            if end > timeout:
+                return max_range
 
         duration = end - start
-        return round((duration * self.SPEED_OF_SOUND) / 2, 2)
+        return min(round((duration * self.SPEED_OF_SOUND) / 2, 2), max_range)
 
     def _loop(self):
+        # Hold the triggers low briefly before the first ping
+        self._stop_event.wait(settings.ULTRASONIC_SETTLE_TIME)
         while not self._stop_event.is_set():
             data = {}
             valid = True
 
+            # valid=False only for faults; "nothing in range" is a valid
+            # max-range reading (staleness is judged by SourceHealth)
             for name, pins in self.sensors.items():
-                dist = self._measure_distance(pins["trig"], pins["echo"])
+                try:
+                    dist = self._measure_distance(pins["trig"], pins["echo"])
+                except RuntimeError:
+                    dist = None  # GPIO error
                 time.sleep(self.settle_time)
                 if dist is None:
                     valid = False
@@ -60,6 +82,8 @@ class UltrasonicArray:
                 "timestamp": round(time.time(), 2),
                 "valid": valid
             }
+            self.health.record(valid)
+            notify(self.on_publish, self.latest_data)
 
     def read(self):
         return self.latest_data
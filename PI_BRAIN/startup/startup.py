@@ -17,6 +17,7 @@ NOT responsible for:
 import sys
 import os
 import signal
+import threading
 import time
 
 # Add project root to path
@@ -31,11 +32,123 @@ from core.decision_engine import DecisionEngine
 from core import actions
 from vision.vision_engine import VisionEngine
 from camera.camera_manager import CameraManager
+from telemetry.telemetry_log import TelemetryWriter
+from core import speech_engine
+from core import lazy_import
+from core.device_registry import devices
+from core.validation_cache import ValidationCache, device_fingerprint
+from audio.speaker import Speaker
+from audio.speech_output import SpeechOutput
+from alarms.alarm_runner import AlarmRunner
+
+
+# Imported in the background during validation; the audio manager itself
+# is only created at the end of initialize()
+AUDIO_IMPORTS = ("numpy", "audio.audio_manager")
+
+
+class CheckRun:
+    """One validation check: its buffered output, result and timing."""
+
+    def __init__(self, name, func, timeout):
+        self.name = name
+        self.func = func
+        self.timeout = timeout
+        self.lines = []
+        self.ok = False
+        self.started = None     # monotonic
+        self.finished = None
+        self.timed_out = False
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def offer(self, name, handle, release):
+        """
+        Hand a device this check opened to the registry. A check that was
+        abandoned (timed out) while opening it releases it instead: nobody
+        will take it, and the next run or a retry must be able to open it.
+        Returns True if the device was handed over.
+        """
+        with self._lock:
+            if not self.timed_out:
+                devices.put(name, handle, release=release)
+                return True
+        try:
+            release()
+        except Exception as e:
+            print(f"[Validation] Could not release {name} after timeout: {e}")
+        return False
+
+
+def run_checks(checks, workers):
+    """
+    Run CheckRuns on at most `workers` daemon threads, each with its own
+    deadline counted from when it starts; each is called as func(lines, run).
+    A check past its deadline is abandoned (marked failed, its slot freed);
+    a hung device cannot stall boot. Returns the same CheckRuns, finished or
+    timed out.
+    """
+    slots = threading.Semaphore(workers)
+    cond = threading.Condition()
+
+    def worker(check):
+        slots.acquire()
+        with cond:
+            check.started = time.monotonic()
+            cond.notify_all()
+        lines = []
+        try:
+            ok = bool(check.func(lines, check))
+        except Exception as e:
+            lines.append(f"  ✗ {check.name} check failed: {e}")
+            ok = False
+        with cond:
+            # A check that was abandoned already gave its slot back
+            if not check.timed_out:
+                check.ok = ok
+                check.lines = lines
+                check.finished = time.monotonic()
+                slots.release()
+            cond.notify_all()
+
+    def abandon(check):
+        """Release the slot of a hung check so the rest keep running."""
+        with check._lock:
+            check.timed_out = True
+        check.finished = time.monotonic()
+        check.ok = False
+        check.lines.append(f"  ✗ {check.name} timed out after {check.timeout:.1f}s")
+        slots.release()
+
+    for check in checks:
+        threading.Thread(target=worker, args=(check,), daemon=True,
+                         name=f"check-{check.name}").start()
+
+    with cond:
+        while True:
+            now = time.monotonic()
+            running = [c for c in checks if c.started is not None and c.finished is None]
+            if all(c.finished is not None for c in checks):
+                break
+            for check in running:
+                if now - check.started >= check.timeout:
+                    abandon(check)
+            wait = [check.started + check.timeout - now for check in running
+                    if check.finished is None]
+            cond.wait(max(0.01, min(wait)) if wait else 0.1)
+    return checks
 
 
 class HardwareValidator:
     """Validates all robot hardware before startup."""
     
+    CRITICAL = ["camera", "microphone", "speaker", "ultrasonic", "orientation"]
+
     def __init__(self):
         self.results = {
             "camera": False,
@@ -48,33 +161,106 @@ class HardwareValidator:
             "gps": False,
             "orientation": False
         }
+        self.timings = {}   # component -> seconds its check took
+        self.elapsed = 0.0  # wall time of the whole validation
         self.critical_failed = []
         self.optional_failed = []
+        self.mode = None         # "cold" (full checks) or "warm" (liveness probes)
+        self.mode_reason = ""
+        self._cache = None
     
-    def validate_all(self, sensors):
+    def validate_all(self, sensors, cold=False):
         """
-        Run complete hardware validation.
+        Run hardware validation, full or warm.
+        
+        A full (cold) validation runs every check. If one passed within
+        VALIDATION_CACHE_TTL on the same devices (core/validation_cache.py),
+        only liveness probes run (warm): camera and microphone are opened
+        but not sampled, and the buzzer and LCD keep their cached results.
+        A failed warm validation falls back to a cold one; cold=True
+        forces it.
         
         Args:
             sensors: RobotSensors instance with stable schema
+            cold: Skip the cache and run every check
         
         Returns:
             bool: True if all CRITICAL components pass
         """
+        self._cache = ValidationCache()
+        fingerprint = device_fingerprint()
+        reason = "forced" if cold else self._cache.cold_reason(fingerprint, self.CRITICAL)
+        
+        if reason is None:
+            self.mode = "warm"
+            self.mode_reason = f"full validation {self._cache.age():.0f} s ago, liveness probes only"
+            if self._validate(sensors, warm=True):
+                return True
+            print("\n⚠ Warm validation failed - running full validation")
+            reason = "warm validation failed"
+        
+        self.mode = "cold"
+        self.mode_reason = reason
+        ok = self._validate(sensors, warm=False)
+        if ok:
+            self._cache.record(fingerprint, self.results)
+        return ok
+    
+    def _validate(self, sensors, warm):
+        """
+        Run the checks concurrently (settings.VALIDATION_WORKERS at a time),
+        each with its own deadline; their output is printed afterwards in
+        a fixed order, followed by the timing breakdown.
+        """
+        self.results = dict.fromkeys(self.results, False)
+        self.timings = {}
+        self.critical_failed = []
+        self.optional_failed = []
+        
         print("\n" + "=" * 60)
-        print("🔍 HARDWARE VALIDATION")
+        print(f"🔍 HARDWARE VALIDATION ({self.mode.upper()}: {self.mode_reason})")
         print("=" * 60)
         
         # Define critical vs optional components
-        critical = ["camera", "microphone", "speaker", "ultrasonic", "orientation"]
-        
-        # Run all checks
-        self._check_orientation(sensors)
-        self._check_camera()
-        self._check_microphone()
-        self._check_speaker()
-        self._check_lcd()
-        self._check_sensors(sensors)
+        critical = self.CRITICAL
+        
+        if warm:
+            device_checks = [
+                ("camera", self._probe_camera),
+                ("microphone", self._probe_microphone),
+                ("speaker", lambda out, run: self._cached_result(out, "speaker")),
+                ("lcd", lambda out, run: self._cached_result(out, "lcd")),
+            ]
+        else:
+            device_checks = [
+                ("camera", self._check_camera),
+                ("microphone", self._check_microphone),
+                ("speaker", lambda out, run: self._check_speaker(out)),
+                ("lcd", lambda out, run: self._check_lcd(out)),
+            ]
+        checks = [
+            ("orientation", lambda out, run: self._check_orientation(out, sensors)),
+            *device_checks,
+            ("ultrasonic", lambda out, run: self._check_ultrasonic(out, sensors)),
+            ("dht11", lambda out, run: self._check_dht11(out, sensors)),
+            ("mq9", lambda out, run: self._check_mq9(out, sensors)),
+            ("gps", lambda out, run: self._check_gps(out, sensors)),
+        ]
+        runs = [
+            CheckRun(name, func, settings.VALIDATION_TIMEOUTS.get(name, settings.VALIDATION_TIMEOUT))
+            for name, func in checks
+        ]
+        started = time.monotonic()
+        run_checks(runs, settings.VALIDATION_WORKERS)
+        self.elapsed = time.monotonic() - started
+        
+        # Print buffered output in a fixed order
+        for index, run in enumerate(runs, 1):
+            print(f"\n[{index}/{len(runs)}] Checking {run.name}...")
+            for line in run.lines:
+                print(line)
+            self.results[run.name] = run.ok
+            self.timings[run.name] = run.elapsed
         
         # Analyze results
         print("\n" + "-" * 60)
@@ -85,8 +271,9 @@ class HardwareValidator:
             is_critical = component in critical
             symbol = "✓" if status else "✗"
             priority = "[CRITICAL]" if is_critical else "[OPTIONAL]"
+            took = self.timings.get(component, 0.0) * 1000
             
-            print(f"{symbol} {component.upper():15} {priority:12} {'PASS' if status else 'FAIL'}")
+            print(f"{symbol} {component.upper():15} {priority:12} {'PASS' if status else 'FAIL':5} {took:7.0f} ms")
             
             if not status:
                 if is_critical:
@@ -95,6 +282,9 @@ class HardwareValidator:
                     self.optional_failed.append(component)
         
         print("-" * 60)
+        serial = sum(self.timings.values())
+        print(f"⏱ {self.mode.capitalize()} validation took {self.elapsed * 1000:.0f} ms "
+              f"(checks total {serial * 1000:.0f} ms, {settings.VALIDATION_WORKERS} workers)")
         
         # Summary
         if self.critical_failed:
@@ -110,219 +300,235 @@ class HardwareValidator:
         
         return True
     
-    def _check_orientation(self, sensors):
+    # Each check appends its output to `out` and returns True on PASS.
+    # Checks that open a device get their CheckRun and hand the device over
+    # with run.offer(), so an abandoned check does not leave it registered.
+
+    def _check_orientation(self, out, sensors):
         """
         Check if robot is upside down using sensor interface.
         
         This uses the stable sensor schema - NO direct GPIO access.
         """
-        print("\n[1/9] Checking orientation...")
+        sensor_data = sensors.read()
+        orientation = sensor_data.get("orientation", {})
         
-        try:
-            sensor_data = sensors.read()
-            orientation = sensor_data.get("orientation", {})
-            
-            if not orientation.get("available"):
-                print("  ⚠ Orientation sensor not available (assuming correct)")
-                self.results["orientation"] = True
-                return
-            
-            is_flipped = orientation.get("flipped", False)
-            
-            if is_flipped:
-                print("  ✗ Robot is UPSIDE DOWN!")
-                print("  → Please flip the robot right-side up")
-                self.results["orientation"] = False
-            else:
-                print("  ✓ Orientation correct")
-                self.results["orientation"] = True
-                
-        except Exception as e:
-            print(f"  ✗ Orientation check failed: {e}")
-            self.results["orientation"] = False
+        if not orientation.get("available"):
+            out.append("  ⚠ Orientation sensor not available (assuming correct)")
+            return True
+        
+        if orientation.get("flipped", False):
+            out.append("  ✗ Robot is UPSIDE DOWN!")
+            out.append("  → Please flip the robot right-side up")
+            return False
+        out.append("  ✓ Orientation correct")
+        return True
     
-    def _check_camera(self):
-        """Check camera functionality."""
-        print("\n[2/9] Checking camera...")
+    def _check_camera(self, out, run):
+        """Check camera functionality; a working camera stays open for VisionEngine."""
+        cam = CameraManager()
         try:
-            cam = CameraManager()
             frame = cam.read_frame()
+        except Exception:
             cam.release()
-            
-            if frame is not None and frame.size > 0:
-                print(f"  ✓ Camera working (resolution: {frame.shape[1]}x{frame.shape[0]})")
-                self.results["camera"] = True
-            else:
-                print("  ✗ Camera returned empty frame")
-                self.results["camera"] = False
-                
-        except Exception as e:
-            print(f"  ✗ Camera failed: {e}")
-            self.results["camera"] = False
+            raise
+        
+        if frame is not None and frame.size > 0:
+            out.append(f"  ✓ Camera working (resolution: {frame.shape[1]}x{frame.shape[0]})")
+            run.offer("camera", cam, cam.release)
+            return True
+        cam.release()
+        out.append("  ✗ Camera returned empty frame")
+        return False
     
-    def _check_microphone(self):
-        """Check microphone functionality."""
-        print("\n[3/9] Checking microphone...")
+    def _check_microphone(self, out, run):
+        """
+        Check microphone functionality. The stream is opened in the capture
+        format and, if it works, paused and left for CaptureStream.
+        """
+        from audio.capture import close_input, open_input
+        
+        pa, stream = open_input()
         try:
-            import pyaudio
-            
-            p = pyaudio.PyAudio()
-            
-            # Try to open microphone stream
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=16000,
-                input=True,
-                frames_per_buffer=1024
-            )
-            
             # Read a small audio chunk
             data = stream.read(1024, exception_on_overflow=False)
-            
+        except Exception:
+            close_input(pa, stream)
+            raise
+        
+        if data:
+            out.append("  ✓ Microphone working")
             stream.stop_stream()
-            stream.close()
-            p.terminate()
-            
-            if data:
-                print("  ✓ Microphone working")
-                self.results["microphone"] = True
-            else:
-                print("  ✗ Microphone returned no data")
-                self.results["microphone"] = False
-                
-        except Exception as e:
-            print(f"  ✗ Microphone failed: {e}")
-            self.results["microphone"] = False
+            run.offer("microphone", (pa, stream), lambda: close_input(pa, stream))
+            return True
+        close_input(pa, stream)
+        out.append("  ✗ Microphone returned no data")
+        return False
     
-    def _check_speaker(self):
+    def _check_speaker(self, out):
         """Check speaker functionality using test helper."""
-        print("\n[4/9] Checking speaker...")
-        try:
-            # Use minimal test helper - NOT behavior-level action
-            actions.hardware_test_beep()
-            time.sleep(0.2)
-            
-            print("  ✓ Speaker working (test beep played)")
-            self.results["speaker"] = True
-            
-        except Exception as e:
-            print(f"  ✗ Speaker failed: {e}")
-            self.results["speaker"] = False
+        # Use minimal test helper - NOT behavior-level action
+        actions.hardware_test_beep()
+        time.sleep(0.2)
+        
+        out.append("  ✓ Speaker working (test beep played)")
+        return True
     
-    def _check_lcd(self):
+    def _check_lcd(self, out):
         """Check LCD screen functionality using test helper."""
-        print("\n[5/9] Checking LCD screen...")
-        try:
-            # Use minimal test helper - NOT behavior-level action
-            actions.hardware_test_lcd()
-            
-            print("  ✓ LCD screen working")
-            self.results["lcd"] = True
-            
-        except Exception as e:
-            print(f"  ✗ LCD failed: {e}")
-            self.results["lcd"] = False
-    
-    def _check_sensors(self, sensors):
-        """
-        Check all sensor modules using stable schema.
+        # Use minimal test helper - NOT behavior-level action
+        actions.hardware_test_lcd()
         
-        This trusts the sensor interface - NO schema guessing.
-        """
+        out.append("  ✓ LCD screen working")
+        return True
+    
+    # Warm-start probes: the device is there and opens; the cold checks'
+    # frames, samples, beep and LCD test are not repeated.
+
+    def _probe_camera(self, out, run):
+        """Open the camera (no frame) and hand it to VisionEngine."""
+        cam = CameraManager()
+        run.offer("camera", cam, cam.release)
+        out.append("  ✓ Camera opens (warm probe)")
+        return True
+
+    def _probe_microphone(self, out, run):
+        """Open the capture stream (no read) and hand it to CaptureStream."""
+        from audio.capture import close_input, open_input
+        
+        pa, stream = open_input()
+        stream.stop_stream()
+        run.offer("microphone", (pa, stream), lambda: close_input(pa, stream))
+        out.append("  ✓ Microphone opens (warm probe)")
+        return True
+
+    def _cached_result(self, out, name):
+        """Result of the last full validation, for checks with visible/audible side effects."""
+        ok = bool(self._cache.results.get(name))
+        out.append(f"  {'✓' if ok else '✗'} {'Passed' if ok else 'Failed'} in last full validation (cached)")
+        return ok
+
+    # Sensor checks trust the stable schema - NO schema guessing.
+
+    def _sensor_data(self, out, sensors, name):
+        """Wait (bounded) for the first valid sample from `name`, then read."""
         if not sensors:
-            print("\n[6-9/9] ✗ Sensor interface not available")
-            self.results["ultrasonic"] = False
-            self.results["dht11"] = False
-            self.results["mq9"] = False
-            self.results["gps"] = False
-            return
+            out.append("  ✗ Sensor interface not available")
+            return None
+        timeout = settings.SENSOR_READY_TIMEOUTS.get(name, settings.SENSOR_READY_TIMEOUT)
+        sensors.wait_ready(name, timeout)
+        return sensors.read()
+
+    def _check_ultrasonic(self, out, sensors):
+        sensor_data = self._sensor_data(out, sensors, "ultrasonic")
+        if sensor_data is None:
+            return False
+        ultrasonic = sensor_data.get("ultrasonic", {})
+        left = ultrasonic.get("left")
+        right = ultrasonic.get("right")
         
-        try:
-            # Read using STABLE schema
-            sensor_data = sensors.read()
-            
-            # Check Ultrasonic sensors
-            print("\n[6/9] Checking ultrasonic sensors...")
-            ultrasonic = sensor_data.get("ultrasonic", {})
-            left = ultrasonic.get("left")
-            right = ultrasonic.get("right")
-            
-            if left is not None and right is not None:
-                if 2 <= left <= 400 and 2 <= right <= 400:
-                    print(f"  ✓ Ultrasonic sensors working (L: {left:.1f}cm, R: {right:.1f}cm)")
-                    self.results["ultrasonic"] = True
-                else:
-                    print(f"  ⚠ Ultrasonic readings out of range (L: {left}, R: {right})")
-                    self.results["ultrasonic"] = False
-            else:
-                print("  ✗ Ultrasonic sensors returned None")
-                self.results["ultrasonic"] = False
-            
-            # Check DHT11 (temperature/humidity)
-            print("\n[7/9] Checking DHT11 sensor...")
-            dht = sensor_data.get("dht11", {})
-            temp = dht.get("temperature_c")
-            humidity = dht.get("humidity")
-            
-            if temp is not None and humidity is not None:
-                print(f"  ✓ DHT11 working (Temp: {temp:.1f}°C, Humidity: {humidity:.1f}%)")
-                self.results["dht11"] = True
-            else:
-                print("  ⚠ DHT11 failed to read")
-                self.results["dht11"] = False
-            
-            # Check MQ9 (gas sensor)
-            print("\n[8/9] Checking MQ9 gas sensor...")
-            mq9 = sensor_data.get("mq9", {})
-            co_ppm = mq9.get("co_ppm")
-            dangerous = mq9.get("dangerous", False)
-            
-            if co_ppm is not None:
-                status = "⚠ DANGEROUS!" if dangerous else "✓ Safe"
-                print(f"  ✓ MQ9 working (CO: {co_ppm:.1f} ppm) {status}")
-                self.results["mq9"] = True
-            else:
-                print("  ⚠ MQ9 failed to read")
-                self.results["mq9"] = False
-            
-            # Check GPS
-            print("\n[9/9] Checking GPS module...")
-            gps = sensor_data.get("gps", {})
-            lat = gps.get("latitude")
-            lon = gps.get("longitude")
-            has_fix = gps.get("fix", False)
-            
-            if has_fix and lat is not None and lon is not None:
-                print(f"  ✓ GPS working (Lat: {lat:.6f}, Lon: {lon:.6f})")
-                self.results["gps"] = True
-            else:
-                print("  ⚠ GPS no fix (may need clear sky)")
-                self.results["gps"] = False
-                
-        except Exception as e:
-            print(f"  ✗ Sensor check failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self.results["ultrasonic"] = False
-            self.results["dht11"] = False
-            self.results["mq9"] = False
-            self.results["gps"] = False
+        if left is None or right is None:
+            out.append("  ✗ Ultrasonic sensors returned None")
+            return False
+        if 2 <= left <= 400 and 2 <= right <= 400:
+            out.append(f"  ✓ Ultrasonic sensors working (L: {left:.1f}cm, R: {right:.1f}cm)")
+            return True
+        out.append(f"  ⚠ Ultrasonic readings out of range (L: {left}, R: {right})")
+        return False
+
+    def _check_dht11(self, out, sensors):
+        """Temperature/humidity."""
+        sensor_data = self._sensor_data(out, sensors, "dht11")
+        if sensor_data is None:
+            return False
+        dht = sensor_data.get("dht11", {})
+        temp = dht.get("temperature_c")
+        humidity = dht.get("humidity")
+        
+        if temp is not None and humidity is not None:
+            out.append(f"  ✓ DHT11 working (Temp: {temp:.1f}°C, Humidity: {humidity:.1f}%)")
+            return True
+        out.append("  ⚠ DHT11 failed to read")
+        return False
+
+    def _check_mq9(self, out, sensors):
+        """Gas sensor."""
+        sensor_data = self._sensor_data(out, sensors, "mq9")
+        if sensor_data is None:
+            return False
+        mq9 = sensor_data.get("mq9", {})
+        co_ppm = mq9.get("co_ppm")
+        dangerous = mq9.get("dangerous", False)
+        
+        if co_ppm is not None:
+            status = "⚠ DANGEROUS!" if dangerous else "✓ Safe"
+            out.append(f"  ✓ MQ9 working (CO: {co_ppm:.1f} ppm) {status}")
+            return True
+        if settings.MQ9_ADC_CHANNEL is None and sensor_data.get("health", {}).get("mq9", {}).get("valid"):
+            status = "⚠ DANGEROUS!" if dangerous else "✓ Safe"
+            out.append(f"  ✓ MQ9 working (comparator pin, no ppm) {status}")
+            return True
+        out.append("  ⚠ MQ9 failed to read")
+        return False
+
+    def _check_gps(self, out, sensors):
+        sensor_data = self._sensor_data(out, sensors, "gps")
+        if sensor_data is None:
+            return False
+        gps = sensor_data.get("gps", {})
+        lat = gps.get("latitude")
+        lon = gps.get("longitude")
+        
+        if gps.get("fix", False) and lat is not None and lon is not None:
+            out.append(f"  ✓ GPS working (Lat: {lat:.6f}, Lon: {lon:.6f})")
+            return True
+        out.append("  ⚠ GPS no fix (may need clear sky)")
+        return False
 
 
 class RobotSystem:
     """Main robot system coordinator."""
     
-    def __init__(self):
+    def __init__(self, cold_validation=False):
         self.sensors = None
         self.vision = None
         self.decision = None
         self.audio = None
+        self.telemetry = None
+        self.speaker = None
+        self.speech = None
+        self.alarms = None
         self.running = False
         self._shutdown_requested = False
+        self.boot_marks = []  # (phase, monotonic) at the end of each initialize() step
+        self.cold_validation = cold_validation  # ignore the validation cache
+        self.validation_mode = None             # "cold"/"warm" once validated
         
+    def _mark(self, phase):
+        self.boot_marks.append((phase, time.monotonic()))
+
+    def boot_timeline(self):
+        """
+        Duration of each initialize() phase, in order:
+        [{"phase": "gpio", "ms": 1.2, "at_ms": 1.2}, ...]
+        (at_ms is measured from the start of initialize()).
+        """
+        if not self.boot_marks:
+            return []
+        timeline = []
+        started = previous = self.boot_marks[0][1]
+        for phase, at in self.boot_marks[1:]:
+            timeline.append({
+                "phase": phase,
+                "ms": round((at - previous) * 1000, 2),
+                "at_ms": round((at - started) * 1000, 2),
+            })
+            previous = at
+        return timeline
+
     def initialize(self):
         """Initialize and validate all robot subsystems."""
+        self.boot_marks = [("start", time.monotonic())]
         print("=" * 60)
         print("🤖 ROBOT SYSTEM INITIALIZATION")
         print("=" * 60)
@@ -335,6 +541,7 @@ class RobotSystem:
         except Exception as e:
             print(f"✗ GPIO initialization failed: {e}")
             return False
+        self._mark("gpio")
         
         # Step 2: Initialize sensor interface
         print("\n📡 Initializing sensor interface...")
@@ -344,19 +551,52 @@ class RobotSystem:
         except Exception as e:
             print(f"✗ Sensor interface failed: {e}")
             return False
+        self._mark("sensors")
         
-        # Step 3: Hardware validation
+        # Step 3: Speech output (cached TTS, pre-rendered in the background)
+        print("\n🔊 Initializing speaker...")
+        try:
+            self.speaker = Speaker()
+            self.speech = SpeechOutput(self.speaker)
+            self.speech.start()
+            actions.bind_hardware(speaker=self.speaker, speech=self.speech)
+            if settings.TTS_PRERENDER:
+                self.speaker.prepare(speech_engine.response_texts())
+            print(f"✓ Speaker ready (TTS cache: {self.speaker.cache.stats()['entries']} phrases)")
+        except Exception as e:
+            print(f"⚠ Speaker unavailable: {e}")
+            self.speaker = None
+            self.speech = None
+        self._mark("speaker")
+
+        # Step 4: Alarms (sound pre-decoded, played through the speech output)
+        print("\n⏰ Starting alarm runner...")
+        try:
+            self.alarms = AlarmRunner(speech=self.speech)
+            self.alarms.start()
+            print(f"✓ Alarm runner ready ({len(self.alarms.store)} alarms)")
+        except Exception as e:
+            print(f"⚠ Alarms unavailable: {e}")
+            self.alarms = None
+        self._mark("alarms")
+
+        # Step 5: Hardware validation (heavy vision/audio modules are
+        # imported in the background meanwhile)
+        lazy_import.warm(getattr(VisionEngine, "HEAVY_IMPORTS", ()) + AUDIO_IMPORTS)
         validator = HardwareValidator()
-        if not validator.validate_all(self.sensors):
+        if not validator.validate_all(self.sensors, cold=self.cold_validation):
             return False
+        self.validation_mode = validator.mode
+        self._mark("validation")
         
-        # Step 4: Initialize vision system
+        # Step 6: Initialize vision system
         print("\n" + "=" * 60)
         print("📷 Initializing vision system...")
         print("=" * 60)
         try:
             self.vision = VisionEngine()
             self.vision.start()
+            self._mark("vision_start")
             
             if not self.vision.wait_ready(timeout=5):
                 print("⚠ Vision system not ready within timeout — continuing with degraded vision")
@@ -366,15 +606,17 @@ class RobotSystem:
         except Exception as e:
             print(f"✗ Vision initialization failed: {e}")
             return False
+        self._mark("vision_ready")
 
-        # Step 5: Initialize decision engine
+        # Step 7: Initialize decision engine
         print("\n" + "=" * 60)
         print("🧠 Initializing decision engine...")
         print("=" * 60)
         try:
             self.decision = DecisionEngine(
                 sensors=self.sensors,
-                vision=self.vision
+                vision=self.vision,
+                alarms=self.alarms
             )
             
             # Set initial state to IDLE
@@ -384,8 +626,20 @@ class RobotSystem:
         except Exception as e:
             print(f"✗ Decision engine failed: {e}")
             return False
+        self._mark("decision")
+
+        # Step 8: Start telemetry log (optional)
+        if getattr(settings, "TELEMETRY_ENABLED", False):
+            try:
+                self.telemetry = TelemetryWriter()
+                self.telemetry.start()
+                print(f"✓ Telemetry logging to {self.telemetry.directory}")
+            except Exception as e:
+                print(f"⚠ Telemetry disabled: {e}")
+                self.telemetry = None
+        self._mark("telemetry")
 
-        # Step 6: Initialize audio manager (last - depends on decision engine)
+        # Step 9: Initialize audio manager (last - depends on decision engine)
         print("\n" + "=" * 60)
         print("🎤 Initializing audio manager...")
         print("=" * 60)
@@ -399,6 +653,17 @@ class RobotSystem:
             print("  (Continuing without voice control)")
             self.audio = None
         
+        # The phase ends once the capture stream is actually open
+        if self.audio:
+            self.audio.audio.capture.wait_ready(timeout=2)
+        self._mark("audio")
+
+        # Devices validation left open that no subsystem took (e.g. --no-vision)
+        released = devices.release_unclaimed()
+        if released:
+            print(f"• Released unused devices: {', '.join(released)}")
+        self._mark("ready")
+        
         # Success
         print("\n" + "=" * 60)
         print("✅ ALL SYSTEMS READY")
@@ -407,6 +672,9 @@ class RobotSystem:
         # Display sensor status summary
         self._display_sensor_summary(validator.results)
         
+        if lazy_import.report_enabled():
+            lazy_import.print_report(title="Import times at ready")
+        
         return True
     
     def _initialize_gpio(self):
@@ -463,6 +731,10 @@ class RobotSystem:
             while self.running and not self._shutdown_requested:
                 # Main decision cycle
                 self.decision.update()
+
+                # Telemetry (non-blocking enqueue)
+                if self.telemetry:
+                    self.telemetry.record(self.decision.last_sensor_data, self.decision.state)
                 
                 # Control loop timing (20Hz)
                 time.sleep(0.05)
@@ -506,6 +778,16 @@ class RobotSystem:
             except Exception as e:
                 print(f"  ⚠ Vision shutdown error: {e}")
         
+        # Flush telemetry
+        if self.telemetry:
+            print("• Flushing telemetry...")
+            try:
+                self.telemetry.close()
+            except Exception as e:
+                print(f"  ⚠ Telemetry shutdown error: {e}")
+        
+        devices.release_unclaimed()
+        
         # Stop motors (safe state)
         print("• Stopping motors...")
         try:
@@ -513,6 +795,17 @@ class RobotSystem:
         except Exception as e:
             print(f"  ⚠ Motor stop error: {e}")
         
+        # Release the sound card
+        if self.alarms:
+            self.alarms.stop()
+        if self.speech:
+            self.speech.stop()
+        if self.speaker:
+            try:
+                self.speaker.close()
+            except Exception as e:
+                print(f"  ⚠ Speaker shutdown error: {e}")
+        
         # Clear LCD
         print("• Clearing LCD...")
         try:
@@ -552,7 +845,7 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 
-def main():
+def main(cold_validation=False):
     """Main entry point."""
     global _robot_instance
     
@@ -560,7 +853,7 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     
     # Create robot system
-    robot = RobotSystem()
+    robot = RobotSystem(cold_validation=cold_validation)
     _robot_instance = robot
     
     # Initialize with hardware validation
@@ -0,0 +1,140 @@
+"""
+latency.py - End-to-end voice latency per interaction.
+
+Every utterance that reaches recognition gets an Interaction with a short
+correlation ID. Each stage marks it with a monotonic timestamp:
+
+    vad_end    capture declared end of speech (the reference point, t = 0)
+    wake       wake word confirmed
+    stt        speech-to-text result
+    intent     intent resolved
+    state      robot state changed
+    actuated   first control-loop tick that acted on the new state
+    audio_out  first audio chunk of the reply written to the sound card
+
+Interactions are written to a JSONL file (one object per line) once they
+are RECORD_WINDOW seconds old, with every stage in milliseconds after
+vad_end. Utterances that carried no command are discarded.
+
+Report: python telemetry/latency_report.py
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+STAGES = ["vad_end", "wake", "stt", "intent", "state", "actuated", "audio_out"]
+
+# Stage each one follows (first one recorded wins). After the intent the
+# interaction forks: motion (state -> actuated) and the spoken reply.
+STAGE_PARENTS = {
+    "wake": ["vad_end"],
+    "stt": ["wake", "vad_end"],
+    "intent": ["stt"],
+    "state": ["intent"],
+    "actuated": ["state"],
+    "audio_out": ["intent"],
+}
+
+
+class Interaction:
+    """One voice interaction; pass it along with the data it belongs to."""
+
+    __slots__ = ("id", "started", "wall", "marks", "notes", "_tracker")
+
+    def __init__(self, tracker, started):
+        self.id = uuid.uuid4().hex[:8]
+        self.started = started       # monotonic time of vad_end
+        self.wall = time.time() - (time.monotonic() - started)
+        self.marks = {"vad_end": started}
+        self.notes = {}
+        self._tracker = tracker
+
+    def mark(self, stage, at=None):
+        """Record `stage` (first mark wins); `at` is a time.monotonic() value."""
+        if stage not in self.marks:
+            self.marks[stage] = time.monotonic() if at is None else at
+
+    def note(self, key, value):
+        """Attach context to the record (command text, intent, ...)."""
+        self.notes[key] = value
+
+    def discard(self):
+        self._tracker.discard(self)
+
+    def to_record(self):
+        return {
+            "id": self.id,
+            "at": round(self.wall, 3),
+            "stages": {
+                stage: round(1000.0 * (self.marks[stage] - self.started), 1)
+                for stage in STAGES if stage in self.marks
+            },
+            **self.notes
+        }
+
+
+class LatencyTracker:
+    """Collects Interactions and appends finished ones to a JSONL log."""
+
+    RECORD_WINDOW = 10.0  # seconds after vad_end before a record is written
+
+    def __init__(self, path=None):
+        path = path or settings.LATENCY_LOG_PATH
+        if not os.path.isabs(path):
+            path = os.path.join(project_root, path)
+        self.path = path
+        self._open = []
+        self._lock = threading.Lock()
+        self.written = 0
+
+    def begin(self, at=None):
+        """New interaction whose vad_end is `at` (monotonic, default now)."""
+        interaction = Interaction(self, time.monotonic() if at is None else at)
+        with self._lock:
+            self._open.append(interaction)
+        self.flush()
+        return interaction
+
+    def discard(self, interaction):
+        with self._lock:
+            if interaction in self._open:
+                self._open.remove(interaction)
+
+    def flush(self, force=False):
+        """Write interactions older than RECORD_WINDOW (all of them if force)."""
+        cutoff = time.monotonic() - self.RECORD_WINDOW
+        with self._lock:
+            ready = [i for i in self._open if force or i.started < cutoff]
+            if not ready:
+                return
+            self._open = [i for i in self._open if i not in ready]
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                for interaction in ready:
+                    f.write(json.dumps(interaction.to_record()) + "\n")
+            self.written += len(ready)
+
+    def close(self):
+        self.flush(force=True)
+
+
+def load_records(path):
+    """Parsed records from a latency JSONL file (bad lines skipped)."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
@@ -0,0 +1,133 @@
+"""
+latency_report.py - Percentiles of voice latency per stage.
+
+Usage:
+    python telemetry/latency_report.py                      # settings.LATENCY_LOG_PATH
+    python telemetry/latency_report.py logs/latency/voice.jsonl --last 200
+    python telemetry/latency_report.py new.jsonl --baseline old.jsonl
+
+Two tables:
+- cumulative : ms from end of speech (vad_end) to each stage
+- per stage  : ms spent since the stage it follows (STAGE_PARENTS)
+
+With --baseline, each per-stage p50/p90 is compared to the baseline log
+and stages slower by more than --tolerance percent (and at least
+--min-ms) are flagged; the exit code is 1 if any stage regressed.
+"""
+
+import argparse
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+from telemetry.latency import STAGE_PARENTS, STAGES, load_records
+from telemetry.stats import percentile
+
+
+def collect(records):
+    """Returns ({stage: [cumulative ms]}, {stage: [per-stage ms]})."""
+    cumulative = {stage: [] for stage in STAGES}
+    steps = {stage: [] for stage in STAGES[1:]}
+    for record in records:
+        stages = record.get("stages", {})
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            cumulative[stage].append(stages[stage])
+            parent = next((p for p in STAGE_PARENTS.get(stage, []) if p in stages), None)
+            if parent is not None:
+                steps[stage].append(stages[stage] - stages[parent])
+    return cumulative, steps
+
+
+def summarize(samples):
+    if not samples:
+        return None
+    return {
+        "n": len(samples),
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "max": max(samples)
+    }
+
+
+def _table(title, columns):
+    print(f"\n{title}")
+    print(f"  {'stage':<10} {'n':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for stage, summary in columns.items():
+        if summary is None:
+            print(f"  {stage:<10} {0:>5} {'-':>8} {'-':>8} {'-':>8} {'-':>8}")
+            continue
+        print(f"  {stage:<10} {summary['n']:>5} {summary['p50']:>8.1f} {summary['p90']:>8.1f} "
+              f"{summary['p99']:>8.1f} {summary['max']:>8.1f}")
+
+
+def regressions(current, baseline, tolerance, min_ms):
+    """[("stage pXX", baseline_ms, current_ms)] for per-stage p50/p90 slowdowns."""
+    found = []
+    for stage, summary in current.items():
+        base = baseline.get(stage)
+        if summary is None or base is None:
+            continue
+        for pct in ("p50", "p90"):
+            delta = summary[pct] - base[pct]
+            if delta > min_ms and delta > abs(base[pct]) * tolerance / 100.0:
+                found.append((f"{stage} {pct}", base[pct], summary[pct]))
+    return found
+
+
+def _load(path, last):
+    records = load_records(path)
+    return records[-last:] if last else records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Voice latency report")
+    parser.add_argument("path", nargs="?", help="Latency JSONL (default: settings)")
+    parser.add_argument("--last", type=int, help="Only the last N interactions")
+    parser.add_argument("--baseline", help="Latency JSONL to compare against")
+    parser.add_argument("--tolerance", type=float, default=20.0,
+                        help="Percent slowdown flagged as a regression")
+    parser.add_argument("--min-ms", type=float, default=5.0,
+                        help="Ignore slowdowns smaller than this")
+    args = parser.parse_args(argv)
+
+    path = args.path or os.path.join(project_root, settings.LATENCY_LOG_PATH)
+    if not os.path.exists(path):
+        print(f"[Latency] No log at {path}")
+        return 1
+    records = _load(path, args.last)
+    if not records:
+        print(f"[Latency] {path} has no interactions")
+        return 1
+
+    cumulative, steps = collect(records)
+    print("=" * 60)
+    print(f"Interactions   : {len(records)}  ({path})")
+    _table("Cumulative (ms after end of speech)",
+           {stage: summarize(v) for stage, v in cumulative.items() if stage != "vad_end"})
+    current = {stage: summarize(v) for stage, v in steps.items()}
+    _table("Per stage (ms since the stage it follows)", current)
+
+    status = 0
+    if args.baseline:
+        _, base_steps = collect(_load(args.baseline, args.last))
+        baseline = {stage: summarize(v) for stage, v in base_steps.items()}
+        found = regressions(current, baseline, args.tolerance, args.min_ms)
+        print(f"\nRegressions vs {args.baseline} (>{args.tolerance:.0f}% and >{args.min_ms:.0f} ms):")
+        if not found:
+            print("  none")
+        for name, before, after in found:
+            print(f"  ✗ {name:<14} {before:8.1f} -> {after:8.1f} ms")
+        status = 1 if found else 0
+    print("=" * 60)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+stats.py - Percentiles shared by the latency report, the alarm runner and
+the benchmarks.
+
+Nearest-rank definition: the p-th percentile of n ordered values is the
+value at rank ceil(p / 100 * n) (1-based), so it is always one of the
+samples. p50 of 10 values is the 5th, p90 the 9th, p99 of 100 the 99th.
+"""
+
+import math
+
+
+def rank_index(n, pct):
+    """0-based index of the nearest-rank `pct` percentile among n values."""
+    return max(0, min(n - 1, math.ceil(pct / 100.0 * n) - 1))
+
+
+def percentile_sorted(ordered, pct):
+    """Percentile of an already sorted sequence; None if it is empty."""
+    if not ordered:
+        return None
+    return ordered[rank_index(len(ordered), pct)]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values` (any order); None if empty."""
+    return percentile_sorted(sorted(values), pct)
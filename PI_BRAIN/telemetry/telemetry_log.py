@@ -0,0 +1,333 @@
+"""
+telemetry_log.py - Append-only binary telemetry log.
+
+Every control tick is stored as ONE fixed-width, struct-packed record
+(sensor snapshot + decision state) in segmented files under TELEMETRY_DIR.
+
+Responsibilities:
+- TelemetryWriter: non-blocking record() for the control loop, disk I/O on a
+  background thread, size/time based segment rotation
+- TelemetryReader: mmap segments and expose them as NumPy structured arrays
+
+Segment layout:
+    header  : magic (4s) | version (H) | record size (H) | created (d)
+    records : RECORD_FORMAT repeated, a truncated tail record is ignored
+"""
+
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import settings
+
+MAGIC = b"PNDT"
+VERSION = 1
+
+HEADER_FORMAT = "<4sHHd"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# timestamp | state | flags | pad | left | right | temp | humidity | co_ppm |
+# latitude | longitude | altitude | speed
+RECORD_FORMAT = "<dbB2xfffffddff"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+# Bits of the "flags" field
+FLAG_DANGEROUS = 0x01
+FLAG_GPS_FIX = 0x02
+FLAG_FLIPPED = 0x04
+FLAG_ORIENTATION_AVAILABLE = 0x08
+
+# Field layout for NumPy (must mirror RECORD_FORMAT byte for byte)
+RECORD_FIELDS = [
+    ("timestamp", "<f8"),
+    ("state", "i1"),
+    ("flags", "u1"),
+    ("_pad", "V2"),
+    ("ultrasonic_left", "<f4"),
+    ("ultrasonic_right", "<f4"),
+    ("temperature_c", "<f4"),
+    ("humidity", "<f4"),
+    ("co_ppm", "<f4"),
+    ("latitude", "<f8"),
+    ("longitude", "<f8"),
+    ("altitude", "<f4"),
+    ("speed", "<f4"),
+]
+
+SEGMENT_PREFIX = "telemetry-"
+SEGMENT_SUFFIX = ".bin"
+
+_NAN = float("nan")
+
+
+def _resolve_dir(directory):
+    directory = directory or settings.TELEMETRY_DIR
+    if not os.path.isabs(directory):
+        directory = os.path.join(project_root, directory)
+    return directory
+
+
+def _num(value):
+    """None-safe float conversion (None is stored as NaN)."""
+    return _NAN if value is None else float(value)
+
+
+def pack_record(timestamp, sensor_data, state):
+    """
+    Pack one control tick into a fixed-width record.
+
+    Args:
+        timestamp: Wall-clock time of the tick (seconds)
+        sensor_data: Snapshot from RobotSensors.read() (may be empty)
+        state: RobotState (or None)
+
+    Returns:
+        bytes: RECORD_SIZE bytes
+    """
+    sensor_data = sensor_data or {}
+    ultrasonic = sensor_data.get("ultrasonic") or {}
+    dht = sensor_data.get("dht11") or {}
+    mq9 = sensor_data.get("mq9") or {}
+    gps = sensor_data.get("gps") or {}
+    orientation = sensor_data.get("orientation") or {}
+
+    flags = 0
+    if mq9.get("dangerous"):
+        flags |= FLAG_DANGEROUS
+    if gps.get("fix"):
+        flags |= FLAG_GPS_FIX
+    if orientation.get("flipped"):
+        flags |= FLAG_FLIPPED
+    if orientation.get("available"):
+        flags |= FLAG_ORIENTATION_AVAILABLE
+
+    state_value = getattr(state, "value", -1) if state is not None else -1
+
+    return struct.pack(
+        RECORD_FORMAT,
+        timestamp,
+        state_value,
+        flags,
+        _num(ultrasonic.get("left")),
+        _num(ultrasonic.get("right")),
+        _num(dht.get("temperature_c")),
+        _num(dht.get("humidity")),
+        _num(mq9.get("co_ppm")),
+        _num(gps.get("latitude")),
+        _num(gps.get("longitude")),
+        _num(gps.get("altitude")),
+        _num(gps.get("speed")),
+    )
+
+
+class TelemetryWriter(threading.Thread):
+    """
+    Background segment writer.
+
+    The control loop only calls record(), which never touches the disk.
+    When the queue is full the tick is dropped and counted in `dropped`.
+    """
+
+    def __init__(self, directory=None, max_segment_bytes=None,
+                 max_segment_age=None, queue_size=None):
+        super().__init__(daemon=True)
+        self.directory = _resolve_dir(directory)
+        self.max_segment_bytes = max_segment_bytes or settings.TELEMETRY_SEGMENT_MAX_BYTES
+        self.max_segment_age = max_segment_age or settings.TELEMETRY_SEGMENT_MAX_AGE
+        self.flush_interval = settings.TELEMETRY_FLUSH_INTERVAL
+
+        self._queue = queue.Queue(maxsize=queue_size or settings.TELEMETRY_QUEUE_SIZE)
+        self._stopped = threading.Event()
+        self._file = None
+        self._segment_path = None
+        self._segment_bytes = 0
+        self._segment_opened = 0
+        self._sequence = 0
+
+        self.written = 0
+        self.dropped = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    # =========================
+    # CONTROL LOOP SIDE
+    # =========================
+    def record(self, sensor_data, state):
+        """Queue one tick for writing. Never blocks."""
+        try:
+            self._queue.put_nowait((time.time(), sensor_data, state))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=2):
+        """Flush pending records and close the current segment."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=timeout)
+
+    # =========================
+    # WRITER THREAD
+    # =========================
+    def run(self):
+        last_flush = time.monotonic()
+        try:
+            while not self._stopped.is_set() or not self._queue.empty():
+                batch = self._drain()
+                if batch:
+                    self._write(batch)
+
+                now = time.monotonic()
+                if self._file and now - last_flush >= self.flush_interval:
+                    self._file.flush()
+                    last_flush = now
+        except Exception as e:
+            print(f"[Telemetry] Writer stopped: {e}")
+        finally:
+            self._close_segment()
+
+    def _drain(self):
+        """Block briefly for one item, then take everything already queued."""
+        try:
+            items = [self._queue.get(timeout=0.2)]
+        except queue.Empty:
+            return []
+
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _write(self, batch):
+        for timestamp, sensor_data, state in batch:
+            self._rotate_if_needed()
+            self._file.write(pack_record(timestamp, sensor_data, state))
+            self._segment_bytes += RECORD_SIZE
+            self.written += 1
+
+    def _rotate_if_needed(self):
+        if self._file is not None:
+            too_big = self._segment_bytes >= self.max_segment_bytes
+            too_old = time.time() - self._segment_opened >= self.max_segment_age
+            if not (too_big or too_old):
+                return
+            self._close_segment()
+        self._open_segment()
+
+    def _open_segment(self):
+        now = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        self._sequence += 1
+        name = f"{SEGMENT_PREFIX}{stamp}-{self._sequence:04d}{SEGMENT_SUFFIX}"
+
+        self._segment_path = os.path.join(self.directory, name)
+        self._file = open(self._segment_path, "ab")
+        self._file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, RECORD_SIZE, now))
+        self._segment_bytes = HEADER_SIZE
+        self._segment_opened = now
+
+    def _close_segment(self):
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError:
+            pass
+        self._file.close()
+        self._file = None
+
+
+class TelemetryReader:
+    """
+    Read telemetry segments as NumPy structured arrays.
+
+    Arrays returned by read_segment() are views over a read-only mmap, so
+    loading days of data does not copy it into memory up front.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = _resolve_dir(directory)
+
+    @staticmethod
+    def dtype():
+        import numpy as np
+        return np.dtype(RECORD_FIELDS)
+
+    def segments(self):
+        """Return segment paths, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        names = sorted(
+            n for n in os.listdir(self.directory)
+            if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)
+        )
+        return [os.path.join(self.directory, n) for n in names]
+
+    def read_segment(self, path):
+        """
+        Map one segment into memory.
+
+        Returns:
+            numpy.ndarray: Structured array with RECORD_FIELDS
+        """
+        import numpy as np
+
+        dtype = self.dtype()
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER_SIZE:
+                return np.empty(0, dtype=dtype)
+
+            magic, version, record_size, _ = struct.unpack(HEADER_FORMAT, f.read(HEADER_SIZE))
+            if magic != MAGIC or record_size != dtype.itemsize:
+                raise ValueError(f"{path}: not a v{VERSION} telemetry segment")
+
+            count = (size - HEADER_SIZE) // record_size
+            if count == 0:
+                return np.empty(0, dtype=dtype)
+
+            # The array keeps the mmap alive; the file handle can be closed
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return np.frombuffer(mm, dtype=dtype, count=count, offset=HEADER_SIZE)
+
+    def read(self, start=None, end=None):
+        """
+        Read every segment, optionally limited to a [start, end) time window.
+
+        Returns:
+            numpy.ndarray: Concatenated structured array (a copy)
+        """
+        import numpy as np
+
+        parts = []
+        for path in self.segments():
+            records = self.read_segment(path)
+            if start is not None:
+                records = records[records["timestamp"] >= start]
+            if end is not None:
+                records = records[records["timestamp"] < end]
+            if len(records):
+                parts.append(records)
+
+        if not parts:
+            return np.empty(0, dtype=self.dtype())
+        return np.concatenate(parts)
+
+
+if __name__ == "__main__":
+    reader = TelemetryReader(sys.argv[1] if len(sys.argv) > 1 else None)
+    data = reader.read()
+    print(f"[Telemetry] {len(reader.segments())} segments, {len(data)} records")
+    if len(data):
+        span = data["timestamp"][-1] - data["timestamp"][0]
+        print(f"[Telemetry] Span: {span:.1f}s ({len(data) / max(span, 1e-9):.1f} Hz)")
@@ -1,22 +1,37 @@
 import threading
 import os
-import cv2
-
-# Try to import MediaPipe Tasks API; if unavailable, fall back to OpenCV Haar cascades
-try:
-    import mediapipe as mp
-    from mediapipe.tasks import python
-    from mediapipe.tasks.python import vision
-    _HAS_MEDIAPIPE = True
-except Exception:
-    mp = None
-    python = None
-    vision = None
-    _HAS_MEDIAPIPE = False
 
 from camera.camera_manager import CameraManager, project_root
+from core.device_registry import devices
+from core.lazy_import import lazy_module
+
+# cv2 and MediaPipe take seconds to import on a Pi; both load when the
+# engine is created (or earlier, warmed by startup during validation)
+cv2 = lazy_module("cv2")
+mp = None
+python = None
+vision = None
+
+
+def _load_mediapipe():
+    """Import the MediaPipe Tasks API; False if unavailable (Haar fallback is used)."""
+    global mp, python, vision
+    if mp is not None:
+        return True
+    try:
+        import mediapipe
+        from mediapipe.tasks import python as tasks_python
+        from mediapipe.tasks.python import vision as tasks_vision
+    except Exception:
+        return False
+    mp, python, vision = mediapipe, tasks_python, tasks_vision
+    return True
+
 
 class VisionEngine(threading.Thread):
+    # Modules startup may import in the background before the engine is built
+    HEAVY_IMPORTS = ("cv2", "mediapipe.tasks.python.vision")
+
     def __init__(self):
         super().__init__(daemon=True)
         self._lock = threading.Lock()
@@ -31,7 +46,7 @@ class VisionEngine(threading.Thread):
         self._use_mediapipe = False
         self.face_cascade = None
 
-        if _HAS_MEDIAPIPE and python and vision:
+        if _load_mediapipe():
             try:
                 model_path = os.path.join(project_root, 'vision', 'cascades', 'pose_landmarker_full.task')
                 base_options = python.BaseOptions(model_asset_path=model_path)
@@ -52,7 +67,8 @@ class VisionEngine(threading.Thread):
 
     def run(self):
         try:
-            self.cam = CameraManager()
+            # Camera opened (and exposed) during validation, if it was
+            self.cam = devices.take("camera") or CameraManager()
             # Indicate that the vision thread has successfully started and camera is available
             self._ready_event.set()
             print("[Vision] Started")